@@ -27,6 +27,15 @@ class PlayerGameState(db.Model):
     
     __bind_key__ = 'db_players'
     __tablename__ = 'gs_player_game_state_table_orm'
+    __table_args__ = (
+        # Partial index for the lang_graph_server alive-player poll
+        # (session_id IS NOT NULL AND 'alive' = ANY(player_statuses))
+        db.Index(
+            'ix_pgs_alive',
+            'session_id',
+            postgresql_where=db.text("session_id IS NOT NULL AND 'alive' = ANY(player_statuses)"),
+        ),
+    )
     
     # =============================================
     # Identity
@@ -0,0 +1,17 @@
+-- =============================================
+-- Player Game State Alive Index Migration
+-- =============================================
+-- Adds the partial index behind the lang_graph_server alive-player poll:
+--   WHERE session_id IS NOT NULL AND 'alive' = ANY(player_statuses)
+-- Matches PlayerGameState.__table_args__ (ix_pgs_alive)
+-- CONCURRENTLY avoids locking writes; run outside a transaction block
+-- =============================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pgs_alive
+ON gs_player_game_state_table_orm (session_id)
+WHERE session_id IS NOT NULL AND 'alive' = ANY(player_statuses);
+
+-- =============================================
+-- Rollback (if needed)
+-- =============================================
+-- DROP INDEX CONCURRENTLY IF EXISTS ix_pgs_alive;
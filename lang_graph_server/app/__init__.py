@@ -5,6 +5,8 @@ import os
 # ---------------------- Custom ----------------------#
 from app.utils.loader import LoadPrompts
 from app.constants import PromptFileExtension, AllowedUploadFileTypes
+from app.chains.llm_clients import create_openai_llm
+from app.utils.json_output import register_json_representation
 
 # ---------------------- Custom ----------------------#
 from app.extensions import api, lang_graph_app
@@ -19,7 +21,6 @@ from app.apis.coup_event_ns import coup_event_ns
 # ---------------------- External Modeules ----------------------#
 from flask import Flask
 from flask_cors import CORS
-from langchain_openai import ChatOpenAI
 
 
 def create_app(test_config=None):
@@ -38,7 +39,8 @@ def create_app(test_config=None):
     api_key = os.environ.get("OPENAI_API_KEY")
     endpoint = os.environ.get("DEFAULT", None)
     model_name = os.environ.get("OPENAI_API_MODEL")
-    LoadedLLMs.gpt_llm = ChatOpenAI(base_url=endpoint, api_key=api_key, model_name=model_name, temperature=0.1)
+    # Shares its HTTP connection pool with the reasoning chains (app/chains/llm_clients.py)
+    LoadedLLMs.gpt_llm = create_openai_llm(base_url=endpoint, api_key=api_key, model_name=model_name, temperature=0.1)
 
 
 
@@ -56,6 +58,8 @@ def create_app(test_config=None):
                  version='1.0', 
                  title='Lang Graph API', 
                  description='APIs to use to interact with llm agents') 
+    # orjson-encoded responses when orjson is installed (app/utils/json_output.py)
+    register_json_representation(api)
     
     
     # ---------------------- Building Namespaces ---------------------- #
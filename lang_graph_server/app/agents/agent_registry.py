@@ -12,6 +12,7 @@ Responsibilities:
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING, Dict, List, Optional
 
 from app.constants import GamePhase, InfluenceCard, SocialMediaPlatform
@@ -178,8 +179,9 @@ class AgentRegistry:
             Number of agents reset
         """
         agents = self.get_all_agents_in_game(game_id)
+        hour_start = datetime.now()  # One timestamp for the whole game
         for agent in agents:
-            agent.reset_for_new_hour()
+            agent.reset_for_new_hour(hour_start)
         return len(agents)
     
     def lock_all_actions(self, game_id: str) -> int:
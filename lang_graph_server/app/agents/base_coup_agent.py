@@ -19,9 +19,11 @@ from app.constants import (
     GamePhase,
     InfluenceCard,
     MessageTargetType,
+    REACTION_TYPE_BY_VALUE,
     SocialMediaPlatform,
     UpgradeType,
 )
+from app.graphs.workflows.run_config import thread_id_for
 from app.models.graph_state_models.coup_agent_state import AgentProfile
 from app.models.graph_state_models.hourly_coup_state import (
     HourlyCoupAgentState,
@@ -408,9 +410,9 @@ class BaseCoupAgent:
     # Hour/Turn Management
     # =============================================
     
-    def reset_for_new_hour(self) -> None:
-        """Reset state for a new hourly turn."""
-        self.state = reset_hourly_counters(self.state)
+    def reset_for_new_hour(self, hour_start: Optional[datetime] = None) -> None:
+        """Reset state for a new hourly turn (hour_start defaults to now)."""
+        self.state = reset_hourly_counters(self.state, hour_start)
     
     def update_minutes_remaining(self, minutes: int) -> None:
         """Update time remaining in current hour."""
@@ -472,7 +474,7 @@ class BaseCoupAgent:
         Returns:
             Thread ID string for this agent
         """
-        return f"{self.game_id}:{self.agent_id}"
+        return thread_id_for(self.game_id, self.agent_id)
     
     def get_conversation_history(self) -> List[Dict]:
         """
@@ -582,13 +584,10 @@ class BaseCoupAgent:
         Returns:
             Response from game server
         """
-        from app.constants import ReactionType
-        
         client = self.get_game_server_client()
         
-        try:
-            rt = ReactionType(reaction_type)
-        except ValueError:
+        rt = REACTION_TYPE_BY_VALUE.get(reaction_type)
+        if rt is None:
             return {"error": f"Invalid reaction type: {reaction_type}"}
         
         return client.set_reaction(
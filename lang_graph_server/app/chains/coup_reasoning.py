@@ -11,6 +11,7 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableSequence
 from langchain_openai import ChatOpenAI
 
+from app.chains.llm_clients import get_openai_llm
 from app.extensions import LoadedPromptTemplates
 from app.models.structured_output_models.coup_decision_so import (
     ActionDecisionSO,
@@ -19,6 +20,11 @@ from app.models.structured_output_models.coup_decision_so import (
     RevealDecisionSO,
 )
 
+# Native JSON-schema response format instead of a tool call: no tool schema
+# in the prompt and no tool-call parsing. Not strict, since the SO models
+# have optional fields and numeric bounds that strict mode rejects.
+STRUCTURED_OUTPUT_METHOD = "json_schema"
+
 
 class CoupReasoningChains:
     """
@@ -29,8 +35,8 @@ class CoupReasoningChains:
 
     @staticmethod
     def _get_llm(temperature: float = 0.3) -> ChatOpenAI:
-        """Get LLM instance. Using slightly higher temperature for creative bluffing."""
-        return ChatOpenAI(model="gpt-4o", temperature=temperature, verbose=True)
+        """Get the shared LLM instance. Using slightly higher temperature for creative bluffing."""
+        return get_openai_llm(model="gpt-4o", temperature=temperature)
 
     @staticmethod
     def action_selection_chain() -> RunnableSequence:
@@ -55,7 +61,7 @@ class CoupReasoningChains:
             ("system", prompt_template)
         ])
         llm = CoupReasoningChains._get_llm(temperature=0.4)
-        structured_llm = llm.with_structured_output(ActionDecisionSO)
+        structured_llm = llm.with_structured_output(ActionDecisionSO, method=STRUCTURED_OUTPUT_METHOD)
         return prompt | structured_llm
 
     @staticmethod
@@ -80,7 +86,7 @@ class CoupReasoningChains:
             ("system", prompt_template)
         ])
         llm = CoupReasoningChains._get_llm(temperature=0.3)
-        structured_llm = llm.with_structured_output(ReactionDecisionSO)
+        structured_llm = llm.with_structured_output(ReactionDecisionSO, method=STRUCTURED_OUTPUT_METHOD)
         return prompt | structured_llm
 
     @staticmethod
@@ -105,7 +111,7 @@ class CoupReasoningChains:
             ("system", prompt_template)
         ])
         llm = CoupReasoningChains._get_llm(temperature=0.5)  # Higher temp for creative bluffs
-        structured_llm = llm.with_structured_output(ActionDecisionSO)
+        structured_llm = llm.with_structured_output(ActionDecisionSO, method=STRUCTURED_OUTPUT_METHOD)
         return prompt | structured_llm
 
     @staticmethod
@@ -127,7 +133,7 @@ class CoupReasoningChains:
             ("system", prompt_template)
         ])
         llm = CoupReasoningChains._get_llm(temperature=0.1)  # Low temp - straightforward decision
-        structured_llm = llm.with_structured_output(RevealDecisionSO)
+        structured_llm = llm.with_structured_output(RevealDecisionSO, method=STRUCTURED_OUTPUT_METHOD)
         return prompt | structured_llm
 
     @staticmethod
@@ -149,7 +155,7 @@ class CoupReasoningChains:
             ("system", prompt_template)
         ])
         llm = CoupReasoningChains._get_llm(temperature=0.2)
-        structured_llm = llm.with_structured_output(ExchangeDecisionSO)
+        structured_llm = llm.with_structured_output(ExchangeDecisionSO, method=STRUCTURED_OUTPUT_METHOD)
         return prompt | structured_llm
 
     # =============================================
@@ -0,0 +1,45 @@
+"""
+Shared LLM clients.
+
+Each ChatOpenAI otherwise builds its own httpx client and its own
+connection pool. Every LLM in the app is built through here so they share
+one sync and one async pool and reuse warm TCP/TLS connections across
+chains and concurrent agents.
+"""
+
+import functools
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+
+# Connection pool sizing shared by every OpenAI-compatible client
+LLM_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+LLM_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+@functools.lru_cache(maxsize=None)
+def get_http_client() -> httpx.Client:
+    """Process-wide sync HTTP client for LLM calls."""
+    return httpx.Client(limits=LLM_HTTP_LIMITS, timeout=LLM_HTTP_TIMEOUT)
+
+
+@functools.lru_cache(maxsize=None)
+def get_http_async_client() -> httpx.AsyncClient:
+    """Process-wide async HTTP client for LLM calls."""
+    return httpx.AsyncClient(limits=LLM_HTTP_LIMITS, timeout=LLM_HTTP_TIMEOUT)
+
+
+def create_openai_llm(**kwargs) -> ChatOpenAI:
+    """Build a ChatOpenAI that uses the shared connection pools."""
+    return ChatOpenAI(
+        http_client=get_http_client(),
+        http_async_client=get_http_async_client(),
+        **kwargs,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_openai_llm(model: str = "gpt-4o", temperature: float = 0.3) -> ChatOpenAI:
+    """Shared ChatOpenAI per (model, temperature), reused across chain builds."""
+    return create_openai_llm(model=model, temperature=temperature, verbose=True)
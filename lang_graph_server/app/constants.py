@@ -1,5 +1,4 @@
 from enum import Enum, IntEnum
-from pydantic import BaseModel, Field
 
 #-------#
 # ENUMS #
@@ -37,6 +36,9 @@ class SocialMediaPlatform(str,Enum):
     EMAIL = 'email'
     DEFUALT = 'defualt'
 
+# Precomputed string -> member lookups; a dict get skips EnumMeta lookup on hot paths
+SOCIAL_MEDIA_PLATFORM_BY_VALUE = {member.value: member for member in SocialMediaPlatform}
+
 class PromptFileExtension(str, Enum):
     MARKDOWN = ".md"
 
@@ -82,6 +84,10 @@ class ResolutionType(str, Enum):
     EXCHANGE_CARDS = "exchange_cards"  # Ambassador - pick cards to keep
 
 
+REACTION_TYPE_BY_VALUE = {member.value: member for member in ReactionType}
+RESOLUTION_TYPE_BY_VALUE = {member.value: member for member in ResolutionType}
+
+
 class CoupAction(str, Enum):
     """All actions an agent can take or respond with in Coup."""
 
@@ -133,6 +139,10 @@ class EventType(str, Enum):
     CARD_SELECTION_REQUIRED = "card_selection_required"  # Ambassador exchange or reveal selection needed
 
 
+# Raw event_type string -> EventType (unknown strings miss)
+EVENT_TYPE_BY_VALUE = {member.value: member for member in EventType}
+
+
 class MessageTargetType(str, Enum):
     """Who the message is being sent to (for limit tracking)."""
     LLM_ONLY = "llm_only"        # Message to LLM agents only (limit: 30)
@@ -188,6 +198,23 @@ class ConditionalRuleType(str, Enum):
     ALWAYS_CHALLENGE_UPGRADED_ACTIONS = "always_challenge_upgraded_actions"
 
 
+#----------------------------------------#
+# LANGGRAPH CHECKPOINTING                 #
+#----------------------------------------#
+
+class CheckpointMode(str, Enum):
+    """When a checkpointed workflow persists its state."""
+    PER_STEP = "per_step"                # Write after every super-step (LangGraph default)
+    END_OF_WORKFLOW = "end_of_workflow"  # Buffer writes in memory, persist once when the run exits
+
+
+# LangGraph `durability` argument used for each checkpoint mode
+CHECKPOINT_DURABILITY = {
+    CheckpointMode.PER_STEP: "async",
+    CheckpointMode.END_OF_WORKFLOW: "exit",
+}
+
+
 #----------------------------------------#
 # CARD / ACTION MAPPINGS                  #
 #----------------------------------------#
@@ -282,13 +309,3 @@ PERSONALITIES = {
     "charming": "Charismatic and persuasive. Uses wit and charm to manipulate others.",
     "stoic": "Calm and unreadable. Gives little away and speaks only when necessary.",
 }
-
-
-#----------------------------------------#
-# BUILDING BLOCK STUCTURED OUTPUT MODELS #
-#----------------------------------------#
-class UnitBall_SO(BaseModel):
-    unit_ball_score : float = Field(
-        description="A score that goes from -1 to 1",
-        ge=-1.0, le=1.0
-    )
\ No newline at end of file
@@ -7,9 +7,9 @@ for querying player data, pending actions, and agent profiles.
 Global db_connection instance is declared in app/extensions.py
 """
 
+from app.database.base import Base
 from app.database.connection import DatabaseConnection
 from app.database.models import (
-    Base,
     Player,
     UpgradeDetails,
     # Enums
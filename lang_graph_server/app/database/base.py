@@ -0,0 +1,13 @@
+"""
+Declarative Base.
+
+Single SQLAlchemy declarative base shared by every ORM model in the
+lang_graph_server, so all tables register against one MetaData.
+"""
+
+from sqlalchemy.orm import DeclarativeBase
+
+
+class Base(DeclarativeBase):
+    """Base class for all ORM models (SQLAlchemy 2.0 typed declarative)."""
+    pass
@@ -30,6 +30,13 @@ class DatabaseConfig:
     DEFAULT_USER = "postgres"          # Changed from "player_manager"
     DEFAULT_PASSWORD = "mysecretpassword"  # Changed from "pm_manager1"
     
+    # Pool sizing: half of Postgres' default max_connections (100),
+    # shared between the steady pool and the overflow burst
+    DEFAULT_POOL_SIZE = 25
+    DEFAULT_MAX_OVERFLOW = 25
+    DEFAULT_POOL_TIMEOUT = 30
+    DEFAULT_POOL_RECYCLE = 1800  # Recycle connections after 30 minutes
+    
     @classmethod
     def get_connection_string(cls) -> str:
         """Build PostgreSQL connection string from environment or defaults."""
@@ -40,6 +47,16 @@ class DatabaseConfig:
         password = os.environ.get("POSTGRES_PASSWORD", cls.DEFAULT_PASSWORD)
         
         return f"postgresql+psycopg://{user}:{password}@{host}:{port}/{database}"
+    
+    @classmethod
+    def get_pool_options(cls) -> dict:
+        """Build engine pool keyword arguments from environment or defaults."""
+        return {
+            "pool_size": int(os.environ.get("POSTGRES_POOL_SIZE", cls.DEFAULT_POOL_SIZE)),
+            "max_overflow": int(os.environ.get("POSTGRES_MAX_OVERFLOW", cls.DEFAULT_MAX_OVERFLOW)),
+            "pool_timeout": int(os.environ.get("POSTGRES_POOL_TIMEOUT", cls.DEFAULT_POOL_TIMEOUT)),
+            "pool_recycle": int(os.environ.get("POSTGRES_POOL_RECYCLE", cls.DEFAULT_POOL_RECYCLE)),
+        }
 
 
 class DatabaseConnection:
@@ -77,17 +94,19 @@ class DatabaseConnection:
         self._engine = create_engine(
             conn_str,
             poolclass=QueuePool,
-            pool_size=5,
-            max_overflow=10,
-            pool_timeout=30,
-            pool_recycle=1800,  # Recycle connections after 30 minutes
+            pool_pre_ping=True,  # Drop stale connections on checkout
+            pool_use_lifo=True,  # Reuse the most recently returned (warm) connection
             echo=False,  # Set to True for SQL debugging
+            **DatabaseConfig.get_pool_options(),
         )
         
         self._session_factory = sessionmaker(
             bind=self._engine,
             autocommit=False,
             autoflush=False,
+            # Read results are used after the session closes; keep them loaded
+            # instead of expiring (and later refreshing) every attribute.
+            expire_on_commit=False,
         )
         
         self._initialized = True
@@ -11,16 +11,16 @@ Tables (Three-Tier Architecture):
 - to_be_initiated_upgrade_details: Upgrade details for actions
 """
 
+from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 import uuid
 
-from sqlalchemy import Column, String, Integer, Boolean, ARRAY, ForeignKey, DateTime
+from sqlalchemy import String, Integer, Boolean, ARRAY, ForeignKey, DateTime
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-# Base class for all ORM models
-Base = declarative_base()
+from app.database.base import Base
 
 
 # =============================================
@@ -80,6 +80,21 @@ class PlayerType(str, Enum):
     ADMIN = 'admin'
 
 
+# Enum values resolved once at import; property hot paths compare against
+# these instead of re-resolving Enum attributes per row.
+_ALIVE_VALUE = PlayerStatus.ALIVE.value
+_NO_EVENT_VALUE = ToBeInitiated.NO_EVENT.value
+
+# Value -> member tables: decoding a DB string is one dict lookup, with
+# unknown values mapping to None instead of raising through Enum.__call__.
+_CARD_TYPE_BY_VALUE = {member.value: member for member in CardType}
+_PLAYER_STATUS_BY_VALUE = {member.value: member for member in PlayerStatus}
+_PLATFORM_BY_VALUE = {member.value: member for member in SocialMediaPlatform}
+_PENDING_ACTION_BY_VALUE = {
+    member.value: member for member in ToBeInitiated if member.value != _NO_EVENT_VALUE
+}
+
+
 # =============================================
 # SQLAlchemy ORM Models (Three-Tier Architecture)
 # =============================================
@@ -93,20 +108,30 @@ class UserAccount(Base):
     """
     __tablename__ = 'gs_user_account_table_orm'
     
-    user_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_name = Column(String(50), unique=True, nullable=False)
-    display_name = Column(String(100), unique=True, nullable=False)
-    email = Column(String(255), nullable=True)
-    player_type = Column(String(20), default='human')
-    account_status = Column(String(20), default='active')
-    social_media_platforms = Column(ARRAY(String))
-    preferred_social_media_platform = Column(String, nullable=True)
-    social_media_platform_display_name = Column(String(100), nullable=True)
-    created_at = Column(DateTime(timezone=True))
-    last_login_at = Column(DateTime(timezone=True), nullable=True)
-    
-    # Relationships
-    game_states = relationship("PlayerGameState", back_populates="user")
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    display_name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    player_type: Mapped[Optional[str]] = mapped_column(String(20), default='human')
+    account_status: Mapped[Optional[str]] = mapped_column(String(20), default='active')
+    social_media_platforms: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String))
+    preferred_social_media_platform: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    social_media_platform_display_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    last_login_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    
+    # Relationships (read-only; lazy='raise' makes accidental N+1 loads fail loudly)
+    game_states: Mapped[List["PlayerGameState"]] = relationship(viewonly=True, lazy='raise')
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, UserAccount):
+            return NotImplemented
+        if self.user_id is None:
+            return self is other
+        return self.user_id == other.user_id
+    
+    def __hash__(self) -> int:
+        return hash(self.user_id) if self.user_id is not None else id(self)
     
     @property
     def is_active(self) -> bool:
@@ -121,10 +146,9 @@ class UserAccount(Base):
     @property
     def platform_enum(self) -> SocialMediaPlatform:
         """Get preferred social media platform as enum."""
-        try:
-            return SocialMediaPlatform(self.preferred_social_media_platform)
-        except (ValueError, TypeError):
-            return SocialMediaPlatform.DEFAULT
+        return _PLATFORM_BY_VALUE.get(
+            self.preferred_social_media_platform, SocialMediaPlatform.DEFAULT
+        )
 
 
 class PlayerGameState(Base):
@@ -136,34 +160,47 @@ class PlayerGameState(Base):
     """
     __tablename__ = 'gs_player_game_state_table_orm'
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey('gs_user_account_table_orm.user_id'), nullable=False)
-    session_id = Column(String, nullable=True)
-    card_types = Column(ARRAY(String))
-    player_statuses = Column(ARRAY(String))
-    coins = Column(Integer, default=2)
-    debt = Column(Integer, default=0)
-    target_display_name = Column(String, nullable=True)
-    to_be_initiated = Column(ARRAY(String))
-    joined_at = Column(DateTime(timezone=True))
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('gs_user_account_table_orm.user_id'), nullable=False)
+    session_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    card_types: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String))
+    player_statuses: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String))
+    coins: Mapped[Optional[int]] = mapped_column(Integer, default=2)
+    debt: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    target_display_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    to_be_initiated: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String))
+    joined_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    
+    # Relationships (read-only; lazy='raise' makes accidental N+1 loads fail loudly)
+    user: Mapped["UserAccount"] = relationship(viewonly=True, lazy='raise')
+    # Only the pending-actions query reads upgrades; it selectinloads them
+    upgrade: Mapped[Optional["UpgradeDetails"]] = relationship(
+        uselist=False, viewonly=True, lazy='raise'
+    )
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PlayerGameState):
+            return NotImplemented
+        if self.id is None:
+            return self is other
+        return self.id == other.id
     
-    # Relationships
-    user = relationship("UserAccount", back_populates="game_states")
+    def __hash__(self) -> int:
+        return hash(self.id) if self.id is not None else id(self)
     
     @property
     def is_alive(self) -> bool:
         """Check if player is alive."""
-        return PlayerStatus.ALIVE.value in (self.player_statuses or [])
+        return _ALIVE_VALUE in (self.player_statuses or ())
     
     @property
     def pending_action(self) -> Optional[ToBeInitiated]:
         """Get the primary pending action (first non-NO_EVENT action)."""
-        for action_str in (self.to_be_initiated or []):
-            if action_str != ToBeInitiated.NO_EVENT.value:
-                try:
-                    return ToBeInitiated(action_str)
-                except ValueError:
-                    continue
+        lookup = _PENDING_ACTION_BY_VALUE.get
+        for action_str in (self.to_be_initiated or ()):
+            action = lookup(action_str)
+            if action is not None:
+                return action
         return None
     
     @property
@@ -174,29 +211,21 @@ class PlayerGameState(Base):
     @property
     def card_types_enum(self) -> List[CardType]:
         """Get card types as enum values."""
-        result = []
-        for card in (self.card_types or []):
-            try:
-                result.append(CardType(card))
-            except ValueError:
-                pass
-        return result
+        return [card for card in map(_CARD_TYPE_BY_VALUE.get, self.card_types or ()) if card is not None]
     
     @property
     def player_statuses_enum(self) -> List[PlayerStatus]:
         """Get player statuses as enum values."""
-        result = []
-        for status in (self.player_statuses or []):
-            try:
-                result.append(PlayerStatus(status))
-            except ValueError:
-                pass
-        return result
+        return [
+            status
+            for status in map(_PLAYER_STATUS_BY_VALUE.get, self.player_statuses or ())
+            if status is not None
+        ]
     
     @property
     def card_count(self) -> int:
         """Number of cards remaining."""
-        return len(self.card_types or [])
+        return len(self.card_types or ())
 
 
 class UpgradeDetails(Base):
@@ -208,33 +237,28 @@ class UpgradeDetails(Base):
     """
     __tablename__ = 'gs_pending_action_upgrades_table_orm'
     
-    game_state_id = Column(UUID(as_uuid=True), ForeignKey('gs_player_game_state_table_orm.id'), primary_key=True)
-    assassination_priority = Column(String, nullable=True)
-    kleptomania_steal = Column(Boolean, default=False)
-    trigger_identity_crisis = Column(Boolean, default=False)
-    identify_as_tax_liability = Column(Boolean, default=False)
-    tax_debt = Column(Integer, default=0)
+    game_state_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('gs_player_game_state_table_orm.id'), primary_key=True)
+    assassination_priority: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    kleptomania_steal: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    trigger_identity_crisis: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    identify_as_tax_liability: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    tax_debt: Mapped[Optional[int]] = mapped_column(Integer, default=0)
     
     @property
     def has_any_upgrade(self) -> bool:
         """Check if any upgrade is active."""
-        return (
-            self.assassination_priority is not None or
+        return bool(
             self.kleptomania_steal or
             self.trigger_identity_crisis or
             self.identify_as_tax_liability or
-            (self.tax_debt or 0) > 0
+            (self.tax_debt or 0) > 0 or
+            self.assassination_priority is not None
         )
     
     @property
     def assassination_priority_enum(self) -> Optional[CardType]:
         """Get assassination priority as enum."""
-        if not self.assassination_priority:
-            return None
-        try:
-            return CardType(self.assassination_priority)
-        except ValueError:
-            return None
+        return _CARD_TYPE_BY_VALUE.get(self.assassination_priority)
 
 
 # =============================================
@@ -0,0 +1,58 @@
+"""
+Workflow graph factories.
+
+Shared builders for graph shapes that several workflows repeat, so the
+topology is wired in one place instead of once per workflow class.
+"""
+
+from typing import Any, NamedTuple, Optional
+
+from langgraph.graph import StateGraph
+from langgraph.types import CachePolicy
+
+
+class NodeSpec(NamedTuple):
+    """A node to add to a graph: name, action and optional cache policy."""
+    name: str
+    action: Any
+    cache_policy: Optional[CachePolicy] = None
+
+
+def _add_node(workflow: StateGraph, spec: NodeSpec) -> None:
+    if spec.cache_policy is None:
+        workflow.add_node(spec.name, spec.action)
+    else:
+        workflow.add_node(spec.name, spec.action, cache_policy=spec.cache_policy)
+
+
+def build_adg(
+    state_schema: type,
+    analyze: NodeSpec,
+    decide: NodeSpec,
+    generate: NodeSpec,
+) -> StateGraph:
+    """
+    Build the analyze → decide → generate graph shape.
+    
+    ANALYZE is the entry point and feeds DECIDE. DECIDE routes itself to
+    GENERATE or END with Command(goto=...), so it has no static out-edge.
+    GENERATE's outgoing edges are left to the caller.
+    
+    Args:
+        state_schema: TypedDict state for the graph
+        analyze: Entry node spec
+        decide: Decision node spec (returns Command)
+        generate: Generation node spec
+    
+    Returns:
+        Uncompiled StateGraph; add GENERATE's edges, then compile
+    """
+    workflow = StateGraph(state_schema)
+    
+    for spec in (analyze, decide, generate):
+        _add_node(workflow, spec)
+    
+    workflow.set_entry_point(analyze.name)
+    workflow.add_edge(analyze.name, decide.name)
+    
+    return workflow
@@ -5,7 +5,7 @@ LangGraph workflow for generating optional agent commentary
 on end-of-hour game results.
 
 Flow:
-    ANALYZE_RESULTS → DECIDE_COMMENTARY → (conditional) → GENERATE → END
+    ANALYZE_RESULTS → DECIDE_COMMENTARY → (Command goto) → GENERATE → END
                                               ↓
                                              END (if not commenting)
 
@@ -15,13 +15,22 @@ Commentary triggers:
 - Dramatic game events (eliminations, final players)
 """
 
+import functools
+import operator
+import warnings
+from types import SimpleNamespace
 from typing import Literal
 
-from langgraph.graph import END, StateGraph
+from langgraph.graph import END
+from langgraph.types import Command
 
+from app.graphs.workflows._factories import NodeSpec, build_adg
+from app.graphs.workflows.compiled_graph_cache import CompiledGraphCache
+from app.graphs.workflows.run_config import thread_config
 from app.models.graph_state_models.broadcast_commentary_state import (
     BroadcastCommentaryState,
 )
+from app.utils.async_runner import run_sync
 
 
 # =============================================
@@ -34,91 +43,95 @@ class BroadcastNode:
     GENERATE = "generate_commentary"
 
 
-# =============================================
-# Node Wrappers (lazy imports)
-# =============================================
-def analyze_results_node(state: BroadcastCommentaryState) -> dict:
-    """Wrapper for analyze results node."""
-    from app.nodes.coup_agent.broadcast_commentary_nodes import analyze_results_node as impl
-    return impl(state)
+# Route table indexed by should_comment: (False, True)
+_COMMENT_ROUTE = (END, BroadcastNode.GENERATE)
 
+# C-level key projections for the routing reads
+_get_commentary_decision = operator.itemgetter("commentary_decision")
+_get_should_comment = operator.itemgetter("should_comment")
 
-def decide_commentary_node(state: BroadcastCommentaryState) -> dict:
-    """Wrapper for decide commentary node."""
-    from app.nodes.coup_agent.broadcast_commentary_nodes import decide_commentary_node as impl
-    return impl(state)
 
-
-def generate_commentary_node(state: BroadcastCommentaryState) -> dict:
-    """Wrapper for generate commentary node."""
-    from app.nodes.coup_agent.broadcast_commentary_nodes import generate_commentary_node as impl
-    return impl(state)
+# =============================================
+# Node Implementations (resolved once)
+# =============================================
+@functools.lru_cache(maxsize=None)
+def _broadcast_impls() -> SimpleNamespace:
+    """Import the broadcast commentary node implementations on first use."""
+    from app.nodes.coup_agent import broadcast_commentary_nodes
+    return SimpleNamespace(
+        analyze_results_node=broadcast_commentary_nodes.analyze_results_node,
+        decide_commentary_node=broadcast_commentary_nodes.decide_commentary_node,
+        generate_commentary_node=broadcast_commentary_nodes.generate_commentary_node,
+    )
 
 
 # =============================================
-# Conditional Router
+# Node Wrappers
 # =============================================
-def should_generate_router(state: BroadcastCommentaryState) -> Literal["generate_commentary", "end"]:
+def analyze_results_node(state: BroadcastCommentaryState) -> dict:
+    """Wrapper for analyze results node."""
+    return _broadcast_impls().analyze_results_node(state)
+
+
+def decide_commentary_node(state: BroadcastCommentaryState) -> Command[Literal["generate_commentary", "__end__"]]:
     """
-    Route based on commentary decision.
+    Wrapper for decide commentary node.
     
-    If should_comment is True, go to generation.
-    Otherwise, skip to end.
+    Routes in the same step as the state write: GENERATE if should_comment,
+    otherwise END.
     """
-    decision = state.get("commentary_decision", {})
-    
-    if decision.get("should_comment", False):
-        return BroadcastNode.GENERATE
-    return "end"
+    update = _broadcast_impls().decide_commentary_node(state)
+    # Every decide path writes commentary_decision.should_comment
+    should_comment = _get_should_comment(_get_commentary_decision(update))
+    return Command(update=update, goto=_COMMENT_ROUTE[bool(should_comment)])
+
+
+def generate_commentary_node(state: BroadcastCommentaryState) -> dict:
+    """Wrapper for generate commentary node."""
+    return _broadcast_impls().generate_commentary_node(state)
 
 
 # =============================================
 # Workflow Class
 # =============================================
-class BroadcastCommentaryWorkflow:
+class BroadcastCommentaryWorkflow(CompiledGraphCache):
     """
     LangGraph workflow for generating broadcast commentary.
     
     Architecture:
-        ANALYZE → DECIDE → (conditional) → GENERATE → END
+        ANALYZE → DECIDE → (Command goto) → GENERATE → END
                               ↓
                              END (if not commenting)
     """
     
     def __init__(self):
-        # Build the graph
-        self.workflow = StateGraph(BroadcastCommentaryState)
-        
-        # Add nodes
-        self.workflow.add_node(BroadcastNode.ANALYZE, analyze_results_node)
-        self.workflow.add_node(BroadcastNode.DECIDE, decide_commentary_node)
-        self.workflow.add_node(BroadcastNode.GENERATE, generate_commentary_node)
-        
-        # Set entry point
-        self.workflow.set_entry_point(BroadcastNode.ANALYZE)
-        
-        # Add edges
-        self.workflow.add_edge(BroadcastNode.ANALYZE, BroadcastNode.DECIDE)
-        
-        # Conditional: decide whether to generate
-        self.workflow.add_conditional_edges(
-            BroadcastNode.DECIDE,
-            should_generate_router,
-            {
-                BroadcastNode.GENERATE: BroadcastNode.GENERATE,
-                "end": END,
-            }
+        # Compiled once and shared by every instance (see CompiledGraphCache)
+        self.app = self._get_compiled()
+        self.workflow = self.app.builder
+    
+    @classmethod
+    def _build(cls, checkpointer=None):
+        """Build and compile the broadcast commentary graph."""
+        # ANALYZE → DECIDE → (Command goto) → GENERATE
+        workflow = build_adg(
+            BroadcastCommentaryState,
+            analyze=NodeSpec(BroadcastNode.ANALYZE, analyze_results_node),
+            decide=NodeSpec(BroadcastNode.DECIDE, decide_commentary_node),
+            generate=NodeSpec(BroadcastNode.GENERATE, generate_commentary_node),
         )
         
         # Generate goes to end
-        self.workflow.add_edge(BroadcastNode.GENERATE, END)
+        workflow.add_edge(BroadcastNode.GENERATE, END)
         
-        # Compile
-        self.app = self.workflow.compile()
+        return workflow.compile(checkpointer=checkpointer)
     
-    def run(self, initial_state: dict, thread_id: str = "default") -> dict:
+    async def arun(self, initial_state: dict, thread_id: str = "default") -> dict:
         """
-        Synchronous invocation of the workflow.
+        Run the workflow (canonical entry point).
+        
+        Every broadcast node is sync: ainvoke runs each one in the default
+        thread pool, so GENERATE still holds a worker thread while it waits
+        on the LLM. Concurrent runs overlap, but not on the event loop alone.
         
         Args:
             initial_state: BroadcastCommentaryState dict
@@ -127,11 +140,21 @@ class BroadcastCommentaryWorkflow:
         Returns:
             Final state with commentary decision and optional commentary
         """
-        return self.app.invoke(initial_state, {"configurable": {"thread_id": thread_id}})
+        return await self.app.ainvoke(initial_state, thread_config(thread_id))
     
-    async def arun(self, initial_state: dict, thread_id: str = "default") -> dict:
-        """Asynchronous invocation of the workflow."""
-        return await self.app.ainvoke(initial_state, {"configurable": {"thread_id": thread_id}})
+    def run(self, initial_state: dict, thread_id: str = "default") -> dict:
+        """
+        Synchronous shim over arun() for sync callers and scripts.
+        
+        Deprecated: await arun() where an event loop is available. The run is
+        scheduled on the shared background loop (app.utils.async_runner).
+        """
+        warnings.warn(
+            f"{type(self).__name__}.run() is deprecated; await arun() instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return run_sync(self.arun(initial_state, thread_id))
     
     def get_graph_image(self):
         """Get a visual representation of the workflow graph."""
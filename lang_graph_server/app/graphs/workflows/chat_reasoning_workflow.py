@@ -9,11 +9,22 @@ Flow:
 The workflow conditionally skips generation if the decision is to not respond.
 """
 
+import functools
+import operator
+import warnings
+from types import SimpleNamespace
 from typing import Literal
 
-from langgraph.graph import END, StateGraph
+from langchain_core.runnables import RunnableLambda
+from langgraph.graph import END
+from langgraph.types import Command
 
+from app.graphs.workflows._factories import NodeSpec, build_adg
+from app.graphs.workflows.compiled_graph_cache import CompiledGraphCache
+from app.graphs.workflows.node_cache import create_node_cache, state_slice_cache_policy
+from app.graphs.workflows.run_config import thread_config
 from app.models.graph_state_models.chat_reasoning_state import ChatReasoningState
+from app.utils.async_runner import run_sync
 
 
 # =============================================
@@ -27,32 +38,70 @@ class ChatNode:
     ACTION_UPDATE = "decide_action_update"
 
 
+# State fields read by the analyze node (heuristics + LLM prompt)
+_ANALYZE_CACHE_FIELDS = (
+    "agent_id",
+    "agent_name",
+    "agent_personality",
+    "agent_play_style",
+    "agent_profile",
+    "incoming_message",
+    "sender_id",
+    "sender_is_llm",
+    "source_platform",
+    "coins",
+    "hand",
+    "players_alive",
+    "pending_action",
+    "visible_pending_actions",
+    "recent_chat_history",
+    "current_phase",
+)
+
+
 # =============================================
 # Conditional Router
 # =============================================
-def should_generate_router(state: ChatReasoningState) -> Literal["generate_response", "end"]:
-    """
-    Route based on response decision.
-    
-    If should_respond is True, go to generation.
-    Otherwise, skip to end.
-    """
-    decision = state.get("response_decision", {})
-    
-    if decision.get("should_respond", False):
-        return ChatNode.GENERATE
-    return "end"
 
+# Boolean route tables, indexed by the routing flag: (False, True)
+_RESPOND_ROUTE = (END, ChatNode.GENERATE)
+_ACTION_UPDATE_ROUTE = ("end", ChatNode.ACTION_UPDATE)
+
+# C-level key projections for the routing reads
+_get_response_decision = operator.itemgetter("response_decision")
+_get_should_respond = operator.itemgetter("should_respond")
+_get_generated_response = operator.itemgetter("generated_response")
 
 def should_update_action_router(state: ChatReasoningState) -> Literal["decide_action_update", "end"]:
     """
     Route to action update node only if we generated a response.
+    
+    GENERATE always writes generated_response (None when skipped), so the
+    key is read directly.
     """
-    response = state.get("generated_response")
+    return _ACTION_UPDATE_ROUTE[bool(_get_generated_response(state))]
+
+
+# =============================================
+# Node Implementations (resolved once)
+# =============================================
+@functools.lru_cache(maxsize=None)
+def _chat_impls() -> SimpleNamespace:
+    """
+    Import the chat node implementations on first use.
     
-    if response:
-        return ChatNode.ACTION_UPDATE
-    return "end"
+    The import stays deferred to avoid a circular import at module load,
+    but is only paid once instead of on every node call.
+    """
+    from app.nodes.coup_agent import chat_nodes
+    return SimpleNamespace(
+        analyze_message_node=chat_nodes.analyze_message_node,
+        aanalyze_message_node=chat_nodes.aanalyze_message_node,
+        decide_response_node=chat_nodes.decide_response_node,
+        generate_response_node=chat_nodes.generate_response_node,
+        agenerate_response_node=chat_nodes.agenerate_response_node,
+        decide_action_update_node=chat_nodes.decide_action_update_node,
+    )
 
 
 # =============================================
@@ -60,69 +109,82 @@ def should_update_action_router(state: ChatReasoningState) -> Literal["decide_ac
 # =============================================
 def analyze_message_node(state: ChatReasoningState) -> dict:
     """Wrapper for analyze message node."""
-    from app.nodes.coup_agent.chat_nodes import analyze_message_node as impl
-    return impl(state)
+    return _chat_impls().analyze_message_node(state)
+
 
+async def aanalyze_message_node(state: ChatReasoningState) -> dict:
+    """Async wrapper for analyze message node (awaits the LLM call)."""
+    return await _chat_impls().aanalyze_message_node(state)
 
-def decide_response_node(state: ChatReasoningState) -> dict:
-    """Wrapper for decide response node."""
-    from app.nodes.coup_agent.chat_nodes import decide_response_node as impl
-    return impl(state)
+
+def decide_response_node(state: ChatReasoningState) -> Command[Literal["generate_response", "__end__"]]:
+    """
+    Wrapper for decide response node.
+    
+    Routes in the same step as the state write: GENERATE if should_respond,
+    otherwise END.
+    """
+    update = _chat_impls().decide_response_node(state)
+    # Every decide path writes response_decision.should_respond
+    should_respond = _get_should_respond(_get_response_decision(update))
+    return Command(update=update, goto=_RESPOND_ROUTE[bool(should_respond)])
 
 
 def generate_response_node(state: ChatReasoningState) -> dict:
     """Wrapper for generate response node."""
-    from app.nodes.coup_agent.chat_nodes import generate_response_node as impl
-    return impl(state)
+    return _chat_impls().generate_response_node(state)
+
+
+async def agenerate_response_node(state: ChatReasoningState) -> dict:
+    """Async wrapper for generate response node (awaits the LLM call)."""
+    return await _chat_impls().agenerate_response_node(state)
 
 
 def decide_action_update_node(state: ChatReasoningState) -> dict:
     """Wrapper for decide action update node."""
-    from app.nodes.coup_agent.chat_nodes import decide_action_update_node as impl
-    return impl(state)
+    return _chat_impls().decide_action_update_node(state)
 
 
 # =============================================
 # Workflow Class
 # =============================================
-class ChatReasoningWorkflow:
+class ChatReasoningWorkflow(CompiledGraphCache):
     """
     LangGraph workflow for processing chat messages.
     
     Architecture:
-        ANALYZE → DECIDE → (conditional) → GENERATE → ACTION_UPDATE → END
+        ANALYZE → DECIDE → (Command goto) → GENERATE → ACTION_UPDATE → END
                            ↓
                           END (if not responding)
     """
     
     def __init__(self):
-        # Build the graph
-        self.workflow = StateGraph(ChatReasoningState)
-        
-        # Add nodes
-        self.workflow.add_node(ChatNode.ANALYZE, analyze_message_node)
-        self.workflow.add_node(ChatNode.DECIDE, decide_response_node)
-        self.workflow.add_node(ChatNode.GENERATE, generate_response_node)
-        self.workflow.add_node(ChatNode.ACTION_UPDATE, decide_action_update_node)
-        
-        # Set entry point
-        self.workflow.set_entry_point(ChatNode.ANALYZE)
-        
-        # Add edges
-        self.workflow.add_edge(ChatNode.ANALYZE, ChatNode.DECIDE)
-        
-        # Conditional: decide whether to generate
-        self.workflow.add_conditional_edges(
-            ChatNode.DECIDE,
-            should_generate_router,
-            {
-                ChatNode.GENERATE: ChatNode.GENERATE,
-                "end": END,
-            }
+        # Compiled once and shared by every instance (see CompiledGraphCache)
+        self.app = self._get_compiled()
+        self.workflow = self.app.builder
+    
+    @classmethod
+    def _build(cls, checkpointer=None):
+        """Build and compile the chat reasoning graph."""
+        # ANALYZE → DECIDE → (Command goto) → GENERATE
+        # Sync invoke runs the sync LLM nodes; ainvoke awaits their async twins
+        workflow = build_adg(
+            ChatReasoningState,
+            analyze=NodeSpec(
+                ChatNode.ANALYZE,
+                RunnableLambda(analyze_message_node, afunc=aanalyze_message_node),
+                state_slice_cache_policy(_ANALYZE_CACHE_FIELDS),
+            ),
+            decide=NodeSpec(ChatNode.DECIDE, decide_response_node),
+            generate=NodeSpec(
+                ChatNode.GENERATE,
+                RunnableLambda(generate_response_node, afunc=agenerate_response_node),
+            ),
         )
+        workflow.add_node(ChatNode.ACTION_UPDATE, decide_action_update_node)
         
         # Conditional: decide whether to update action
-        self.workflow.add_conditional_edges(
+        workflow.add_conditional_edges(
             ChatNode.GENERATE,
             should_update_action_router,
             {
@@ -132,14 +194,16 @@ class ChatReasoningWorkflow:
         )
         
         # Action update goes to end
-        self.workflow.add_edge(ChatNode.ACTION_UPDATE, END)
+        workflow.add_edge(ChatNode.ACTION_UPDATE, END)
         
-        # Compile
-        self.app = self.workflow.compile()
+        return workflow.compile(checkpointer=checkpointer, cache=create_node_cache())
     
-    def run(self, initial_state: dict, thread_id: str = "default") -> dict:
+    async def arun(self, initial_state: dict, thread_id: str = "default") -> dict:
         """
-        Synchronous invocation of the workflow.
+        Run the workflow (canonical entry point).
+        
+        LLM-bound nodes await their calls, so concurrent runs overlap on one
+        event loop instead of each holding a thread.
         
         Args:
             initial_state: ChatReasoningState dict
@@ -148,11 +212,21 @@ class ChatReasoningWorkflow:
         Returns:
             Final state with response decision and optional response
         """
-        return self.app.invoke(initial_state, {"configurable": {"thread_id": thread_id}})
+        return await self.app.ainvoke(initial_state, thread_config(thread_id))
     
-    async def arun(self, initial_state: dict, thread_id: str = "default") -> dict:
-        """Asynchronous invocation of the workflow."""
-        return await self.app.ainvoke(initial_state, {"configurable": {"thread_id": thread_id}})
+    def run(self, initial_state: dict, thread_id: str = "default") -> dict:
+        """
+        Synchronous shim over arun() for sync callers and scripts.
+        
+        Deprecated: await arun() where an event loop is available. The run is
+        scheduled on the shared background loop (app.utils.async_runner).
+        """
+        warnings.warn(
+            f"{type(self).__name__}.run() is deprecated; await arun() instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return run_sync(self.arun(initial_state, thread_id))
     
     def get_graph_image(self):
         """Get a visual representation of the workflow graph."""
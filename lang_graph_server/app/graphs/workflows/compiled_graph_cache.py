@@ -0,0 +1,67 @@
+"""
+Compiled Graph Cache.
+
+Mixin that compiles a workflow class's StateGraph once per checkpointer
+and shares the compiled (Pregel) app across every instance of that class.
+Classes with specialized graph variants can cache those the same way.
+StateGraph.compile() validates the graph and builds its channels, so
+re-running it per instance is wasted work.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Hashable, Tuple
+
+
+class CompiledGraphCache(ABC):
+    """
+    Per-class cache of compiled graphs keyed by checkpointer identity.
+    
+    Subclasses implement _build(checkpointer) and call
+    _get_compiled(checkpointer) from __init__. Classes with variant graphs
+    also override _build_variant(variant, checkpointer); those are fetched
+    with _get_compiled(checkpointer, variant).
+    
+    Each subclass gets its own cache and lock. The cache holds one entry per
+    (checkpointer, variant) pair, so it stays as small as the set of
+    checkpointers the app passes in (one shared saver, or none).
+    """
+    
+    # Set per subclass by __init_subclass__:
+    # {(id(checkpointer), variant): (checkpointer, app)}
+    _compiled_cache: Dict[Tuple[int, Hashable], Tuple[Any, Any]]
+    _compiled_lock: threading.Lock
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._compiled_cache = {}
+        cls._compiled_lock = threading.Lock()
+    
+    @classmethod
+    @abstractmethod
+    def _build(cls, checkpointer=None):
+        """Build and compile the workflow graph with the given checkpointer."""
+    
+    @classmethod
+    def _build_variant(cls, variant: Hashable, checkpointer=None):
+        """Build and compile a specialized graph variant (classes without variants have none)."""
+        raise ValueError(f"{cls.__name__} has no graph variant {variant!r}")
+    
+    @classmethod
+    def _get_compiled(cls, checkpointer=None, variant: Hashable = None):
+        """Return the compiled graph for this checkpointer/variant, compiling on first use."""
+        # The checkpointer is kept in the entry so its id cannot be reused
+        key = (id(checkpointer), variant)
+        entry = cls._compiled_cache.get(key)
+        if entry is None:
+            # Concurrent first uses compile once; later lookups skip the lock
+            with cls._compiled_lock:
+                entry = cls._compiled_cache.get(key)
+                if entry is None:
+                    if variant is None:
+                        app = cls._build(checkpointer)
+                    else:
+                        app = cls._build_variant(variant, checkpointer)
+                    entry = (checkpointer, app)
+                    cls._compiled_cache[key] = entry
+        return entry[1]
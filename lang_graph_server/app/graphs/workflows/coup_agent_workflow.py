@@ -10,6 +10,10 @@ It is called by:
 Architecture:
     Entry Router → SELECT_ACTION | REACT | RESOLVE → END
 
+Internal callers that already know the decision type (select_action,
+decide_reaction, resolve_cards) skip the entry router and run a one-node
+graph compiled for that decision type.
+
 The graph topology stays stable; new decision types are added via enums,
 not by modifying the graph structure.
 
@@ -21,12 +25,16 @@ Two-Phase Hourly Coup Integration:
     that are resolved at phase boundaries, not immediately.
 """
 
+import functools
+import warnings
 from typing import Literal
 
 from langgraph.graph import END, StateGraph
 
-from app.constants import DecisionType
+from app.constants import DecisionType, REACTION_TYPE_BY_VALUE, RESOLUTION_TYPE_BY_VALUE
+from app.graphs.workflows.run_config import thread_config
 from app.models.graph_state_models.coup_agent_state import CoupAgentState
+from app.utils.async_runner import run_sync
 
 
 # =============================================
@@ -43,6 +51,14 @@ class CoupNode:
 # =============================================
 # Entry Router
 # =============================================
+# decision_type → entry node, built once at import
+_ENTRY_ROUTE_TABLE = {
+    DecisionType.ACTION: CoupNode.SELECT_ACTION,
+    DecisionType.REACT: CoupNode.REACT,
+    DecisionType.RESOLVE: CoupNode.RESOLVE,
+}
+
+
 def entry_router(state: CoupAgentState) -> Literal["select_action", "react", "resolve"]:
     """
     Route to the appropriate decision node based on decision_type.
@@ -50,17 +66,8 @@ def entry_router(state: CoupAgentState) -> Literal["select_action", "react", "re
     This is the only conditional edge in the graph - all sub-routing
     happens within the individual nodes via their respective enums.
     """
-    decision_type = state.get("decision_type")
-
-    if decision_type == DecisionType.ACTION:
-        return CoupNode.SELECT_ACTION
-    elif decision_type == DecisionType.REACT:
-        return CoupNode.REACT
-    elif decision_type == DecisionType.RESOLVE:
-        return CoupNode.RESOLVE
-    else:
-        # Default to ACTION if not specified (backwards compatibility)
-        return CoupNode.SELECT_ACTION
+    # Default to ACTION if not specified (backwards compatibility)
+    return _ENTRY_ROUTE_TABLE.get(state.get("decision_type"), CoupNode.SELECT_ACTION)
 
 
 # =============================================
@@ -98,6 +105,67 @@ def resolve_node(state: CoupAgentState) -> dict:
     return impl(state)
 
 
+# =============================================
+# Graph Builder
+# =============================================
+@functools.lru_cache(maxsize=1)
+def _build_coup_agent_app():
+    """
+    Build and compile the Coup agent graph.
+
+    The graph takes no checkpointer and its topology never changes, so it
+    is compiled once per process and shared by every CoupAgentWorkflow.
+    """
+    workflow = StateGraph(CoupAgentState)
+
+    # Add nodes
+    workflow.add_node(CoupNode.SELECT_ACTION, select_action_node)
+    workflow.add_node(CoupNode.REACT, react_node)
+    workflow.add_node(CoupNode.RESOLVE, resolve_node)
+
+    # Entry point: conditional routing based on decision_type
+    workflow.set_conditional_entry_point(
+        entry_router,
+        {
+            CoupNode.SELECT_ACTION: CoupNode.SELECT_ACTION,
+            CoupNode.REACT: CoupNode.REACT,
+            CoupNode.RESOLVE: CoupNode.RESOLVE,
+        }
+    )
+
+    # All nodes terminate to END (single-step decisions)
+    workflow.add_edge(CoupNode.SELECT_ACTION, END)
+    workflow.add_edge(CoupNode.REACT, END)
+    workflow.add_edge(CoupNode.RESOLVE, END)
+
+    return workflow.compile()
+
+
+# decision_type → (node name, node), for the single-decision graphs
+_DECISION_NODES = {
+    DecisionType.ACTION: (CoupNode.SELECT_ACTION, select_action_node),
+    DecisionType.REACT: (CoupNode.REACT, react_node),
+    DecisionType.RESOLVE: (CoupNode.RESOLVE, resolve_node),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _build_decision_app(decision_type: DecisionType):
+    """
+    Build and compile a one-node graph (NODE → END) for one decision type.
+
+    Compiled once per decision type per process, like _build_coup_agent_app.
+    """
+    node_name, node = _DECISION_NODES[decision_type]
+
+    workflow = StateGraph(CoupAgentState)
+    workflow.add_node(node_name, node)
+    workflow.set_entry_point(node_name)
+    workflow.add_edge(node_name, END)
+
+    return workflow.compile()
+
+
 # =============================================
 # Workflow Class
 # =============================================
@@ -126,43 +194,44 @@ class CoupAgentWorkflow:
     """
 
     def __init__(self):
-        # Build the graph
-        self.workflow = StateGraph(CoupAgentState)
-
-        # Add nodes
-        self.workflow.add_node(CoupNode.SELECT_ACTION, select_action_node)
-        self.workflow.add_node(CoupNode.REACT, react_node)
-        self.workflow.add_node(CoupNode.RESOLVE, resolve_node)
-
-        # Entry point: conditional routing based on decision_type
-        self.workflow.set_conditional_entry_point(
-            entry_router,
-            {
-                CoupNode.SELECT_ACTION: CoupNode.SELECT_ACTION,
-                CoupNode.REACT: CoupNode.REACT,
-                CoupNode.RESOLVE: CoupNode.RESOLVE,
-            }
-        )
-
-        # All nodes terminate to END (single-step decisions)
-        self.workflow.add_edge(CoupNode.SELECT_ACTION, END)
-        self.workflow.add_edge(CoupNode.REACT, END)
-        self.workflow.add_edge(CoupNode.RESOLVE, END)
-
-        # Compile
-        self.app = self.workflow.compile()
+        # Compiled once per process (see _build_coup_agent_app)
+        self.app = _build_coup_agent_app()
+        self.workflow = self.app.builder
+        # Single-decision graphs used by the convenience methods
+        self._apps = {decision_type: _build_decision_app(decision_type) for decision_type in _DECISION_NODES}
 
     def run(self, initial_state: dict, thread_id: str = "default") -> dict:
-        """Synchronous invocation of the workflow."""
-        return self.app.invoke(initial_state, {"configurable": {"thread_id": thread_id}})
+        """
+        Synchronous shim over arun() for sync callers and scripts.
+        
+        Deprecated: await arun() where an event loop is available. The run is
+        scheduled on the shared background loop (app.utils.async_runner).
+        """
+        warnings.warn(
+            f"{type(self).__name__}.run() is deprecated; await arun() instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return run_sync(self.arun(initial_state, thread_id))
 
     async def arun(self, initial_state: dict, thread_id: str = "default") -> dict:
         """Asynchronous invocation of the workflow."""
-        return await self.app.ainvoke(initial_state, {"configurable": {"thread_id": thread_id}})
+        return await self.app.ainvoke(initial_state, thread_config(thread_id))
+    
+    async def arun_decision(self, initial_state: dict, thread_id: str = "default") -> dict:
+        """
+        Run the single-decision graph for initial_state["decision_type"].
+        
+        Skips the entry router; the decision node is the graph's only node.
+        """
+        app = self._apps[initial_state["decision_type"]]
+        return await app.ainvoke(initial_state, thread_config(thread_id))
     
     # =============================================
     # Convenience Methods for Internal Callers
     # =============================================
+    # Sync entry points for sync handlers; each schedules arun_decision() on
+    # the shared background loop rather than going through the deprecated run().
     
     def select_action(self, agent_state: dict, thread_id: str = "default") -> dict:
         """
@@ -178,7 +247,7 @@ class CoupAgentWorkflow:
             Dict with chosen_action, chosen_target, claimed_role, reasoning
         """
         state = {**agent_state, "decision_type": DecisionType.ACTION}
-        return self.run(state, thread_id)
+        return run_sync(self.arun_decision(state, thread_id))
     
     def decide_reaction(
         self,
@@ -199,13 +268,15 @@ class CoupAgentWorkflow:
         Returns:
             Dict with chosen_reaction, reasoning
         """
-        from app.constants import ReactionType
+        reaction = REACTION_TYPE_BY_VALUE.get(reaction_type)
+        if reaction is None:
+            raise ValueError(f"Unknown reaction type: {reaction_type}")
         state = {
             **agent_state,
             "decision_type": DecisionType.REACT,
-            "reaction_type": ReactionType(reaction_type),
+            "reaction_type": reaction,
         }
-        return self.run(state, thread_id)
+        return run_sync(self.arun_decision(state, thread_id))
     
     def resolve_cards(
         self,
@@ -226,11 +297,13 @@ class CoupAgentWorkflow:
         Returns:
             Dict with chosen_reveal or chosen_exchange
         """
-        from app.constants import ResolutionType
+        resolution = RESOLUTION_TYPE_BY_VALUE.get(resolution_type)
+        if resolution is None:
+            raise ValueError(f"Unknown resolution type: {resolution_type}")
         state = {
             **agent_state,
             "decision_type": DecisionType.RESOLVE,
-            "resolution_type": ResolutionType(resolution_type),
+            "resolution_type": resolution,
         }
-        return self.run(state, thread_id)
+        return run_sync(self.arun_decision(state, thread_id))
 
@@ -5,21 +5,35 @@ LangGraph workflow for classifying and routing incoming events
 to the appropriate handlers with checkpointing for conversation context.
 
 Architecture:
-    CLASSIFY → RESOLVE_AGENTS → (conditional) → HANDLER → FINALIZE → END
+    CLASSIFY (classify + resolve agents) → (conditional) → HANDLER → FINALIZE → END
+    CLASSIFY (classify/resolve error, finalized inline) → END
+
+Known event types (arun_known_type):
+    HANDLER (classify + resolve agents + handle) → FINALIZE → END
+    One specialized graph per EventType, compiled on first use.
 
 Checkpointing:
     - Conversation history is persisted per game+agent thread
+    - CheckpointMode.END_OF_WORKFLOW persists once per run instead of per node
     - Enables context-aware responses across multiple events
     - Thread ID format: "{game_id}:{agent_id}" or "{game_id}:broadcast"
 """
 
-from typing import Literal
+import functools
+import inspect
+import warnings
+from types import SimpleNamespace
+from typing import Literal, Optional, Union
 
 from langgraph.graph import END, StateGraph
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import MemorySaver
 
-from app.constants import EventType
+from app.constants import CHECKPOINT_DURABILITY, CheckpointMode, EventType
+from app.graphs.workflows.compiled_graph_cache import CompiledGraphCache
+from app.graphs.workflows.run_config import thread_config, thread_id_for
 from app.models.graph_state_models.event_router_state import EventRouterState
+from app.utils.async_runner import run_sync
 
 
 # =============================================
@@ -28,7 +42,6 @@ from app.models.graph_state_models.event_router_state import EventRouterState
 class EventRouterNode:
     """Node names for the event router workflow."""
     CLASSIFY = "classify_event"
-    RESOLVE_AGENTS = "resolve_agents"
     HANDLE_CHAT = "handle_chat"
     HANDLE_GAME_STATE = "handle_game_state"
     HANDLE_PLAYER_ACTION = "handle_player_action"
@@ -44,98 +57,175 @@ class EventRouterNode:
 
 
 # =============================================
-# Node Wrappers (lazy imports to avoid circular deps)
+# Node Implementations (resolved once)
 # =============================================
-def classify_event_node(state: EventRouterState) -> dict:
-    """Wrapper for classify event node."""
-    from app.nodes.coup_agent.event_classifier_nodes import classify_event_node as impl
-    return impl(state)
+@functools.lru_cache(maxsize=None)
+def _event_impls() -> SimpleNamespace:
+    """
+    Import the event classifier node implementations on first use.
+    
+    Still deferred to avoid circular deps at module load, but resolved once
+    instead of on every node call.
+    """
+    from app.nodes.coup_agent import event_classifier_nodes
+    return SimpleNamespace(
+        classify_event_node=event_classifier_nodes.classify_event_node,
+        resolve_target_agents_node=event_classifier_nodes.resolve_target_agents_node,
+        handle_chat_message_node=event_classifier_nodes.handle_chat_message_node,
+        handle_game_state_update_node=event_classifier_nodes.handle_game_state_update_node,
+        handle_player_action_change_node=event_classifier_nodes.handle_player_action_change_node,
+        handle_supervisor_instruction_node=event_classifier_nodes.handle_supervisor_instruction_node,
+        handle_profile_sync_node=event_classifier_nodes.handle_profile_sync_node,
+        handle_broadcast_results_node=event_classifier_nodes.handle_broadcast_results_node,
+        handle_phase_transition_node=event_classifier_nodes.handle_phase_transition_node,
+        handle_reaction_required_node=event_classifier_nodes.handle_reaction_required_node,
+        handle_reactions_visible_node=event_classifier_nodes.handle_reactions_visible_node,
+        handle_card_selection_required_node=event_classifier_nodes.handle_card_selection_required_node,
+        finalize_response_node=event_classifier_nodes.finalize_response_node,
+    )
 
 
-def resolve_agents_node(state: EventRouterState) -> dict:
-    """Wrapper for resolve agents node."""
-    from app.nodes.coup_agent.event_classifier_nodes import resolve_target_agents_node as impl
-    return impl(state)
+# =============================================
+# Node Wrappers
+# =============================================
+def classify_and_resolve_node(state: EventRouterState) -> dict:
+    """
+    Fused classify + resolve agents node.
+    
+    Classifies the event and, unless that failed, resolves the target agents
+    against the merged state in the same super-step. Returns the union of
+    both updates.
+    
+    On a classification or resolution error the finalize step runs inline,
+    so the router can go straight to END without a separate FINALIZE
+    super-step.
+    """
+    impls = _event_impls()
+    
+    classified = impls.classify_event_node(state)
+    if classified.get("error"):
+        return {**classified, **impls.finalize_response_node({**state, **classified})}
+    
+    update = {**classified, **impls.resolve_target_agents_node({**state, **classified})}
+    if update.get("error"):
+        update.update(impls.finalize_response_node({**state, **update}))
+    return update
 
 
-def handle_chat_node(state: EventRouterState) -> dict:
+async def handle_chat_node(state: EventRouterState) -> dict:
     """Wrapper for chat handler node."""
-    from app.nodes.coup_agent.event_classifier_nodes import handle_chat_message_node as impl
-    return impl(state)
+    return await _event_impls().handle_chat_message_node(state)
 
 
 def handle_game_state_node(state: EventRouterState) -> dict:
     """Wrapper for game state handler node."""
-    from app.nodes.coup_agent.event_classifier_nodes import handle_game_state_update_node as impl
-    return impl(state)
+    return _event_impls().handle_game_state_update_node(state)
 
 
 def handle_player_action_node(state: EventRouterState) -> dict:
     """Wrapper for player action handler node."""
-    from app.nodes.coup_agent.event_classifier_nodes import handle_player_action_change_node as impl
-    return impl(state)
+    return _event_impls().handle_player_action_change_node(state)
 
 
 def handle_supervisor_node(state: EventRouterState) -> dict:
     """Wrapper for supervisor instruction handler node."""
-    from app.nodes.coup_agent.event_classifier_nodes import handle_supervisor_instruction_node as impl
-    return impl(state)
+    return _event_impls().handle_supervisor_instruction_node(state)
 
 
 def handle_profile_sync_node(state: EventRouterState) -> dict:
     """Wrapper for profile sync handler node."""
-    from app.nodes.coup_agent.event_classifier_nodes import handle_profile_sync_node as impl
-    return impl(state)
+    return _event_impls().handle_profile_sync_node(state)
 
 
-def handle_broadcast_node(state: EventRouterState) -> dict:
+async def handle_broadcast_node(state: EventRouterState) -> dict:
     """Wrapper for broadcast handler node."""
-    from app.nodes.coup_agent.event_classifier_nodes import handle_broadcast_results_node as impl
-    return impl(state)
+    return await _event_impls().handle_broadcast_results_node(state)
 
 
 def handle_phase_transition_node(state: EventRouterState) -> dict:
     """Wrapper for phase transition handler node."""
-    from app.nodes.coup_agent.event_classifier_nodes import handle_phase_transition_node as impl
-    return impl(state)
+    return _event_impls().handle_phase_transition_node(state)
 
 
-def handle_reaction_required_node(state: EventRouterState) -> dict:
+async def handle_reaction_required_node(state: EventRouterState) -> dict:
     """Wrapper for reaction required handler node."""
-    from app.nodes.coup_agent.event_classifier_nodes import handle_reaction_required_node as impl
-    return impl(state)
+    return await _event_impls().handle_reaction_required_node(state)
 
 
 def handle_reactions_visible_node(state: EventRouterState) -> dict:
     """Wrapper for reactions visibility handler node."""
-    from app.nodes.coup_agent.event_classifier_nodes import handle_reactions_visible_node as impl
-    return impl(state)
+    return _event_impls().handle_reactions_visible_node(state)
 
 
 def handle_card_selection_node(state: EventRouterState) -> dict:
     """Wrapper for card selection required handler node."""
-    from app.nodes.coup_agent.event_classifier_nodes import handle_card_selection_required_node as impl
-    return impl(state)
+    return _event_impls().handle_card_selection_required_node(state)
 
 
 def finalize_node(state: EventRouterState) -> dict:
     """Wrapper for finalize node."""
-    from app.nodes.coup_agent.event_classifier_nodes import finalize_response_node as impl
-    return impl(state)
+    return _event_impls().finalize_response_node(state)
 
 
-# =============================================
-# Conditional Routers
-# =============================================
-def should_continue_router(state: EventRouterState) -> Literal["resolve_agents", "finalize"]:
+# Handler node name → wrapper, for the specialized known-type graphs
+_HANDLER_NODES = {
+    EventRouterNode.HANDLE_CHAT: handle_chat_node,
+    EventRouterNode.HANDLE_GAME_STATE: handle_game_state_node,
+    EventRouterNode.HANDLE_PLAYER_ACTION: handle_player_action_node,
+    EventRouterNode.HANDLE_SUPERVISOR: handle_supervisor_node,
+    EventRouterNode.HANDLE_PROFILE_SYNC: handle_profile_sync_node,
+    EventRouterNode.HANDLE_BROADCAST: handle_broadcast_node,
+    EventRouterNode.HANDLE_PHASE_TRANSITION: handle_phase_transition_node,
+    EventRouterNode.HANDLE_REACTION_REQUIRED: handle_reaction_required_node,
+    EventRouterNode.HANDLE_REACTIONS_VISIBLE: handle_reactions_visible_node,
+    EventRouterNode.HANDLE_CARD_SELECTION: handle_card_selection_node,
+}
+
+
+def _known_type_handler_node(handler):
     """
-    Check if we should continue processing or finalize with error.
+    Build the entry node for a specialized known-type graph.
     
-    If classification failed, go straight to finalize.
+    Runs classify + resolve agents and then the handler in one super-step.
+    If classification or agent resolution fails, the handler is skipped
+    (the error is already finalized) and the graph ends, as in the full graph.
+    Async handlers get an async entry node.
     """
-    if state.get("error"):
-        return EventRouterNode.FINALIZE
-    return EventRouterNode.RESOLVE_AGENTS
+    if inspect.iscoroutinefunction(handler):
+        async def node(state: EventRouterState) -> dict:
+            update = classify_and_resolve_node(state)
+            if update.get("error") or not update.get("agent_ids_to_process"):
+                return update
+            return {**update, **await handler({**state, **update})}
+    else:
+        def node(state: EventRouterState) -> dict:
+            update = classify_and_resolve_node(state)
+            if update.get("error") or not update.get("agent_ids_to_process"):
+                return update
+            return {**update, **handler({**state, **update})}
+    
+    node.__name__ = f"known_type_{handler.__name__}"
+    return node
+
+
+# =============================================
+# Conditional Routers
+# =============================================
+
+# Event type → handler node, built once at import
+_EVENT_ROUTE_TABLE = {
+    EventType.CHAT_MESSAGE: EventRouterNode.HANDLE_CHAT,
+    EventType.GAME_STATE_UPDATE: EventRouterNode.HANDLE_GAME_STATE,
+    EventType.PLAYER_ACTION_CHANGE: EventRouterNode.HANDLE_PLAYER_ACTION,
+    EventType.SUPERVISOR_INSTRUCTION: EventRouterNode.HANDLE_SUPERVISOR,
+    EventType.PROFILE_SYNC: EventRouterNode.HANDLE_PROFILE_SYNC,
+    EventType.BROADCAST_RESULTS: EventRouterNode.HANDLE_BROADCAST,
+    # Phase 2 event types
+    EventType.PHASE_TRANSITION: EventRouterNode.HANDLE_PHASE_TRANSITION,
+    EventType.REACTION_REQUIRED: EventRouterNode.HANDLE_REACTION_REQUIRED,
+    EventType.REACTIONS_VISIBLE: EventRouterNode.HANDLE_REACTIONS_VISIBLE,
+    EventType.CARD_SELECTION_REQUIRED: EventRouterNode.HANDLE_CARD_SELECTION,
+}
 
 
 def agents_resolved_and_route(state: EventRouterState) -> str:
@@ -143,40 +233,56 @@ def agents_resolved_and_route(state: EventRouterState) -> str:
     Check if agents were resolved successfully and route to appropriate handler.
     
     Combined router that:
-    1. Checks for errors or missing agents → FINALIZE
-    2. Routes to handler based on event type
+    1. Errors (already finalized by the classify node) → END
+    2. No agents to process → FINALIZE
+    3. Routes to handler based on event type
     """
     # Check for errors first
-    if state.get("error") or not state.get("agent_ids_to_process"):
-        return EventRouterNode.FINALIZE
-    
-    # Route based on event type
-    event_type = state.get("classified_event_type")
-    
-    if not event_type:
+    if state.get("error"):
+        return END
+    if not state.get("agent_ids_to_process"):
         return EventRouterNode.FINALIZE
     
-    routing = {
-        EventType.CHAT_MESSAGE: EventRouterNode.HANDLE_CHAT,
-        EventType.GAME_STATE_UPDATE: EventRouterNode.HANDLE_GAME_STATE,
-        EventType.PLAYER_ACTION_CHANGE: EventRouterNode.HANDLE_PLAYER_ACTION,
-        EventType.SUPERVISOR_INSTRUCTION: EventRouterNode.HANDLE_SUPERVISOR,
-        EventType.PROFILE_SYNC: EventRouterNode.HANDLE_PROFILE_SYNC,
-        EventType.BROADCAST_RESULTS: EventRouterNode.HANDLE_BROADCAST,
-        # Phase 2 event types
-        EventType.PHASE_TRANSITION: EventRouterNode.HANDLE_PHASE_TRANSITION,
-        EventType.REACTION_REQUIRED: EventRouterNode.HANDLE_REACTION_REQUIRED,
-        EventType.REACTIONS_VISIBLE: EventRouterNode.HANDLE_REACTIONS_VISIBLE,
-        EventType.CARD_SELECTION_REQUIRED: EventRouterNode.HANDLE_CARD_SELECTION,
-    }
+    # Route based on event type (missing/unknown types finalize)
+    return _EVENT_ROUTE_TABLE.get(state.get("classified_event_type"), EventRouterNode.FINALIZE)
+
+
+def finalize_unless_error(state: EventRouterState) -> str:
+    """Route a known-type handler to FINALIZE, or END if CLASSIFY already finalized an error."""
+    return END if state.get("error") else EventRouterNode.FINALIZE
+
+
+# =============================================
+# Run Defaults
+# =============================================
+
+# Scalar defaults for keys the caller may omit; list defaults are created per run
+_SCALAR_STATE_DEFAULTS = (
+    ("events_processed_this_hour", 0),
+    ("processing_complete", False),
+)
+_LIST_STATE_DEFAULTS = ("handler_responses", "conversation_messages")
+
+
+def _apply_state_defaults(initial_state: dict) -> dict:
+    """
+    Fill missing default keys on initial_state in place and return it.
     
-    return routing.get(event_type, EventRouterNode.FINALIZE)
+    Avoids copying the whole (possibly large) state into a new dict per run.
+    Callers pass a freshly built dict per event, so mutating it is safe.
+    """
+    for key in _LIST_STATE_DEFAULTS:
+        if key not in initial_state:
+            initial_state[key] = []
+    for key, value in _SCALAR_STATE_DEFAULTS:
+        initial_state.setdefault(key, value)
+    return initial_state
 
 
 # =============================================
 # Workflow Class
 # =============================================
-class EventRouterWorkflow:
+class EventRouterWorkflow(CompiledGraphCache):
     """
     LangGraph workflow for event classification and routing.
     
@@ -187,61 +293,77 @@ class EventRouterWorkflow:
     - Supports both single-agent and broadcast events
     
     Architecture:
-        CLASSIFY → (error?) → RESOLVE_AGENTS → (error?) → HANDLER → FINALIZE → END
+        CLASSIFY (classify + resolve agents) → (error?) → HANDLER → FINALIZE → END
+        Classify/resolve errors are finalized inside CLASSIFY and go straight to END.
     
     Thread ID Format:
         - Single agent: "{game_id}:{agent_id}"
         - Broadcast: "{game_id}:broadcast"
     """
     
-    def __init__(self, checkpointer=None):
+    # Shared fallback checkpointer (see _get_default_checkpointer)
+    _default_checkpointer = None
+    
+    def __init__(
+        self,
+        checkpointer: Union[BaseCheckpointSaver, Literal[False], None] = None,
+        checkpoint_mode: CheckpointMode = CheckpointMode.END_OF_WORKFLOW,
+    ):
         """
         Initialize the event router workflow.
         
         Args:
             checkpointer: LangGraph checkpointer for state persistence.
-                         If None, uses MemorySaver (in-memory).
+                         If None, uses a process-wide MemorySaver (in-memory)
+                         shared by every default instance.
+                         If False, compiles without a checkpointer - no state
+                         is persisted and conversation history is always empty.
+            checkpoint_mode: END_OF_WORKFLOW (default) buffers the run's writes
+                            and persists once when it finishes - only the final
+                            conversation_messages matter for context continuity.
+                            PER_STEP writes a checkpoint after every node.
         """
-        # Use provided checkpointer or default to MemorySaver
-        self.checkpointer = checkpointer or MemorySaver()
+        # Use provided checkpointer or the shared default MemorySaver. A fresh
+        # saver per instance would defeat the compiled-graph cache (keyed by
+        # checkpointer) and grow it by one graph per instance.
+        if checkpointer is False:
+            self.checkpointer = None
+        else:
+            self.checkpointer = checkpointer or self._get_default_checkpointer()
+        self.durability = CHECKPOINT_DURABILITY[checkpoint_mode]
         
-        # Build the graph
-        self.workflow = StateGraph(EventRouterState)
+        # Compiled once per checkpointer (see CompiledGraphCache)
+        self.app = self._get_compiled(self.checkpointer)
+        self.workflow = self.app.builder
+    
+    @classmethod
+    def _build(cls, checkpointer=None):
+        """Build and compile the event router graph with the given checkpointer."""
+        workflow = StateGraph(EventRouterState)
         
         # Add all nodes
-        self.workflow.add_node(EventRouterNode.CLASSIFY, classify_event_node)
-        self.workflow.add_node(EventRouterNode.RESOLVE_AGENTS, resolve_agents_node)
-        self.workflow.add_node(EventRouterNode.HANDLE_CHAT, handle_chat_node)
-        self.workflow.add_node(EventRouterNode.HANDLE_GAME_STATE, handle_game_state_node)
-        self.workflow.add_node(EventRouterNode.HANDLE_PLAYER_ACTION, handle_player_action_node)
-        self.workflow.add_node(EventRouterNode.HANDLE_SUPERVISOR, handle_supervisor_node)
-        self.workflow.add_node(EventRouterNode.HANDLE_PROFILE_SYNC, handle_profile_sync_node)
-        self.workflow.add_node(EventRouterNode.HANDLE_BROADCAST, handle_broadcast_node)
+        workflow.add_node(EventRouterNode.CLASSIFY, classify_and_resolve_node)
+        workflow.add_node(EventRouterNode.HANDLE_CHAT, handle_chat_node)
+        workflow.add_node(EventRouterNode.HANDLE_GAME_STATE, handle_game_state_node)
+        workflow.add_node(EventRouterNode.HANDLE_PLAYER_ACTION, handle_player_action_node)
+        workflow.add_node(EventRouterNode.HANDLE_SUPERVISOR, handle_supervisor_node)
+        workflow.add_node(EventRouterNode.HANDLE_PROFILE_SYNC, handle_profile_sync_node)
+        workflow.add_node(EventRouterNode.HANDLE_BROADCAST, handle_broadcast_node)
         # Phase 2 handler nodes
-        self.workflow.add_node(EventRouterNode.HANDLE_PHASE_TRANSITION, handle_phase_transition_node)
-        self.workflow.add_node(EventRouterNode.HANDLE_REACTION_REQUIRED, handle_reaction_required_node)
-        self.workflow.add_node(EventRouterNode.HANDLE_REACTIONS_VISIBLE, handle_reactions_visible_node)
-        self.workflow.add_node(EventRouterNode.HANDLE_CARD_SELECTION, handle_card_selection_node)
-        self.workflow.add_node(EventRouterNode.FINALIZE, finalize_node)
+        workflow.add_node(EventRouterNode.HANDLE_PHASE_TRANSITION, handle_phase_transition_node)
+        workflow.add_node(EventRouterNode.HANDLE_REACTION_REQUIRED, handle_reaction_required_node)
+        workflow.add_node(EventRouterNode.HANDLE_REACTIONS_VISIBLE, handle_reactions_visible_node)
+        workflow.add_node(EventRouterNode.HANDLE_CARD_SELECTION, handle_card_selection_node)
+        workflow.add_node(EventRouterNode.FINALIZE, finalize_node)
         
         # Set entry point
-        self.workflow.set_entry_point(EventRouterNode.CLASSIFY)
+        workflow.set_entry_point(EventRouterNode.CLASSIFY)
         
         # Add edges
-        # CLASSIFY → conditional → RESOLVE_AGENTS or FINALIZE
-        self.workflow.add_conditional_edges(
-            EventRouterNode.CLASSIFY,
-            should_continue_router,
-            {
-                EventRouterNode.RESOLVE_AGENTS: EventRouterNode.RESOLVE_AGENTS,
-                EventRouterNode.FINALIZE: EventRouterNode.FINALIZE,
-            }
-        )
-        
-        # RESOLVE_AGENTS → conditional → HANDLER or FINALIZE
+        # CLASSIFY → conditional → HANDLER, FINALIZE, or END (error already finalized)
         # Combined router checks for errors and routes by event type in one step
-        self.workflow.add_conditional_edges(
-            EventRouterNode.RESOLVE_AGENTS,
+        workflow.add_conditional_edges(
+            EventRouterNode.CLASSIFY,
             agents_resolved_and_route,
             {
                 EventRouterNode.HANDLE_CHAT: EventRouterNode.HANDLE_CHAT,
@@ -256,27 +378,53 @@ class EventRouterWorkflow:
                 EventRouterNode.HANDLE_REACTIONS_VISIBLE: EventRouterNode.HANDLE_REACTIONS_VISIBLE,
                 EventRouterNode.HANDLE_CARD_SELECTION: EventRouterNode.HANDLE_CARD_SELECTION,
                 EventRouterNode.FINALIZE: EventRouterNode.FINALIZE,
+                END: END,
             }
         )
         
         # All handlers go to FINALIZE
-        self.workflow.add_edge(EventRouterNode.HANDLE_CHAT, EventRouterNode.FINALIZE)
-        self.workflow.add_edge(EventRouterNode.HANDLE_GAME_STATE, EventRouterNode.FINALIZE)
-        self.workflow.add_edge(EventRouterNode.HANDLE_PLAYER_ACTION, EventRouterNode.FINALIZE)
-        self.workflow.add_edge(EventRouterNode.HANDLE_SUPERVISOR, EventRouterNode.FINALIZE)
-        self.workflow.add_edge(EventRouterNode.HANDLE_PROFILE_SYNC, EventRouterNode.FINALIZE)
-        self.workflow.add_edge(EventRouterNode.HANDLE_BROADCAST, EventRouterNode.FINALIZE)
+        workflow.add_edge(EventRouterNode.HANDLE_CHAT, EventRouterNode.FINALIZE)
+        workflow.add_edge(EventRouterNode.HANDLE_GAME_STATE, EventRouterNode.FINALIZE)
+        workflow.add_edge(EventRouterNode.HANDLE_PLAYER_ACTION, EventRouterNode.FINALIZE)
+        workflow.add_edge(EventRouterNode.HANDLE_SUPERVISOR, EventRouterNode.FINALIZE)
+        workflow.add_edge(EventRouterNode.HANDLE_PROFILE_SYNC, EventRouterNode.FINALIZE)
+        workflow.add_edge(EventRouterNode.HANDLE_BROADCAST, EventRouterNode.FINALIZE)
         # Phase 2 handlers to FINALIZE
-        self.workflow.add_edge(EventRouterNode.HANDLE_PHASE_TRANSITION, EventRouterNode.FINALIZE)
-        self.workflow.add_edge(EventRouterNode.HANDLE_REACTION_REQUIRED, EventRouterNode.FINALIZE)
-        self.workflow.add_edge(EventRouterNode.HANDLE_REACTIONS_VISIBLE, EventRouterNode.FINALIZE)
-        self.workflow.add_edge(EventRouterNode.HANDLE_CARD_SELECTION, EventRouterNode.FINALIZE)
+        workflow.add_edge(EventRouterNode.HANDLE_PHASE_TRANSITION, EventRouterNode.FINALIZE)
+        workflow.add_edge(EventRouterNode.HANDLE_REACTION_REQUIRED, EventRouterNode.FINALIZE)
+        workflow.add_edge(EventRouterNode.HANDLE_REACTIONS_VISIBLE, EventRouterNode.FINALIZE)
+        workflow.add_edge(EventRouterNode.HANDLE_CARD_SELECTION, EventRouterNode.FINALIZE)
         
         # FINALIZE → END
-        self.workflow.add_edge(EventRouterNode.FINALIZE, END)
+        workflow.add_edge(EventRouterNode.FINALIZE, END)
+        
+        return workflow.compile(checkpointer=checkpointer)
+    
+    @classmethod
+    def _build_variant(cls, event_type: EventType, checkpointer=None):
+        """Build and compile the specialized HANDLER → FINALIZE graph for one event type."""
+        handler_name = _EVENT_ROUTE_TABLE[event_type]
+        
+        workflow = StateGraph(EventRouterState)
+        workflow.add_node(handler_name, _known_type_handler_node(_HANDLER_NODES[handler_name]))
+        workflow.add_node(EventRouterNode.FINALIZE, finalize_node)
         
-        # Compile with checkpointer
-        self.app = self.workflow.compile(checkpointer=self.checkpointer)
+        workflow.set_entry_point(handler_name)
+        workflow.add_conditional_edges(
+            handler_name,
+            finalize_unless_error,
+            {EventRouterNode.FINALIZE: EventRouterNode.FINALIZE, END: END},
+        )
+        workflow.add_edge(EventRouterNode.FINALIZE, END)
+        
+        return workflow.compile(checkpointer=checkpointer)
+    
+    @classmethod
+    def _get_default_checkpointer(cls) -> MemorySaver:
+        """Process-wide MemorySaver used when no checkpointer is passed."""
+        if cls._default_checkpointer is None:
+            cls._default_checkpointer = MemorySaver()
+        return cls._default_checkpointer
     
     def build_thread_id(self, game_id: str, agent_id: str = None, broadcast: bool = False) -> str:
         """
@@ -290,80 +438,113 @@ class EventRouterWorkflow:
         Returns:
             Thread ID string
         """
-        if broadcast or not agent_id:
-            return f"{game_id}:broadcast"
-        return f"{game_id}:{agent_id}"
+        return thread_id_for(game_id, None if broadcast else agent_id)
     
     def run(self, initial_state: dict, thread_id: str = None) -> dict:
         """
-        Synchronous invocation of the workflow.
+        Synchronous shim over arun() for sync callers and scripts.
+        
+        Deprecated: await arun() where an event loop is available. The run is
+        scheduled on the shared background loop (app.utils.async_runner).
+        """
+        warnings.warn(
+            f"{type(self).__name__}.run() is deprecated; await arun() instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return run_sync(self.arun(initial_state, thread_id))
+    
+    async def arun(self, initial_state: dict, thread_id: str = None) -> dict:
+        """
+        Invoke the workflow asynchronously.
         
         Args:
             initial_state: EventRouterState dict
             thread_id: Thread identifier for checkpointing.
                       If None, builds from game_id/agent_id.
             
+        Missing default keys are filled on initial_state in place.
+            
         Returns:
             Final state with response
         """
-        # Build thread_id if not provided
-        if not thread_id:
-            thread_id = self.build_thread_id(
-                game_id=initial_state.get("game_id", "unknown"),
-                agent_id=initial_state.get("target_agent_id"),
-                broadcast=initial_state.get("broadcast_to_all_agents", False),
-            )
-        
-        # Initialize default state values
-        state_with_defaults = {
-            "handler_responses": [],
-            "conversation_messages": [],
-            "events_processed_this_hour": 0,
-            "processing_complete": False,
-            **initial_state,
-        }
-        
-        return self.app.invoke(
-            state_with_defaults,
-            {"configurable": {"thread_id": thread_id}}
+        return await self.app.ainvoke(
+            _apply_state_defaults(initial_state),
+            thread_config(self._resolve_thread_id(initial_state, thread_id)),
+            durability=self.durability,
         )
     
-    async def arun(self, initial_state: dict, thread_id: str = None) -> dict:
-        """Asynchronous invocation of the workflow."""
-        if not thread_id:
-            thread_id = self.build_thread_id(
-                game_id=initial_state.get("game_id", "unknown"),
-                agent_id=initial_state.get("target_agent_id"),
-                broadcast=initial_state.get("broadcast_to_all_agents", False),
-            )
+    async def arun_known_type(
+        self,
+        event_type: EventType,
+        initial_state: dict,
+        thread_id: str = None,
+    ) -> dict:
+        """
+        Invoke the specialized graph for an event type known up front.
         
-        state_with_defaults = {
-            "handler_responses": [],
-            "conversation_messages": [],
-            "events_processed_this_hour": 0,
-            "processing_complete": False,
-            **initial_state,
-        }
+        Skips the routing step: the handler runs in the same super-step as
+        classify + resolve agents. The result matches arun() for the same
+        event.
         
-        return await self.app.ainvoke(
-            state_with_defaults,
-            {"configurable": {"thread_id": thread_id}}
+        Args:
+            event_type: The event's type (must be in the route table)
+            initial_state: EventRouterState dict; event_type is set from event_type
+            thread_id: Thread identifier for checkpointing.
+                      If None, builds from game_id/agent_id.
+            
+        Returns:
+            Final state with response
+        """
+        app = self._get_compiled(self.checkpointer, event_type)
+        initial_state["event_type"] = event_type.value
+        return await app.ainvoke(
+            _apply_state_defaults(initial_state),
+            thread_config(self._resolve_thread_id(initial_state, thread_id)),
+            durability=self.durability,
         )
     
-    def get_conversation_history(self, thread_id: str) -> list:
+    def _resolve_thread_id(self, initial_state: dict, thread_id: Optional[str]) -> str:
+        """Return thread_id, or build it from the state's game_id/agent_id."""
+        if thread_id:
+            return thread_id
+        return self.build_thread_id(
+            game_id=initial_state.get("game_id", "unknown"),
+            agent_id=initial_state.get("target_agent_id"),
+            broadcast=initial_state.get("broadcast_to_all_agents", False),
+        )
+    
+    def get_conversation_history(self, thread_id: str, include_pending: bool = False) -> list:
         """
         Get the conversation history for a thread.
         
+        By default reads the conversation_messages channel straight from the
+        latest checkpoint tuple, skipping get_state()'s snapshot reconstruction
+        (next tasks, pending writes, every channel). Writes from an unfinished
+        run are not included; pass include_pending=True to go through
+        get_state() when they matter.
+        
         Args:
             thread_id: The thread identifier
+            include_pending: If True, read via get_state() (includes pending writes)
             
         Returns:
-            List of conversation messages
+            List of conversation messages (always empty without a checkpointer)
         """
+        if self.checkpointer is None:
+            return []
+        
+        config = thread_config(thread_id)
         try:
-            state = self.app.get_state({"configurable": {"thread_id": thread_id}})
-            if state and state.values:
-                return state.values.get("conversation_messages", [])
+            if include_pending:
+                state = self.app.get_state(config)
+                if state and state.values:
+                    return state.values.get("conversation_messages", [])
+                return []
+            
+            checkpoint_tuple = self.checkpointer.get_tuple(config)
+            if checkpoint_tuple:
+                return checkpoint_tuple.checkpoint["channel_values"].get("conversation_messages", [])
         except Exception:
             pass
         return []
@@ -379,15 +560,20 @@ class EventRouterWorkflow:
 # =============================================
 # Factory Function
 # =============================================
-def create_event_router_workflow(checkpointer=None) -> EventRouterWorkflow:
+def create_event_router_workflow(
+    checkpointer: Union[BaseCheckpointSaver, Literal[False], None] = None,
+    checkpoint_mode: CheckpointMode = CheckpointMode.END_OF_WORKFLOW,
+) -> EventRouterWorkflow:
     """
     Factory function to create an EventRouterWorkflow.
     
     Args:
-        checkpointer: Optional checkpointer. If None, uses MemorySaver.
+        checkpointer: Optional checkpointer. If None, uses the shared MemorySaver;
+                     if False, runs without checkpointing.
+        checkpoint_mode: When to persist checkpoints (see CheckpointMode).
         
     Returns:
         Configured EventRouterWorkflow instance
     """
-    return EventRouterWorkflow(checkpointer=checkpointer)
+    return EventRouterWorkflow(checkpointer=checkpointer, checkpoint_mode=checkpoint_mode)
 
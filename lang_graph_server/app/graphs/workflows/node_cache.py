@@ -0,0 +1,61 @@
+"""
+Node Cache Policies.
+
+Helpers for LangGraph node-level caching. A cached node is skipped when it
+sees the same key again within the TTL, and its previous writes are replayed
+instead. This saves repeat LLM calls on replays and checkpoint resumes.
+
+Keys are built from only the state fields a node reads. Workflow outputs
+written by earlier nodes stay out of the key unless the node consumes them.
+
+Cached writes are stored through the LangGraph serde, which only revives
+registered types; app enums that appear in cached writes are listed in
+_CACHED_ENUM_TYPES so they load back as members without a warning.
+"""
+
+import hashlib
+from typing import Iterable
+
+from langgraph.cache.memory import InMemoryCache
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.types import CachePolicy
+
+from app.constants import CoupAction
+
+
+# Seconds a cached node result stays valid
+DEFAULT_NODE_CACHE_TTL = 300
+
+# Enums written by cached nodes (chat ANALYZE: message_analysis.mentions_action)
+_CACHED_ENUM_TYPES = (CoupAction,)
+
+
+def state_slice_cache_policy(
+    fields: Iterable[str],
+    ttl: int = DEFAULT_NODE_CACHE_TTL,
+) -> CachePolicy:
+    """
+    Build a CachePolicy keyed on a fixed slice of the node's input state.
+    
+    Args:
+        fields: State keys the node reads (missing keys hash as None)
+        ttl: Seconds before a cached result expires
+    
+    Returns:
+        CachePolicy for workflow.add_node(..., cache_policy=...)
+    """
+    fields = tuple(fields)
+    
+    def key_func(state) -> str:
+        values = tuple(state.get(field) for field in fields)
+        return hashlib.sha1(repr(values).encode()).hexdigest()
+    
+    return CachePolicy(key_func=key_func, ttl=ttl)
+
+
+def create_node_cache() -> InMemoryCache:
+    """Create the in-process cache passed to compile(cache=...)."""
+    serde = JsonPlusSerializer(
+        allowed_msgpack_modules=[(t.__module__, t.__name__) for t in _CACHED_ENUM_TYPES]
+    )
+    return InMemoryCache(serde=serde)
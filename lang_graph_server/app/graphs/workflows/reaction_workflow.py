@@ -13,6 +13,9 @@ Flow:
     6. Maybe Chat -> Optionally generate chat about reactions
     7. Generate Chat -> If chatting, create the message
 
+Steps 1-5 are strictly linear, so they run inside one graph node
+(ReactionNode.PREPARE). The diagram shows the logical stages.
+
 ```
                     ┌──────────────────┐
                     │  Analyze Actions │
@@ -47,11 +50,15 @@ Flow:
 ```
 """
 
+import warnings
 from typing import Any, Dict, Literal
 
 from langgraph.graph import END, StateGraph
 from langgraph.checkpoint.base import BaseCheckpointSaver
 
+from app.constants import CHECKPOINT_DURABILITY, CheckpointMode
+from app.graphs.workflows.compiled_graph_cache import CompiledGraphCache
+from app.graphs.workflows.run_config import thread_config
 from app.nodes.coup_agent.reaction_nodes import (
     ReactionWorkflowState,
     analyze_actions_node,
@@ -62,6 +69,7 @@ from app.nodes.coup_agent.reaction_nodes import (
     decide_chat_about_reactions_node,
     generate_reaction_chat_node,
 )
+from app.utils.async_runner import run_sync
 
 
 # =============================================
@@ -70,35 +78,64 @@ from app.nodes.coup_agent.reaction_nodes import (
 
 class ReactionNode:
     """Node names for the reaction workflow."""
-    ANALYZE = "analyze_actions"
-    DECIDE = "decide_reactions"
-    SET_SPECIFIC = "set_specific_reactions"
-    SET_CONDITIONAL = "set_conditional_reactions"
-    UPDATE_DB = "update_db"
+    PREPARE = "analyze_decide_and_set"
     DECIDE_CHAT = "decide_chat"
     GENERATE_CHAT = "generate_chat"
 
 
+# =============================================
+# Fused Node
+# =============================================
+
+# Linear stages run in order inside PREPARE (analyze -> decide -> set -> persist)
+_PREPARE_STAGES = (
+    analyze_actions_node,
+    decide_reactions_node,
+    set_specific_reactions_node,
+    set_conditional_reactions_node,
+    update_db_node,
+)
+
+
+def analyze_decide_and_set_node(state: ReactionWorkflowState) -> Dict[str, Any]:
+    """
+    Run the five linear reaction stages as one node.
+    
+    Each stage sees the previous stages' updates through a local copy of the
+    state. Returns the merged updates, so the graph pays for one super-step
+    (and at most one checkpoint write) instead of five.
+    """
+    local_state = dict(state)
+    updates: Dict[str, Any] = {}
+    for stage in _PREPARE_STAGES:
+        stage_update = stage(local_state)
+        local_state.update(stage_update)
+        updates.update(stage_update)
+    return updates
+
+
 # =============================================
 # Router Functions
 # =============================================
 
+# Route table indexed by should_chat_about_reactions: (False, True)
+_CHAT_ROUTE = (END, ReactionNode.GENERATE_CHAT)
+
+
 def should_generate_chat_router(
     state: ReactionWorkflowState
 ) -> Literal["generate_chat", "__end__"]:
     """
     Route based on whether agent should chat about reactions.
     """
-    if state.get("should_chat_about_reactions", False):
-        return ReactionNode.GENERATE_CHAT
-    return END
+    return _CHAT_ROUTE[bool(state.get("should_chat_about_reactions", False))]
 
 
 # =============================================
 # Workflow Class
 # =============================================
 
-class ReactionWorkflow:
+class ReactionWorkflow(CompiledGraphCache):
     """
     LangGraph workflow for Phase 2 reaction decisions.
     
@@ -110,35 +147,37 @@ class ReactionWorkflow:
     
     Args:
         checkpointer: Optional checkpointer for conversation persistence
+        checkpoint_mode: END_OF_WORKFLOW (default) writes once when the run
+                         finishes, so no checkpoint futures are queued between
+                         nodes; PER_STEP writes after every node
     """
     
-    def __init__(self, checkpointer: BaseCheckpointSaver = None):
+    def __init__(
+        self,
+        checkpointer: BaseCheckpointSaver = None,
+        checkpoint_mode: CheckpointMode = CheckpointMode.END_OF_WORKFLOW,
+    ):
         self.checkpointer = checkpointer
-        self.workflow = self._build_workflow()
-        self.app = self.workflow.compile(checkpointer=checkpointer)
+        self.durability = CHECKPOINT_DURABILITY[checkpoint_mode]
+        # Compiled once per checkpointer (see CompiledGraphCache)
+        self.app = self._get_compiled(checkpointer)
+        self.workflow = self.app.builder
     
-    def _build_workflow(self) -> StateGraph:
-        """Build the LangGraph state graph."""
+    @classmethod
+    def _build(cls, checkpointer: BaseCheckpointSaver = None):
+        """Build the LangGraph state graph and compile it."""
         workflow = StateGraph(ReactionWorkflowState)
         
         # Add nodes
-        workflow.add_node(ReactionNode.ANALYZE, analyze_actions_node)
-        workflow.add_node(ReactionNode.DECIDE, decide_reactions_node)
-        workflow.add_node(ReactionNode.SET_SPECIFIC, set_specific_reactions_node)
-        workflow.add_node(ReactionNode.SET_CONDITIONAL, set_conditional_reactions_node)
-        workflow.add_node(ReactionNode.UPDATE_DB, update_db_node)
+        workflow.add_node(ReactionNode.PREPARE, analyze_decide_and_set_node)
         workflow.add_node(ReactionNode.DECIDE_CHAT, decide_chat_about_reactions_node)
         workflow.add_node(ReactionNode.GENERATE_CHAT, generate_reaction_chat_node)
         
         # Set entry point
-        workflow.set_entry_point(ReactionNode.ANALYZE)
+        workflow.set_entry_point(ReactionNode.PREPARE)
         
-        # Linear flow: Analyze -> Decide -> Set Specific -> Set Conditional -> Update DB
-        workflow.add_edge(ReactionNode.ANALYZE, ReactionNode.DECIDE)
-        workflow.add_edge(ReactionNode.DECIDE, ReactionNode.SET_SPECIFIC)
-        workflow.add_edge(ReactionNode.SET_SPECIFIC, ReactionNode.SET_CONDITIONAL)
-        workflow.add_edge(ReactionNode.SET_CONDITIONAL, ReactionNode.UPDATE_DB)
-        workflow.add_edge(ReactionNode.UPDATE_DB, ReactionNode.DECIDE_CHAT)
+        # Fused linear stages (Analyze -> Decide -> Set Specific -> Set Conditional -> Update DB)
+        workflow.add_edge(ReactionNode.PREPARE, ReactionNode.DECIDE_CHAT)
         
         # Conditional: Decide Chat -> Generate Chat OR End
         workflow.add_conditional_edges(
@@ -153,7 +192,7 @@ class ReactionWorkflow:
         # Generate Chat -> End
         workflow.add_edge(ReactionNode.GENERATE_CHAT, END)
         
-        return workflow
+        return workflow.compile(checkpointer=checkpointer)
     
     def run(
         self,
@@ -161,18 +200,17 @@ class ReactionWorkflow:
         thread_id: str = "default"
     ) -> Dict[str, Any]:
         """
-        Run the reaction workflow.
+        Synchronous shim over arun() for sync callers and scripts.
         
-        Args:
-            initial_state: ReactionWorkflowState with agent context and
-                          actions_requiring_my_reaction populated
-            thread_id: Thread ID for checkpointing (format: "{game_id}:{agent_id}")
-        
-        Returns:
-            Final state with pending_reactions and optional reaction_chat_content
+        Deprecated: await arun() where an event loop is available. The run is
+        scheduled on the shared background loop (app.utils.async_runner).
         """
-        config = {"configurable": {"thread_id": thread_id}}
-        return self.app.invoke(initial_state, config)
+        warnings.warn(
+            f"{type(self).__name__}.run() is deprecated; await arun() instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return run_sync(self.arun(initial_state, thread_id))
     
     async def arun(
         self,
@@ -183,14 +221,14 @@ class ReactionWorkflow:
         Run the reaction workflow asynchronously.
         
         Args:
-            initial_state: ReactionWorkflowState with agent context
-            thread_id: Thread ID for checkpointing
+            initial_state: ReactionWorkflowState with agent context and
+                          actions_requiring_my_reaction populated
+            thread_id: Thread ID for checkpointing (format: "{game_id}:{agent_id}")
         
         Returns:
             Final state with pending_reactions and optional reaction_chat_content
         """
-        config = {"configurable": {"thread_id": thread_id}}
-        return await self.app.ainvoke(initial_state, config)
+        return await self.app.ainvoke(initial_state, thread_config(thread_id), durability=self.durability)
 
 
 # =============================================
@@ -0,0 +1,39 @@
+"""
+Run Config Cache.
+
+Thread IDs and shared RunnableConfig dicts for workflow invocations.
+
+Every checkpoint thread ID is built by thread_id_for, so the formats live
+in one place. Thread IDs are bounded per process, so each thread's config
+is built once and reused instead of allocating a nested dict on every run.
+
+LangGraph copies the config (and its "configurable" dict) in ensure_config
+before adding run-scoped keys, so the cached dicts are never mutated.
+Callers must treat them as read-only too.
+"""
+
+import functools
+from typing import Optional
+
+
+def thread_id_for(game_id: str, agent_id: Optional[str] = None, scope: Optional[str] = None) -> str:
+    """
+    Return the checkpoint thread ID for a game/agent pair.
+    
+    Formats:
+        "{game_id}:{agent_id}"          single agent
+        "{game_id}:broadcast"           no agent_id (game-wide broadcast)
+        "{game_id}:{agent_id}:{scope}"  an agent's thread for one workflow
+                                        (e.g. scope="broadcast" for commentary)
+    """
+    if not agent_id:
+        return f"{game_id}:broadcast"
+    if scope:
+        return f"{game_id}:{agent_id}:{scope}"
+    return f"{game_id}:{agent_id}"
+
+
+@functools.lru_cache(maxsize=4096)
+def thread_config(thread_id: str) -> dict:
+    """Return the shared {"configurable": {"thread_id": ...}} config for a thread."""
+    return {"configurable": {"thread_id": thread_id}}
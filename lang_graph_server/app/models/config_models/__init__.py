@@ -1,38 +1,65 @@
 """
 Configuration Models.
 
-Frozen dataclasses that define immutable configuration for game mechanics.
-These are the single source of truth for action costs, platform limits, etc.
+Frozen, slotted dataclasses that define immutable configuration for game
+mechanics. These are the single source of truth for action costs, platform
+limits, etc. They are built once at import and read on every decision, so
+slots=True keeps instances dict-free and attribute reads on the fast path.
+
+Re-exports are resolved lazily (PEP 562): importing one submodule, or this
+package, no longer builds every config table. Each name is imported from its
+submodule on first access and then cached in this module's globals.
 """
 
-from app.models.config_models.action_configs import (
-    ActionConfig,
-    ACTION_CONFIGS,
-    get_action_config,
-)
-from app.models.config_models.platform_configs import (
-    PlatformConfig,
-    PLATFORM_CONFIGS,
-    get_platform_config,
-)
-from app.models.config_models.reaction_configs import (
-    ConditionalRuleConfig,
-    CONDITIONAL_RULE_CONFIGS,
-    get_rule_config,
-)
-
-__all__ = [
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.models.config_models.action_configs import (
+        ActionConfig,
+        ACTION_CONFIGS,
+        get_action_config,
+    )
+    from app.models.config_models.platform_configs import (
+        PlatformConfig,
+        PLATFORM_CONFIGS,
+        get_platform_config,
+    )
+    from app.models.config_models.reaction_configs import (
+        ConditionalRuleConfig,
+        CONDITIONAL_RULE_CONFIGS,
+        get_rule_config,
+    )
+
+# Public name → submodule that defines it
+_LAZY_EXPORTS = {
     # Action configs
-    "ActionConfig",
-    "ACTION_CONFIGS",
-    "get_action_config",
+    "ActionConfig": "action_configs",
+    "ACTION_CONFIGS": "action_configs",
+    "get_action_config": "action_configs",
     # Platform configs
-    "PlatformConfig",
-    "PLATFORM_CONFIGS",
-    "get_platform_config",
+    "PlatformConfig": "platform_configs",
+    "PLATFORM_CONFIGS": "platform_configs",
+    "get_platform_config": "platform_configs",
     # Reaction configs
-    "ConditionalRuleConfig",
-    "CONDITIONAL_RULE_CONFIGS",
-    "get_rule_config",
-]
+    "ConditionalRuleConfig": "reaction_configs",
+    "CONDITIONAL_RULE_CONFIGS": "reaction_configs",
+    "get_rule_config": "reaction_configs",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import a re-exported name from its submodule on first access."""
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
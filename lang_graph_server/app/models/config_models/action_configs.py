@@ -5,13 +5,15 @@ Immutable configuration for Coup actions including base costs and upgrade option
 This is the single source of truth for action costs.
 """
 
-from dataclasses import dataclass
-from typing import Dict, Optional
+import functools
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 from app.constants import CoupAction, UpgradeType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActionConfig:
     """Immutable configuration for a Coup action."""
     action: CoupAction
@@ -19,11 +21,11 @@ class ActionConfig:
     can_upgrade: bool
     upgrade_type: Optional[UpgradeType] = None
     upgrade_cost: int = 0
+    # Total cost when upgraded (base + upgrade); derived once in __post_init__
+    total_upgraded_cost: int = field(init=False)
     
-    @property
-    def total_upgraded_cost(self) -> int:
-        """Total cost when upgraded (base + upgrade)."""
-        return self.base_cost + self.upgrade_cost
+    def __post_init__(self):
+        object.__setattr__(self, "total_upgraded_cost", self.base_cost + self.upgrade_cost)
     
     def can_afford(self, coins: int) -> bool:
         """Check if agent can afford the base action."""
@@ -35,7 +37,7 @@ class ActionConfig:
 
 
 # Single source of truth for all action configurations
-ACTION_CONFIGS: Dict[CoupAction, ActionConfig] = {
+_ACTION_CONFIGS: Dict[CoupAction, ActionConfig] = {
     CoupAction.ASSASSINATE: ActionConfig(
         action=CoupAction.ASSASSINATE,
         base_cost=3,
@@ -79,6 +81,16 @@ ACTION_CONFIGS: Dict[CoupAction, ActionConfig] = {
     ),
 }
 
+# Public read-only view; lookups go through the dict's bound get
+ACTION_CONFIGS: Mapping[CoupAction, ActionConfig] = MappingProxyType(_ACTION_CONFIGS)
+_action_config_get = _ACTION_CONFIGS.get
+
+
+@functools.lru_cache(maxsize=None)
+def _default_action_config(action: CoupAction) -> ActionConfig:
+    """Default non-upgradeable config for an unmapped action, built once per action."""
+    return ActionConfig(action=action, base_cost=0, can_upgrade=False)
+
 
 def get_action_config(action: CoupAction) -> ActionConfig:
     """
@@ -86,8 +98,5 @@ def get_action_config(action: CoupAction) -> ActionConfig:
     
     Returns a default non-upgradeable config if action not found.
     """
-    return ACTION_CONFIGS.get(
-        action,
-        ActionConfig(action=action, base_cost=0, can_upgrade=False)
-    )
+    return _action_config_get(action) or _default_action_config(action)
 
@@ -5,13 +5,14 @@ Immutable configuration for social media platforms including character limits,
 markdown support, and mention formatting.
 """
 
-from dataclasses import dataclass
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 from app.constants import SocialMediaPlatform
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlatformConfig:
     """Immutable configuration for a social media platform."""
     platform: SocialMediaPlatform
@@ -24,9 +25,19 @@ class PlatformConfig:
     supports_threads: bool
     newline_style: str  # "\n" or "<br>" for HTML
     truncation_suffix: str  # e.g., "..." or "…"
+    # Room left for content once truncation_suffix is appended (None = unlimited);
+    # derived once in __post_init__
+    effective_max_chars: Optional[int] = field(init=False)
+    
+    def __post_init__(self):
+        effective_max_chars = (
+            None if self.max_chars is None
+            else self.max_chars - len(self.truncation_suffix)
+        )
+        object.__setattr__(self, "effective_max_chars", effective_max_chars)
 
 
-PLATFORM_CONFIGS: Dict[SocialMediaPlatform, PlatformConfig] = {
+_PLATFORM_CONFIGS: Dict[SocialMediaPlatform, PlatformConfig] = {
     SocialMediaPlatform.DISCORD: PlatformConfig(
         platform=SocialMediaPlatform.DISCORD,
         max_chars=2000,
@@ -101,11 +112,13 @@ PLATFORM_CONFIGS: Dict[SocialMediaPlatform, PlatformConfig] = {
     ),
 }
 
+# Public read-only view; lookups go through the dict's bound get
+PLATFORM_CONFIGS: Mapping[SocialMediaPlatform, PlatformConfig] = MappingProxyType(_PLATFORM_CONFIGS)
+_platform_config_get = _PLATFORM_CONFIGS.get
+_DEFAULT_PLATFORM_CONFIG = _PLATFORM_CONFIGS[SocialMediaPlatform.DEFUALT]
+
 
 def get_platform_config(platform: SocialMediaPlatform) -> PlatformConfig:
     """Get configuration for a platform."""
-    return PLATFORM_CONFIGS.get(
-        platform,
-        PLATFORM_CONFIGS[SocialMediaPlatform.DEFUALT]
-    )
+    return _platform_config_get(platform, _DEFAULT_PLATFORM_CONFIG)
 
@@ -6,12 +6,13 @@ These define automatic reactions that trigger when matching actions occur.
 """
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 from app.constants import ConditionalRuleType, InfluenceCard, ReactionType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConditionalRuleConfig:
     """Configuration for a conditional rule."""
     rule_type: ConditionalRuleType
@@ -24,7 +25,7 @@ class ConditionalRuleConfig:
 
 
 # Single source of truth for all conditional rule configurations
-CONDITIONAL_RULE_CONFIGS: Dict[ConditionalRuleType, ConditionalRuleConfig] = {
+_CONDITIONAL_RULE_CONFIGS: Dict[ConditionalRuleType, ConditionalRuleConfig] = {
     # Challenge rules
     ConditionalRuleType.CHALLENGE_ANY_DUKE: ConditionalRuleConfig(
         rule_type=ConditionalRuleType.CHALLENGE_ANY_DUKE,
@@ -86,8 +87,14 @@ CONDITIONAL_RULE_CONFIGS: Dict[ConditionalRuleType, ConditionalRuleConfig] = {
     ),
 }
 
+# Public read-only view; lookups go through the dict's bound get
+CONDITIONAL_RULE_CONFIGS: Mapping[ConditionalRuleType, ConditionalRuleConfig] = MappingProxyType(
+    _CONDITIONAL_RULE_CONFIGS
+)
+_rule_config_get = _CONDITIONAL_RULE_CONFIGS.get
+
 
 def get_rule_config(rule_type: ConditionalRuleType) -> Optional[ConditionalRuleConfig]:
     """Get the configuration for a conditional rule."""
-    return CONDITIONAL_RULE_CONFIGS.get(rule_type)
+    return _rule_config_get(rule_type)
 
@@ -177,9 +177,16 @@ def create_broadcast_commentary_state(
         
     Returns:
         Initialized BroadcastCommentaryState
+    
+    The result dicts are shared (not copied) across every agent's state for
+    the same broadcast; nodes only read them.
     """
     from app.services.message_counter_service import MessageCounterService
     
+    # Read each agent attribute once
+    agent_id = agent.agent_id
+    hand = agent.get_hand()
+    
     # Check if agent can send a mixed message (commentary goes to all)
     can_comment = agent.can_send_message(MessageTargetType.MIXED)
     messages_remaining = MessageCounterService.get_remaining(
@@ -187,22 +194,18 @@ def create_broadcast_commentary_state(
     )
     
     # Check if agent was eliminated this round
-    was_eliminated = False
-    for result in results:
-        if result.get("eliminated_player") == agent.agent_id:
-            was_eliminated = True
-            break
+    was_eliminated = any(result.get("eliminated_player") == agent_id for result in results)
     
     return BroadcastCommentaryState(
         # Identity
-        agent_id=agent.agent_id,
+        agent_id=agent_id,
         game_id=agent.game_id,
         agent_name=agent.name,
         agent_personality=agent.personality,
         agent_play_style=agent.play_style,
         
         # Results
-        results=[GameResult(**r) for r in results],
+        results=list(results),
         result_count=len(results),
         players_remaining=players_remaining,
         is_game_over=is_game_over,
@@ -210,7 +213,7 @@ def create_broadcast_commentary_state(
         
         # Agent state
         coins=agent.get_coins(),
-        hand=agent.get_hand(),
+        hand=hand,
         revealed=agent.get_revealed(),
         is_alive=agent.is_alive(),
         was_eliminated_this_round=was_eliminated,
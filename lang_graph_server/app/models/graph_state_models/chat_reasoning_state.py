@@ -12,6 +12,8 @@ The workflow:
 5. Optionally decides to update pending action
 """
 
+from __future__ import annotations
+
 from datetime import datetime
 from typing import Dict, List, Optional, TypedDict
 
@@ -26,6 +28,7 @@ from app.models.graph_state_models.hourly_coup_state import (
     ChatMessage,
     VisiblePendingAction,
 )
+from app.services.message_counter_service import MessageCounterService
 
 
 class MessageAnalysis(TypedDict, total=False):
@@ -184,20 +187,15 @@ def create_chat_reasoning_state(
     Returns:
         Initialized ChatReasoningState
     """
-    from app.constants import MESSAGE_LIMITS
-    
     # Determine target type for response
     if sender_is_llm:
         target_type = MessageTargetType.LLM_ONLY
     else:
         target_type = MessageTargetType.HUMAN_ONLY
     
-    # Check if can respond
-    can_respond = agent.can_send_message(target_type)
-    
-    # Get remaining messages
-    from app.services.message_counter_service import MessageCounterService
+    # One counter read: the agent can respond iff it has quota left
     messages_remaining = MessageCounterService.get_remaining(agent.state, target_type)
+    can_respond = messages_remaining > 0
     
     return ChatReasoningState(
         # Identity
@@ -6,6 +6,8 @@ public table information needed to decide an action or reaction. A separate
 referee/game-engine should construct this state view and apply the results.
 """
 
+from __future__ import annotations
+
 from typing import Dict, List, Optional, TypedDict
 
 from app.constants import (
@@ -5,6 +5,8 @@ State for the event classification and routing workflow.
 Tracks incoming events, classification results, and handler outputs.
 """
 
+from __future__ import annotations
+
 from datetime import datetime
 from typing import Any, Dict, List, Optional, TypedDict
 
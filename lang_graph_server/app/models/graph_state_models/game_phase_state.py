@@ -14,6 +14,8 @@ Game Flow (91 minutes per round):
 Note: GamePhase enum is now in app.constants for centralized access.
 """
 
+from __future__ import annotations
+
 from typing import List, Optional, TypedDict
 
 from app.constants import CoupAction, GamePhase, InfluenceCard, ReactionType
@@ -10,8 +10,10 @@ Extends CoupAgentState with hourly-specific tracking:
 This state is per-agent - each LLM agent in a game has their own instance.
 """
 
+from __future__ import annotations
+
 from datetime import datetime
-from typing import Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from app.constants import (
     CoupAction,
@@ -177,6 +179,54 @@ class HourlyCoupAgentState(CoupAgentState, total=False):
 # Factory Functions
 # =============================================
 
+# Per-hour scalar fields, shared by a fresh state and an hourly reset
+_HOURLY_RESET_SCALARS: Dict[str, Any] = {
+    # Message counters (reset each hour)
+    "llm_messages_sent": 0,
+    "human_messages_sent": 0,
+    "mixed_messages_sent": 0,
+    
+    # Phase tracking
+    "current_phase": GamePhase.PHASE1_ACTIONS,
+    
+    # Phase 1: Pending action
+    "pending_action": None,
+    "pending_upgrade": None,
+    "action_locked": False,
+    
+    # Phase 2: Pending reactions
+    "pending_card_selection": None,
+    "reactions_locked": False,
+    
+    # Hour tracking
+    "minutes_remaining": 60,
+}
+
+# Per-hour list fields; each gets a fresh list (callers append to them)
+_HOURLY_RESET_LISTS = (
+    "pending_reactions",
+    "actions_requiring_my_reaction",
+    "visible_pending_reactions",
+    "chat_history",
+)
+
+# Scalar fields of a brand-new state, copied once per agent spawn
+_INITIAL_STATE_TEMPLATE: Dict[str, Any] = {
+    **_HOURLY_RESET_SCALARS,
+    
+    # Platform context
+    "current_event_platform": SocialMediaPlatform.DEFUALT,
+}
+
+# List fields of a brand-new state, beyond the hourly ones
+_INITIAL_STATE_LISTS = _HOURLY_RESET_LISTS + (
+    "revealed",
+    "public_events",
+    "persuasion_targets",
+    "visible_pending_actions",
+)
+
+
 def create_initial_hourly_state(
     agent_id: str,
     game_id: str,
@@ -187,6 +237,9 @@ def create_initial_hourly_state(
     """
     Create a fresh hourly state for an agent at the start of a game/hour.
     
+    Copies the module-level scalar template and fills in the caller-specific
+    fields plus fresh mutable containers.
+    
     Args:
         agent_id: Unique identifier for this agent
         game_id: Current game ID
@@ -197,82 +250,43 @@ def create_initial_hourly_state(
     Returns:
         Initialized HourlyCoupAgentState
     """
-    return HourlyCoupAgentState(
-        # Identity
-        me=agent_id,
-        coins=coins,
-        hand=hand or [],
-        revealed=[],
-        players_alive=players_alive or [],
-        public_events=[],
-        
-        # Message counters (reset each hour)
-        llm_messages_sent=0,
-        human_messages_sent=0,
-        mixed_messages_sent=0,
-        
-        # Phase tracking
-        current_phase=GamePhase.PHASE1_ACTIONS,
-        
-        # Phase 1: Pending action
-        pending_action=None,
-        pending_upgrade=None,
-        action_locked=False,
-        
-        # Phase 2: Pending reactions
-        pending_reactions=[],
-        pending_card_selection=None,
-        reactions_locked=False,
-        actions_requiring_my_reaction=[],
-        visible_pending_reactions=[],
-        
-        # Chat
-        chat_history=[],
-        persuasion_targets=[],
-        
-        # Hour tracking
-        hour_start_time=datetime.now(),
-        minutes_remaining=60,
-        
-        # Visible state
-        visible_pending_actions=[],
-        
-        # Platform context
-        current_event_platform=SocialMediaPlatform.DEFUALT,
-        player_platforms={},
-    )
+    state = _INITIAL_STATE_TEMPLATE.copy()
+    for key in _INITIAL_STATE_LISTS:
+        state[key] = []
+    
+    # Identity
+    state["me"] = agent_id
+    state["coins"] = coins
+    state["hand"] = hand or []
+    state["players_alive"] = players_alive or []
+    
+    # Hour tracking
+    state["hour_start_time"] = datetime.now()
+    
+    # Platform context
+    state["player_platforms"] = {}
+    
+    return state
 
 
-def reset_hourly_counters(state: HourlyCoupAgentState) -> HourlyCoupAgentState:
+def reset_hourly_counters(
+    state: HourlyCoupAgentState,
+    hour_start: Optional[datetime] = None,
+) -> HourlyCoupAgentState:
     """
     Reset message counters and action/reaction state at the start of a new hour.
     
     Called by AgentRegistry at hour boundaries.
-    """
-    # Message counters
-    state["llm_messages_sent"] = 0
-    state["human_messages_sent"] = 0
-    state["mixed_messages_sent"] = 0
-    
-    # Phase tracking
-    state["current_phase"] = GamePhase.PHASE1_ACTIONS
-    
-    # Phase 1: Pending action
-    state["pending_action"] = None
-    state["pending_upgrade"] = None
-    state["action_locked"] = False
-    
-    # Phase 2: Pending reactions
-    state["pending_reactions"] = []
-    state["pending_card_selection"] = None
-    state["reactions_locked"] = False
-    state["actions_requiring_my_reaction"] = []
-    state["visible_pending_reactions"] = []
     
-    # Hour tracking
-    state["hour_start_time"] = datetime.now()
-    state["minutes_remaining"] = 60
-    state["chat_history"] = []
+    Args:
+        state: The agent's state (reset in place and returned)
+        hour_start: Start time of the new hour. Batch resets pass one
+                    timestamp for every agent; defaults to now.
+    """
+    state.update(_HOURLY_RESET_SCALARS)
+    for key in _HOURLY_RESET_LISTS:
+        state[key] = []
+    state["hour_start_time"] = hour_start or datetime.now()
     
     return state
 
@@ -6,7 +6,7 @@ Flask-RESTX models for request/response validation and documentation.
 
 from flask_restx import fields
 
-from app.constants import EventType, SocialMediaPlatform
+from app.constants import EVENT_TYPE_BY_VALUE, SOCIAL_MEDIA_PLATFORM_BY_VALUE
 
 
 def register_coup_event_models(namespace):
@@ -24,12 +24,12 @@ def register_coup_event_models(namespace):
     incoming_event_model = namespace.model('IncomingEvent', {
         'event_type': fields.String(
             required=True,
-            enum=[e.value for e in EventType],
+            enum=list(EVENT_TYPE_BY_VALUE),
             description='Type of event'
         ),
         'source_platform': fields.String(
             required=True,
-            enum=[p.value for p in SocialMediaPlatform],
+            enum=list(SOCIAL_MEDIA_PLATFORM_BY_VALUE),
             description='Platform the event originated from'
         ),
         'sender_id': fields.String(required=True, description='Player/sender identifier'),
@@ -3,8 +3,10 @@ Chat Reasoning Nodes for Coup LLM Agents.
 
 Nodes for the chat reasoning workflow:
 1. analyze_message_node - Analyze incoming message intent and relevance
+   (aanalyze_message_node is the async twin used by ainvoke)
 2. decide_response_node - Decide whether to respond
 3. generate_response_node - Generate the actual response
+   (agenerate_response_node is the async twin used by ainvoke)
 4. decide_action_update_node - Decide if pending action should change
 
 Analysis Mode:
@@ -14,10 +16,17 @@ Analysis Mode:
 - 0.7-1.0: LLM primary (more nuanced, expensive)
 """
 
+import functools
 import logging
 from typing import Any, Dict, Optional, Tuple
 
-from app.constants import AgentModulator, CoupAction, MessageTargetType, SocialMediaPlatform
+from app.constants import (
+    AgentModulator,
+    CoupAction,
+    MessageTargetType,
+    SOCIAL_MEDIA_PLATFORM_BY_VALUE,
+    SocialMediaPlatform,
+)
 from app.models.graph_state_models.chat_reasoning_state import (
     ChatReasoningState,
     MessageAnalysis,
@@ -40,6 +49,50 @@ LLM_RELIANCE_THRESHOLD_LOW = 0.3   # Below this: pure heuristics
 LLM_RELIANCE_THRESHOLD_HIGH = 0.7  # Above this: LLM primary
 
 
+# =============================================
+# Heuristic Keyword Tables
+# =============================================
+# Built once at import; the heuristics run on every incoming message.
+_QUESTION_WORDS = ("?", "who", "what", "why", "how", "do you", "are you", "did you")
+_ACCUSATION_WORDS = ("liar", "lying", "bluff", "fake", "don't have", "doesn't have")
+_PERSUASION_WORDS = ("should", "let's", "we could", "trust me", "work together", "alliance")
+_INTENT_THREAT_WORDS = ("coup", "assassinate", "target", "next", "watch out", "coming for")
+_GAME_TALK_WORDS = ("tax", "steal", "foreign aid", "duke", "captain", "assassin")
+
+_ACTION_KEYWORDS = (
+    (CoupAction.INCOME, ("income",)),
+    (CoupAction.FOREIGN_AID, ("foreign aid", "foreign_aid")),
+    (CoupAction.COUP, ("coup",)),
+    (CoupAction.TAX, ("tax", "duke")),
+    (CoupAction.ASSASSINATE, ("assassinate", "assassin")),
+    (CoupAction.STEAL, ("steal", "captain")),
+    (CoupAction.EXCHANGE, ("exchange", "ambassador", "swap")),
+)
+
+_THREAT_SCORE_WORDS = ("coup", "assassinate", "target", "kill", "eliminate", "coming for")
+_OPPORTUNITY_WORDS = ("alliance", "together", "trust", "help", "team up")
+
+_HOSTILE_WORDS = ("liar", "hate", "stupid", "idiot", "kill")
+_FRIENDLY_WORDS = ("friend", "ally", "together", "help", "thanks", "haha", "lol")
+_SUSPICIOUS_WORDS = ("really", "sure about that", "doubt", "suspicious", "hmm")
+
+
+# =============================================
+# Prompt Formatting
+# =============================================
+
+def _prompt_list(values) -> str:
+    """
+    Render a list (cards, player IDs) for a prompt as "a, b, c".
+    
+    Interpolating the list itself emits its repr (brackets, quotes, enum
+    reprs), which is pure token overhead for the LLM.
+    """
+    if not values:
+        return "none"
+    return ", ".join(str(getattr(v, "value", v)) for v in values)
+
+
 # =============================================
 # Analyze Message Node
 # =============================================
@@ -56,6 +109,43 @@ def analyze_message_node(state: ChatReasoningState) -> Dict[str, Any]:
     Returns:
         Dict with message_analysis and analysis_source
     """
+    llm_reliance, heuristic_analysis = _prepare_analysis(state)
+    if llm_reliance < LLM_RELIANCE_THRESHOLD_LOW:
+        return _finish_analysis(state, llm_reliance, heuristic_analysis, None)
+    
+    # Try LLM analysis for medium/high reliance
+    llm_analysis = None
+    try:
+        llm_analysis = _run_llm_analysis(state)
+    except Exception as e:
+        # LLM failed - fall back to heuristics
+        logger.warning(f"[CHAT-FLOW] LLM analysis failed: {e}")
+    
+    return _finish_analysis(state, llm_reliance, heuristic_analysis, llm_analysis)
+
+
+async def aanalyze_message_node(state: ChatReasoningState) -> Dict[str, Any]:
+    """
+    Async variant of analyze_message_node.
+    
+    Awaits the LLM call (ainvoke) instead of blocking the event loop,
+    so concurrent workflow runs overlap their network round-trips.
+    """
+    llm_reliance, heuristic_analysis = _prepare_analysis(state)
+    if llm_reliance < LLM_RELIANCE_THRESHOLD_LOW:
+        return _finish_analysis(state, llm_reliance, heuristic_analysis, None)
+    
+    llm_analysis = None
+    try:
+        llm_analysis = await _arun_llm_analysis(state)
+    except Exception as e:
+        logger.warning(f"[CHAT-FLOW] LLM analysis failed: {e}")
+    
+    return _finish_analysis(state, llm_reliance, heuristic_analysis, llm_analysis)
+
+
+def _prepare_analysis(state: ChatReasoningState) -> Tuple[float, MessageAnalysis]:
+    """Log the incoming message, read LLM_RELIANCE and run the heuristic baseline."""
     agent_id = state.get("agent_id", "unknown")
     incoming = state.get("incoming_message", {})
     content = incoming.get("content", "")[:50]
@@ -70,7 +160,17 @@ def analyze_message_node(state: ChatReasoningState) -> Dict[str, Any]:
     logger.debug(f"[CHAT-FLOW] LLM reliance: {llm_reliance}")
     
     # Always run heuristics (fast baseline)
-    heuristic_analysis = _run_heuristic_analysis(state)
+    return llm_reliance, _run_heuristic_analysis(state)
+
+
+def _finish_analysis(
+    state: ChatReasoningState,
+    llm_reliance: float,
+    heuristic_analysis: MessageAnalysis,
+    llm_analysis: Optional[MessageAnalysis],
+) -> Dict[str, Any]:
+    """Pick or blend the heuristic/LLM analyses according to LLM_RELIANCE."""
+    agent_id = state.get("agent_id", "unknown")
     
     # Determine analysis mode based on LLM_RELIANCE
     if llm_reliance < LLM_RELIANCE_THRESHOLD_LOW:
@@ -85,14 +185,6 @@ def analyze_message_node(state: ChatReasoningState) -> Dict[str, Any]:
             "analysis_source": "heuristic",
         }
     
-    # Try LLM analysis for medium/high reliance
-    llm_analysis = None
-    try:
-        llm_analysis = _run_llm_analysis(state)
-    except Exception as e:
-        # LLM failed - fall back to heuristics
-        logger.warning(f"[CHAT-FLOW] LLM analysis failed: {e}")
-    
     if llm_analysis is None:
         # LLM unavailable or failed
         logger.info(
@@ -179,12 +271,45 @@ def _run_heuristic_analysis(state: ChatReasoningState) -> MessageAnalysis:
 
 def _run_llm_analysis(state: ChatReasoningState) -> Optional[MessageAnalysis]:
     """Run LLM-based message analysis using chat_message_analysis.md prompt."""
-    from app.extensions import LoadedLLMs, LoadedPromptTemplates
+    from app.extensions import LoadedLLMs
     
     llm = LoadedLLMs.gpt_llm
-    if not llm:
+    prompt = _build_llm_analysis_prompt(state)
+    if not llm or prompt is None:
         return None
     
+    # Invoke LLM
+    try:
+        result = llm.invoke(prompt)
+        content = result.content if hasattr(result, 'content') else str(result)
+        
+        # Parse JSON response
+        return _parse_llm_analysis(content)
+    except Exception:
+        return None
+
+
+async def _arun_llm_analysis(state: ChatReasoningState) -> Optional[MessageAnalysis]:
+    """Async variant of _run_llm_analysis (awaits llm.ainvoke)."""
+    from app.extensions import LoadedLLMs
+    
+    llm = LoadedLLMs.gpt_llm
+    prompt = _build_llm_analysis_prompt(state)
+    if not llm or prompt is None:
+        return None
+    
+    try:
+        result = await llm.ainvoke(prompt)
+        content = result.content if hasattr(result, 'content') else str(result)
+        return _parse_llm_analysis(content)
+    except Exception:
+        return None
+
+
+def _build_llm_analysis_prompt(state: ChatReasoningState) -> Optional[str]:
+    """Format the chat_message_analysis.md prompt for this state (None if missing)."""
+    from app.extensions import LoadedPromptTemplates
+    
     # Get prompt template
     prompt_template = LoadedPromptTemplates.markdown_prompt_templates.get("chat_message_analysis")
     if not prompt_template:
@@ -215,13 +340,13 @@ def _run_llm_analysis(state: ChatReasoningState) -> Optional[MessageAnalysis]:
         current_phase = current_phase.value
     
     # Format prompt
-    prompt = prompt_template.format(
+    return prompt_template.format(
         agent_name=state.get("agent_name", "Agent"),
         agent_personality=state.get("agent_personality", "neutral"),
         agent_play_style=state.get("agent_play_style", "balanced"),
         coins=state.get("coins", 0),
-        hand=[c.value if hasattr(c, 'value') else str(c) for c in state.get("hand", [])],
-        players_alive=state.get("players_alive", []),
+        hand=_prompt_list(state.get("hand")),
+        players_alive=_prompt_list(state.get("players_alive")),
         pending_action=state.get("pending_action"),
         current_phase=current_phase,
         visible_pending_actions=visible_actions_str,
@@ -231,16 +356,6 @@ def _run_llm_analysis(state: ChatReasoningState) -> Optional[MessageAnalysis]:
         message_content=incoming.get("content", ""),
         chat_history=history_str,
     )
-    
-    # Invoke LLM
-    try:
-        result = llm.invoke(prompt)
-        content = result.content if hasattr(result, 'content') else str(result)
-        
-        # Parse JSON response
-        return _parse_llm_analysis(content)
-    except Exception:
-        return None
 
 
 def _parse_llm_analysis(llm_response: str) -> Optional[MessageAnalysis]:
@@ -328,37 +443,22 @@ def _blend_analysis(
 
 def _detect_intent(content: str) -> str:
     """Detect message intent from content."""
-    question_words = ["?", "who", "what", "why", "how", "do you", "are you", "did you"]
-    accusation_words = ["liar", "lying", "bluff", "fake", "don't have", "doesn't have"]
-    persuasion_words = ["should", "let's", "we could", "trust me", "work together", "alliance"]
-    threat_words = ["coup", "assassinate", "target", "next", "watch out", "coming for"]
-    
-    if any(word in content for word in accusation_words):
+    if any(word in content for word in _ACCUSATION_WORDS):
         return "accusation"
-    if any(word in content for word in threat_words):
+    if any(word in content for word in _INTENT_THREAT_WORDS):
         return "threat"
-    if any(word in content for word in persuasion_words):
+    if any(word in content for word in _PERSUASION_WORDS):
         return "persuasion"
-    if any(word in content for word in question_words):
+    if any(word in content for word in _QUESTION_WORDS):
         return "question"
-    if any(word in content for word in ["tax", "steal", "foreign aid", "duke", "captain", "assassin"]):
+    if any(word in content for word in _GAME_TALK_WORDS):
         return "game_talk"
     return "smalltalk"
 
 
 def _detect_action_mention(content: str) -> str:
     """Detect if a Coup action is mentioned."""
-    action_keywords = {
-        CoupAction.INCOME: ["income"],
-        CoupAction.FOREIGN_AID: ["foreign aid", "foreign_aid"],
-        CoupAction.COUP: ["coup"],
-        CoupAction.TAX: ["tax", "duke"],
-        CoupAction.ASSASSINATE: ["assassinate", "assassin"],
-        CoupAction.STEAL: ["steal", "captain"],
-        CoupAction.EXCHANGE: ["exchange", "ambassador", "swap"],
-    }
-    
-    for action, keywords in action_keywords.items():
+    for action, keywords in _ACTION_KEYWORDS:
         if any(kw in content for kw in keywords):
             return action
     return None
@@ -398,15 +498,15 @@ def _calculate_threat(content: str, state: ChatReasoningState) -> float:
     """Calculate threat level of the message."""
     score = 0.0
     
-    threat_words = ["coup", "assassinate", "target", "kill", "eliminate", "coming for"]
     agent_name = state.get("agent_name", "").lower()
+    content_lower = content.lower()
     
-    for word in threat_words:
-        if word in content.lower():
+    for word in _THREAT_SCORE_WORDS:
+        if word in content_lower:
             score += 0.2
     
     # Higher threat if agent is mentioned with threat words
-    if agent_name in content.lower() and score > 0:
+    if agent_name in content_lower and score > 0:
         score += 0.3
     
     return min(1.0, score)
@@ -416,8 +516,8 @@ def _calculate_opportunity(content: str, state: ChatReasoningState) -> float:
     """Calculate opportunity score (chance to manipulate/persuade)."""
     score = 0.2  # Base opportunity
     
-    opportunity_words = ["alliance", "together", "trust", "help", "team up"]
-    if any(word in content.lower() for word in opportunity_words):
+    content_lower = content.lower()
+    if any(word in content_lower for word in _OPPORTUNITY_WORDS):
         score += 0.3
     
     # Questions are opportunities to shape perception
@@ -429,15 +529,13 @@ def _calculate_opportunity(content: str, state: ChatReasoningState) -> float:
 
 def _detect_tone(content: str) -> str:
     """Detect the sender's tone."""
-    hostile_words = ["liar", "hate", "stupid", "idiot", "kill"]
-    friendly_words = ["friend", "ally", "together", "help", "thanks", "haha", "lol"]
-    suspicious_words = ["really", "sure about that", "doubt", "suspicious", "hmm"]
+    content_lower = content.lower()
     
-    if any(word in content.lower() for word in hostile_words):
+    if any(word in content_lower for word in _HOSTILE_WORDS):
         return "hostile"
-    if any(word in content.lower() for word in friendly_words):
+    if any(word in content_lower for word in _FRIENDLY_WORDS):
         return "friendly"
-    if any(word in content.lower() for word in suspicious_words):
+    if any(word in content_lower for word in _SUSPICIOUS_WORDS):
         return "suspicious"
     return "neutral"
 
@@ -456,6 +554,48 @@ def _find_mentioned_players(content: str, players_alive: list) -> list:
 # Decide Response Node
 # =============================================
 
+# Decisions whose fields never vary, built once. Nodes return copies so no
+# run's state shares (and can mutate) the module-level template.
+_LIMIT_REACHED_DECISION = ResponseDecision(
+    should_respond=False,
+    response_priority="none",
+    reason="Message limit reached",
+    skip_reason="limit_reached",
+)
+_MENTIONED_DECISION = ResponseDecision(
+    should_respond=True,
+    response_priority="high",
+    reason="Directly mentioned - should respond",
+)
+_MEDIUM_PRIORITY_DECISION = ResponseDecision(
+    should_respond=True,
+    response_priority="medium",
+    reason="Medium priority, messages available",
+)
+_LOW_PRIORITY_DECISION = ResponseDecision(
+    should_respond=True,
+    response_priority="low",
+    reason="Low priority but high message budget",
+)
+_NOT_RELEVANT_DECISION = ResponseDecision(
+    should_respond=False,
+    response_priority="none",
+    reason="Not relevant enough to spend message budget",
+    skip_reason="not_relevant",
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _play_style_multiplier(play_style: str) -> float:
+    """Priority multiplier for an agent's play style (few distinct styles, so cached)."""
+    style = play_style.lower()
+    if "quiet" in style or "passive" in style:
+        return 0.7  # Less likely to respond
+    if "aggressive" in style or "chatty" in style:
+        return 1.3  # More likely to respond
+    return 1.0
+
+
 def decide_response_node(state: ChatReasoningState) -> Dict[str, Any]:
     """
     Decide whether the agent should respond to the message.
@@ -481,14 +621,7 @@ def decide_response_node(state: ChatReasoningState) -> Dict[str, Any]:
     
     if not can_respond:
         logger.info(f"[CHAT-FLOW] Decision: agent={agent_id} NOT responding (limit reached)")
-        return {
-            "response_decision": ResponseDecision(
-                should_respond=False,
-                response_priority="none",
-                reason="Message limit reached",
-                skip_reason="limit_reached",
-            )
-        }
+        return {"response_decision": dict(_LIMIT_REACHED_DECISION)}
     
     # ========== Calculate Response Priority ==========
     
@@ -514,10 +647,7 @@ def decide_response_node(state: ChatReasoningState) -> Dict[str, Any]:
     )
     
     # Adjust for play style
-    if "quiet" in play_style.lower() or "passive" in play_style.lower():
-        priority_score *= 0.7  # Less likely to respond
-    elif "aggressive" in play_style.lower() or "chatty" in play_style.lower():
-        priority_score *= 1.3  # More likely to respond
+    priority_score *= _play_style_multiplier(play_style)
     
     logger.debug(f"[CHAT-FLOW] Adjusted priority: {priority_score:.2f} (play_style={play_style})")
     
@@ -526,13 +656,7 @@ def decide_response_node(state: ChatReasoningState) -> Dict[str, Any]:
     # Always respond if directly mentioned
     if mentions_agent and can_respond:
         logger.info(f"[CHAT-FLOW] Decision: agent={agent_id} RESPONDING (directly mentioned)")
-        return {
-            "response_decision": ResponseDecision(
-                should_respond=True,
-                response_priority="high",
-                reason="Directly mentioned - should respond",
-            )
-        }
+        return {"response_decision": dict(_MENTIONED_DECISION)}
     
     # High priority threshold
     if priority_score > 0.6:
@@ -548,44 +672,33 @@ def decide_response_node(state: ChatReasoningState) -> Dict[str, Any]:
     # Medium priority - respond if plenty of messages left
     if priority_score > 0.4 and messages_remaining > 10:
         logger.info(f"[CHAT-FLOW] Decision: agent={agent_id} RESPONDING (medium priority)")
-        return {
-            "response_decision": ResponseDecision(
-                should_respond=True,
-                response_priority="medium",
-                reason=f"Medium priority, messages available",
-            )
-        }
+        return {"response_decision": dict(_MEDIUM_PRIORITY_DECISION)}
     
     # Low priority - only respond if very high message budget
     if priority_score > 0.25 and messages_remaining > 50:
         logger.info(f"[CHAT-FLOW] Decision: agent={agent_id} RESPONDING (low priority, high budget)")
-        return {
-            "response_decision": ResponseDecision(
-                should_respond=True,
-                response_priority="low",
-                reason="Low priority but high message budget",
-            )
-        }
+        return {"response_decision": dict(_LOW_PRIORITY_DECISION)}
     
     # Default: don't respond
     logger.info(
         f"[CHAT-FLOW] Decision: agent={agent_id} NOT responding "
         f"(priority={priority_score:.2f}, remaining={messages_remaining})"
     )
-    return {
-        "response_decision": ResponseDecision(
-            should_respond=False,
-            response_priority="none",
-            reason="Not relevant enough to spend message budget",
-            skip_reason="not_relevant",
-        )
-    }
+    return {"response_decision": dict(_NOT_RELEVANT_DECISION)}
 
 
 # =============================================
 # Generate Response Node
 # =============================================
 
+# Update when the decision was not to respond
+_NO_RESPONSE = {
+    "generated_response": None,
+    "final_response": None,
+    "formatted_response": None,
+}
+
+
 def generate_response_node(state: ChatReasoningState) -> Dict[str, Any]:
     """
     Generate the actual chat response.
@@ -594,44 +707,69 @@ def generate_response_node(state: ChatReasoningState) -> Dict[str, Any]:
     Falls back to heuristic responses if LLM unavailable.
     Formats response for the target platform.
     """
-    agent_id = state.get("agent_id", "unknown")
-    decision = state.get("response_decision", {})
-    
-    logger.info(f"[CHAT-FLOW] generate_response_node: agent={agent_id}")
+    if not _should_generate(state):
+        return dict(_NO_RESPONSE)
     
-    # Skip if not responding
-    if not decision.get("should_respond", False):
-        logger.debug(f"[CHAT-FLOW] Skipping generation (should_respond=False)")
-        return {
-            "generated_response": None,
-            "final_response": None,
-            "formatted_response": None,
-        }
+    # Try LLM generation
+    response = None
+    try:
+        logger.debug(f"[CHAT-FLOW] Attempting LLM response generation...")
+        response = _generate_llm_response(state)
+    except Exception as e:
+        logger.warning(f"[CHAT-FLOW] LLM generation failed: {e}")
     
-    analysis = state.get("message_analysis", {})
-    incoming = state.get("incoming_message", {})
+    return _finish_generation(state, response)
+
+
+async def agenerate_response_node(state: ChatReasoningState) -> Dict[str, Any]:
+    """
+    Async variant of generate_response_node.
     
-    # Get platform info
-    source_platform = state.get("source_platform", SocialMediaPlatform.DEFUALT)
-    if isinstance(source_platform, str):
-        try:
-            source_platform = SocialMediaPlatform(source_platform)
-        except ValueError:
-            source_platform = SocialMediaPlatform.DEFUALT
+    Awaits the LLM call (ainvoke) instead of tying up an executor thread
+    for the whole completion.
+    """
+    if not _should_generate(state):
+        return dict(_NO_RESPONSE)
     
-    # Try LLM generation
     response = None
     try:
         logger.debug(f"[CHAT-FLOW] Attempting LLM response generation...")
-        response = _generate_llm_response(state)
-        if response:
-            logger.info(
-                f"[CHAT-FLOW] LLM generated: agent={agent_id} "
-                f"content=\"{response.get('content', '')[:50]}...\""
-            )
+        response = await _agenerate_llm_response(state)
     except Exception as e:
         logger.warning(f"[CHAT-FLOW] LLM generation failed: {e}")
     
+    return _finish_generation(state, response)
+
+
+def _should_generate(state: ChatReasoningState) -> bool:
+    """Log entry and report whether the decision node chose to respond."""
+    logger.info(f"[CHAT-FLOW] generate_response_node: agent={state.get('agent_id', 'unknown')}")
+    
+    if not state.get("response_decision", {}).get("should_respond", False):
+        logger.debug(f"[CHAT-FLOW] Skipping generation (should_respond=False)")
+        return False
+    return True
+
+
+def _finish_generation(
+    state: ChatReasoningState,
+    response: Optional[GeneratedResponse],
+) -> Dict[str, Any]:
+    """Fall back to a heuristic response if needed and format it for the platform."""
+    agent_id = state.get("agent_id", "unknown")
+    analysis = state.get("message_analysis", {})
+    
+    # Get platform info
+    source_platform = state.get("source_platform", SocialMediaPlatform.DEFUALT)
+    if isinstance(source_platform, str):
+        source_platform = SOCIAL_MEDIA_PLATFORM_BY_VALUE.get(source_platform, SocialMediaPlatform.DEFUALT)
+    
+    if response:
+        logger.info(
+            f"[CHAT-FLOW] LLM generated: agent={agent_id} "
+            f"content=\"{response.get('content', '')[:50]}...\""
+        )
+    
     # Heuristic fallback
     if not response:
         logger.info(f"[CHAT-FLOW] Using heuristic response fallback")
@@ -681,14 +819,34 @@ def generate_response_node(state: ChatReasoningState) -> Dict[str, Any]:
     }
 
 
-def _generate_llm_response(state: ChatReasoningState) -> GeneratedResponse:
+def _generate_llm_response(state: ChatReasoningState) -> Optional[GeneratedResponse]:
     """Generate response using LLM."""
-    from app.extensions import LoadedLLMs, LoadedPromptTemplates
+    from app.extensions import LoadedLLMs
+    
+    llm = LoadedLLMs.gpt_llm
+    prompt = _build_llm_response_prompt(state) if llm else None
+    if prompt is None:
+        return None
+    
+    return _to_generated_response(llm.invoke(prompt))
+
+
+async def _agenerate_llm_response(state: ChatReasoningState) -> Optional[GeneratedResponse]:
+    """Async variant of _generate_llm_response (awaits llm.ainvoke)."""
+    from app.extensions import LoadedLLMs
     
     llm = LoadedLLMs.gpt_llm
-    if not llm:
+    prompt = _build_llm_response_prompt(state) if llm else None
+    if prompt is None:
         return None
     
+    return _to_generated_response(await llm.ainvoke(prompt))
+
+
+def _build_llm_response_prompt(state: ChatReasoningState) -> Optional[str]:
+    """Format the chat_response_generation.md prompt for this state (None if missing)."""
+    from app.extensions import LoadedPromptTemplates
+    
     # Get prompt template
     prompt_template = LoadedPromptTemplates.markdown_prompt_templates.get("chat_response_generation")
     if not prompt_template:
@@ -712,14 +870,14 @@ def _generate_llm_response(state: ChatReasoningState) -> GeneratedResponse:
         for h in history[-5:]  # Last 5 messages
     ]) or "No recent history"
     
-    prompt = prompt_template.format(
+    return prompt_template.format(
         agent_name=state.get("agent_name", "Agent"),
         agent_personality=state.get("agent_personality", "neutral"),
         agent_play_style=state.get("agent_play_style", "balanced"),
         coins=state.get("coins", 0),
-        hand=[c.value if hasattr(c, 'value') else str(c) for c in state.get("hand", [])],
-        revealed=[c.value if hasattr(c, 'value') else str(c) for c in state.get("revealed", [])],
-        players_alive=state.get("players_alive", []),
+        hand=_prompt_list(state.get("hand")),
+        revealed=_prompt_list(state.get("revealed")),
+        players_alive=_prompt_list(state.get("players_alive")),
         pending_action=state.get("pending_action"),
         visible_pending_actions=visible_actions_str,
         sender_id=state.get("sender_id", "Unknown"),
@@ -731,9 +889,10 @@ def _generate_llm_response(state: ChatReasoningState) -> GeneratedResponse:
         chat_history=history_str,
         source_platform=state.get("source_platform", "discord"),
     )
-    
-    # Invoke LLM
-    result = llm.invoke(prompt)
+
+
+def _to_generated_response(result) -> GeneratedResponse:
+    """Wrap the LLM reply as a GeneratedResponse."""
     content = result.content if hasattr(result, 'content') else str(result)
     
     return GeneratedResponse(
@@ -7,10 +7,18 @@ to the appropriate handler workflows.
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
-from app.constants import EventType, GamePhase, SocialMediaPlatform, MessageTargetType
+from app.constants import (
+    EVENT_TYPE_BY_VALUE,
+    EventType,
+    GamePhase,
+    SOCIAL_MEDIA_PLATFORM_BY_VALUE,
+    SocialMediaPlatform,
+    MessageTargetType,
+)
 from app.extensions import agent_registry
+from app.graphs.workflows.run_config import thread_id_for
 from app.models.graph_state_models.event_router_state import (
     EventRouterState,
     EventClassification,
@@ -20,13 +28,63 @@ from app.models.graph_state_models.game_phase_state import (
     PhaseTransitionInfo,
 )
 from app.services.platform_response_router import PlatformResponseRouter
+from app.utils.async_runner import gather_bounded
 
 logger = logging.getLogger(__name__)
 
 
+async def _arun_workflow_per_agent(workflow, jobs: List[Tuple[str, dict, str]]) -> Dict[str, Any]:
+    """
+    Fan out one workflow run per agent and await all of them.
+    
+    The per-agent runs are independent, so they are awaited together
+    (at most DEFAULT_MAX_CONCURRENCY at a time); the handler waits on the
+    slowest agent rather than the sum of all of them. Awaited on the
+    graph's own loop - no worker thread blocks on the runs.
+    
+    Args:
+        workflow: Workflow exposing arun(state, thread_id=...)
+        jobs: (agent_id, workflow_state, thread_id) per agent
+    
+    Returns:
+        Dict of agent_id -> final state, or the exception that run raised
+    """
+    if not jobs:
+        return {}
+    
+    results = await gather_bounded(
+        (workflow.arun(job_state, thread_id=thread_id) for _, job_state, thread_id in jobs),
+        return_exceptions=True,
+    )
+    return {agent_id: result for (agent_id, _, _), result in zip(jobs, results)}
+
+
 # =============================================
 # Classification Node
 # =============================================
+
+# Event types that may need an LLM workflow
+_LLM_EVENTS = frozenset({
+    EventType.CHAT_MESSAGE,
+    EventType.BROADCAST_RESULTS,
+    EventType.REACTION_REQUIRED,  # May involve LLM decision making
+})
+
+_HANDLER_NAMES = {
+    EventType.CHAT_MESSAGE: "handle_chat_message",
+    EventType.GAME_STATE_UPDATE: "handle_game_state_update",
+    EventType.PLAYER_ACTION_CHANGE: "handle_player_action_change",
+    EventType.SUPERVISOR_INSTRUCTION: "handle_supervisor_instruction",
+    EventType.PROFILE_SYNC: "handle_profile_sync",
+    EventType.BROADCAST_RESULTS: "handle_broadcast_results",
+    # Phase 2 event handlers
+    EventType.PHASE_TRANSITION: "handle_phase_transition",
+    EventType.REACTION_REQUIRED: "handle_reaction_required",
+    EventType.REACTIONS_VISIBLE: "handle_reactions_visible",
+    EventType.CARD_SELECTION_REQUIRED: "handle_card_selection_required",
+}
+
+
 def classify_event_node(state: EventRouterState) -> Dict[str, Any]:
     """
     Classify the incoming event and determine routing.
@@ -41,10 +99,9 @@ def classify_event_node(state: EventRouterState) -> Dict[str, Any]:
     
     logger.info(f"[CHAT-FLOW] classify_event_node: game={game_id} event_type={event_type_str}")
     
-    # Try to parse event type
-    try:
-        event_type = EventType(event_type_str)
-    except ValueError:
+    # Parse event type
+    event_type = EVENT_TYPE_BY_VALUE.get(event_type_str)
+    if event_type is None:
         logger.error(f"[CHAT-FLOW] Unknown event type: {event_type_str}")
         return {
             "error": f"Unknown event type: {event_type_str}",
@@ -53,8 +110,9 @@ def classify_event_node(state: EventRouterState) -> Dict[str, Any]:
             "processing_complete": True,
         }
     
-    # Determine classification based on event type
-    classification = _classify_event_type(event_type)
+    # Classification is fixed per event type (see _CLASSIFICATIONS); copy it
+    # so nodes that edit state['classification'] can't alter the shared table
+    classification = dict(_CLASSIFICATIONS[event_type])
     
     logger.info(
         f"[CHAT-FLOW] Event classified: type={event_type.value} "
@@ -87,34 +145,20 @@ def _classify_event_type(event_type: EventType) -> EventClassification:
     - REACTIONS_VISIBLE: Update visible reactions
     - CARD_SELECTION_REQUIRED: Update selection requirements
     """
-    llm_events = {
-        EventType.CHAT_MESSAGE,
-        EventType.BROADCAST_RESULTS,
-        EventType.REACTION_REQUIRED,  # May involve LLM decision making
-    }
-    
-    handler_mapping = {
-        EventType.CHAT_MESSAGE: "handle_chat_message",
-        EventType.GAME_STATE_UPDATE: "handle_game_state_update",
-        EventType.PLAYER_ACTION_CHANGE: "handle_player_action_change",
-        EventType.SUPERVISOR_INSTRUCTION: "handle_supervisor_instruction",
-        EventType.PROFILE_SYNC: "handle_profile_sync",
-        EventType.BROADCAST_RESULTS: "handle_broadcast_results",
-        # Phase 2 event handlers
-        EventType.PHASE_TRANSITION: "handle_phase_transition",
-        EventType.REACTION_REQUIRED: "handle_reaction_required",
-        EventType.REACTIONS_VISIBLE: "handle_reactions_visible",
-        EventType.CARD_SELECTION_REQUIRED: "handle_card_selection_required",
-    }
-    
     return EventClassification(
         event_type=event_type,
         confidence=1.0,  # Direct classification, always confident
-        requires_llm_processing=event_type in llm_events,
-        handler_name=handler_mapping.get(event_type, "handle_unknown"),
+        requires_llm_processing=event_type in _LLM_EVENTS,
+        handler_name=_HANDLER_NAMES.get(event_type, "handle_unknown"),
     )
 
 
+# One classification per event type, built once at import. Classification
+# depends only on the type, so classify_event_node is a table lookup plus
+# a shallow copy of the flat dict.
+_CLASSIFICATIONS = {event_type: _classify_event_type(event_type) for event_type in EventType}
+
+
 # =============================================
 # Agent Resolution Node
 # =============================================
@@ -187,7 +231,7 @@ def resolve_target_agents_node(state: EventRouterState) -> Dict[str, Any]:
 # =============================================
 # Chat Message Handler Node
 # =============================================
-def handle_chat_message_node(state: EventRouterState) -> Dict[str, Any]:
+async def handle_chat_message_node(state: EventRouterState) -> Dict[str, Any]:
     """
     Handle chat message events using the chat reasoning workflow.
     
@@ -230,15 +274,12 @@ def handle_chat_message_node(state: EventRouterState) -> Dict[str, Any]:
             # Set platform context
             source_platform = state.get("source_platform", SocialMediaPlatform.DEFUALT)
             if isinstance(source_platform, str):
-                try:
-                    source_platform = SocialMediaPlatform(source_platform)
-                except ValueError:
-                    source_platform = SocialMediaPlatform.DEFUALT
+                source_platform = SOCIAL_MEDIA_PLATFORM_BY_VALUE.get(source_platform, SocialMediaPlatform.DEFUALT)
             agent.set_current_platform(source_platform)
             
             # Process through chat service
             try:
-                response = ChatService.process_chat_message(agent, event)
+                response = await ChatService.aprocess_chat_message(agent, event)
                 
                 # Log response summary
                 responded = response.get("responded", False)
@@ -501,7 +542,7 @@ def handle_profile_sync_node(state: EventRouterState) -> Dict[str, Any]:
 # =============================================
 # Broadcast Results Handler Node
 # =============================================
-def handle_broadcast_results_node(state: EventRouterState) -> Dict[str, Any]:
+async def handle_broadcast_results_node(state: EventRouterState) -> Dict[str, Any]:
     """
     Handle end-of-hour broadcast results.
     
@@ -524,11 +565,13 @@ def handle_broadcast_results_node(state: EventRouterState) -> Dict[str, Any]:
     responses = []
     conversation_messages = state.get("conversation_messages", [])
     
+    # Build every agent's commentary state up front
+    prepared = []
+    jobs = []
     for agent_id in agent_ids:
         agent = agent_registry.get_agent(game_id, agent_id)
         if agent:
             try:
-                # Create broadcast commentary state
                 commentary_state = create_broadcast_commentary_state(
                     agent=agent,
                     results=results,
@@ -536,88 +579,97 @@ def handle_broadcast_results_node(state: EventRouterState) -> Dict[str, Any]:
                     is_game_over=is_game_over,
                     winner=winner,
                 )
-                
-                # Run broadcast commentary workflow
-                workflow_result = lang_graph_app.broadcast_commentary_wf.run(
-                    commentary_state,
-                    thread_id=f"{game_id}:{agent_id}:broadcast",
-                )
-                
-                # Extract results
-                raw_commentary = workflow_result.get("final_commentary")
-                decision = workflow_result.get("commentary_decision", {})
-                analysis = workflow_result.get("result_analysis", {})
-                
-                # Format commentary for target platform
-                final_commentary = raw_commentary
-                formatted_response = None
-                source_platform = state.get("source_platform", SocialMediaPlatform.DEFUALT)
-                if isinstance(source_platform, str):
-                    try:
-                        source_platform = SocialMediaPlatform(source_platform)
-                    except ValueError:
-                        source_platform = SocialMediaPlatform.DEFUALT
-                
-                if raw_commentary:
-                    platform_router = PlatformResponseRouter()
-                    # For broadcast, we might want to mention specific players
-                    affected_players = [r.get("target") for r in results if r.get("target")]
-                    formatted = platform_router.route_response(
-                        content=raw_commentary,
-                        source_platform=source_platform,
-                        mentions=affected_players[:3],  # Limit mentions
-                    )
-                    final_commentary = formatted.content
-                    formatted_response = {
-                        "content": formatted.content,
-                        "platform": formatted.platform.value,
-                        "was_truncated": formatted.was_truncated,
-                        "mentions": formatted.mentions,
-                    }
-                
-                response = {
-                    "agent_id": agent_id,
-                    "success": True,
-                    "action": "broadcast_processed",
-                    "result_count": len(results),
-                    "agent_affected": analysis.get("agent_was_actor") or analysis.get("agent_was_target"),
-                    "agent_eliminated": analysis.get("agent_was_eliminated", False),
-                    "commented": decision.get("should_comment", False),
-                    "commentary": final_commentary,
-                    "formatted_response": formatted_response,
-                    "target_platform": source_platform.value,
-                }
-                responses.append(response)
-                
-                # Add broadcast and commentary to conversation history
-                conversation_messages.append({
-                    "role": "system",
-                    "content": f"Game broadcast: {len(results)} actions resolved",
-                    "timestamp": state.get("timestamp"),
-                    "results_summary": [
-                        f"{r.get('actor')} -> {r.get('action')} -> {r.get('target')}"
-                        for r in results[:5]
-                    ],
-                })
-                
-                if final_commentary:
-                    conversation_messages.append({
-                        "role": "assistant",
-                        "content": final_commentary,
-                        "sender_id": agent_id,
-                        "timestamp": datetime.now().isoformat(),
-                        "type": "broadcast_commentary",
-                    })
-                    
-                    # Increment message count for commentary
-                    agent.increment_message_count(MessageTargetType.MIXED)
-                
             except Exception as e:
                 responses.append({
                     "agent_id": agent_id,
                     "success": False,
                     "error": str(e),
                 })
+                continue
+            prepared.append((agent_id, agent))
+            jobs.append((agent_id, commentary_state, thread_id_for(game_id, agent_id, "broadcast")))
+    
+    # Run the broadcast commentary workflows concurrently (one per agent)
+    workflow_results = await _arun_workflow_per_agent(lang_graph_app.broadcast_commentary_wf, jobs)
+    
+    for agent_id, agent in prepared:
+        try:
+            workflow_result = workflow_results[agent_id]
+            if isinstance(workflow_result, Exception):
+                raise workflow_result
+            
+            # Extract results
+            raw_commentary = workflow_result.get("final_commentary")
+            decision = workflow_result.get("commentary_decision", {})
+            analysis = workflow_result.get("result_analysis", {})
+            
+            # Format commentary for target platform
+            final_commentary = raw_commentary
+            formatted_response = None
+            source_platform = state.get("source_platform", SocialMediaPlatform.DEFUALT)
+            if isinstance(source_platform, str):
+                source_platform = SOCIAL_MEDIA_PLATFORM_BY_VALUE.get(source_platform, SocialMediaPlatform.DEFUALT)
+            
+            if raw_commentary:
+                platform_router = PlatformResponseRouter()
+                # For broadcast, we might want to mention specific players
+                affected_players = [r.get("target") for r in results if r.get("target")]
+                formatted = platform_router.route_response(
+                    content=raw_commentary,
+                    source_platform=source_platform,
+                    mentions=affected_players[:3],  # Limit mentions
+                )
+                final_commentary = formatted.content
+                formatted_response = {
+                    "content": formatted.content,
+                    "platform": formatted.platform.value,
+                    "was_truncated": formatted.was_truncated,
+                    "mentions": formatted.mentions,
+                }
+            
+            response = {
+                "agent_id": agent_id,
+                "success": True,
+                "action": "broadcast_processed",
+                "result_count": len(results),
+                "agent_affected": analysis.get("agent_was_actor") or analysis.get("agent_was_target"),
+                "agent_eliminated": analysis.get("agent_was_eliminated", False),
+                "commented": decision.get("should_comment", False),
+                "commentary": final_commentary,
+                "formatted_response": formatted_response,
+                "target_platform": source_platform.value,
+            }
+            responses.append(response)
+            
+            # Add broadcast and commentary to conversation history
+            conversation_messages.append({
+                "role": "system",
+                "content": f"Game broadcast: {len(results)} actions resolved",
+                "timestamp": state.get("timestamp"),
+                "results_summary": [
+                    f"{r.get('actor')} -> {r.get('action')} -> {r.get('target')}"
+                    for r in results[:5]
+                ],
+            })
+            
+            if final_commentary:
+                conversation_messages.append({
+                    "role": "assistant",
+                    "content": final_commentary,
+                    "sender_id": agent_id,
+                    "timestamp": datetime.now().isoformat(),
+                    "type": "broadcast_commentary",
+                })
+            
+                # Increment message count for commentary
+                agent.increment_message_count(MessageTargetType.MIXED)
+            
+        except Exception as e:
+            responses.append({
+                "agent_id": agent_id,
+                "success": False,
+                "error": str(e),
+            })
     
     return {
         "handler_responses": responses,
@@ -663,6 +715,8 @@ def handle_phase_transition_node(state: EventRouterState) -> Dict[str, Any]:
         }
     
     responses = []
+    # Shared by every agent reset below when a new hour starts
+    hour_start = datetime.now() if new_phase == GamePhase.PHASE1_ACTIONS else None
     
     for agent_id in agent_ids:
         agent = agent_registry.get_agent(game_id, agent_id)
@@ -694,7 +748,7 @@ def handle_phase_transition_node(state: EventRouterState) -> Dict[str, Any]:
                 elif new_phase == GamePhase.PHASE1_ACTIONS:
                     # New hour starting: reset everything
                     from app.models.graph_state_models.hourly_coup_state import reset_hourly_counters
-                    reset_hourly_counters(agent.state)
+                    reset_hourly_counters(agent.state, hour_start)
                 
                 responses.append({
                     "agent_id": agent_id,
@@ -721,7 +775,7 @@ def handle_phase_transition_node(state: EventRouterState) -> Dict[str, Any]:
 # =============================================
 # Reaction Required Handler Node
 # =============================================
-def handle_reaction_required_node(state: EventRouterState) -> Dict[str, Any]:
+async def handle_reaction_required_node(state: EventRouterState) -> Dict[str, Any]:
     """
     Handle reaction required events.
     
@@ -740,6 +794,8 @@ def handle_reaction_required_node(state: EventRouterState) -> Dict[str, Any]:
     actions_requiring_reaction = payload.get("actions", [])
     
     responses = []
+    prepared = []
+    jobs = []
     
     for agent_id in agent_ids:
         agent = agent_registry.get_agent(game_id, agent_id)
@@ -777,28 +833,8 @@ def handle_reaction_required_node(state: EventRouterState) -> Dict[str, Any]:
                     agent_state=agent.state,
                     actions_requiring_reaction=my_actions,
                 )
-                
-                # Run the reaction workflow
-                workflow_result = lang_graph_app.reaction_wf.run(
-                    reaction_state,
-                    thread_id=f"{game_id}:{agent_id}",
-                )
-                
-                # Update agent state with new reactions
-                new_reactions = workflow_result.get("new_pending_reactions", [])
-                agent.state["pending_reactions"] = new_reactions
-                
-                # Handle any generated chat
-                reaction_chat = workflow_result.get("reaction_chat_content")
-                
-                responses.append({
-                    "agent_id": agent_id,
-                    "success": True,
-                    "action": "reactions_processed",
-                    "reactions_set": len(new_reactions),
-                    "chat_generated": bool(reaction_chat),
-                    "reaction_chat": reaction_chat,
-                })
+                prepared.append((agent_id, agent))
+                jobs.append((agent_id, reaction_state, thread_id_for(game_id, agent_id)))
                 
             except Exception as e:
                 responses.append({
@@ -807,6 +843,38 @@ def handle_reaction_required_node(state: EventRouterState) -> Dict[str, Any]:
                     "error": str(e),
                 })
     
+    # Run the reaction workflows concurrently (one per agent)
+    workflow_results = await _arun_workflow_per_agent(lang_graph_app.reaction_wf, jobs)
+    
+    for agent_id, agent in prepared:
+        try:
+            workflow_result = workflow_results[agent_id]
+            if isinstance(workflow_result, Exception):
+                raise workflow_result
+            
+            # Update agent state with new reactions
+            new_reactions = workflow_result.get("new_pending_reactions", [])
+            agent.state["pending_reactions"] = new_reactions
+            
+            # Handle any generated chat
+            reaction_chat = workflow_result.get("reaction_chat_content")
+            
+            responses.append({
+                "agent_id": agent_id,
+                "success": True,
+                "action": "reactions_processed",
+                "reactions_set": len(new_reactions),
+                "chat_generated": bool(reaction_chat),
+                "reaction_chat": reaction_chat,
+            })
+            
+        except Exception as e:
+            responses.append({
+                "agent_id": agent_id,
+                "success": False,
+                "error": str(e),
+            })
+    
     return {
         "handler_responses": responses,
         "events_processed_this_hour": state.get("events_processed_this_hour", 0) + 1,
@@ -827,6 +895,8 @@ def handle_reactions_visible_node(state: EventRouterState) -> Dict[str, Any]:
     agent_ids = state.get("agent_ids_to_process", [])
     payload = state.get("payload", {})
     visible_reactions = payload.get("visible_pending_reactions", [])
+    # Players with at least one reaction, computed once for all agents
+    reacting_players = {r.get("player_id") for r in visible_reactions}
     
     responses = []
     
@@ -834,11 +904,15 @@ def handle_reactions_visible_node(state: EventRouterState) -> Dict[str, Any]:
         agent = agent_registry.get_agent(game_id, agent_id)
         if agent:
             try:
-                # Filter out the agent's own reactions (they already know those)
-                other_reactions = [
-                    r for r in visible_reactions
-                    if r.get("player_id") != agent_id
-                ]
+                # Filter out the agent's own reactions (they already know those);
+                # agents that haven't reacted just get a copy of the full list
+                if agent_id in reacting_players:
+                    other_reactions = [
+                        r for r in visible_reactions
+                        if r.get("player_id") != agent_id
+                    ]
+                else:
+                    other_reactions = list(visible_reactions)
                 
                 # Update agent's visible reactions
                 agent.state["visible_pending_reactions"] = other_reactions
@@ -1017,10 +1091,7 @@ def finalize_response_node(state: EventRouterState) -> Dict[str, Any]:
     )
     
     if isinstance(source_platform, str):
-        try:
-            source_platform = SocialMediaPlatform(source_platform)
-        except ValueError:
-            source_platform = SocialMediaPlatform.DEFUALT
+        source_platform = SOCIAL_MEDIA_PLATFORM_BY_VALUE.get(source_platform, SocialMediaPlatform.DEFUALT)
     
     # Build final response
     if len(responses) == 1:
@@ -160,16 +160,16 @@ def set_specific_reactions_node(state: ReactionWorkflowState) -> Dict[str, Any]:
             if reaction_type == ReactionType.BLOCK:
                 claimed_role = _get_block_role(decision.get("action"), hand)
             
-            pending_reaction = PendingReaction(
-                reaction_id=str(uuid.uuid4()),
-                reaction_type=reaction_type,
-                target_action_id=decision.get("action_id"),
-                target_player_id=decision.get("actor_id"),
-                conditional_rule=None,
-                claimed_role=claimed_role,
-                priority=priority,
-                reasoning=decision.get("reasoning"),
-            )
+            pending_reaction: PendingReaction = {
+                "reaction_id": str(uuid.uuid4()),
+                "reaction_type": reaction_type,
+                "target_action_id": decision.get("action_id"),
+                "target_player_id": decision.get("actor_id"),
+                "conditional_rule": None,
+                "claimed_role": claimed_role,
+                "priority": priority,
+                "reasoning": decision.get("reasoning"),
+            }
             new_pending_reactions.append(pending_reaction)
             priority += 1
     
@@ -204,16 +204,16 @@ def set_conditional_reactions_node(state: ReactionWorkflowState) -> Dict[str, An
                     hand
                 )
             
-            pending_reaction = PendingReaction(
-                reaction_id=str(uuid.uuid4()),
-                reaction_type=reaction_type,
-                target_action_id=None,  # Not specific to one action
-                target_player_id=None,
-                conditional_rule=decision.get("conditional_rule"),
-                claimed_role=claimed_role,
-                priority=priority,
-                reasoning=decision.get("reasoning"),
-            )
+            pending_reaction: PendingReaction = {
+                "reaction_id": str(uuid.uuid4()),
+                "reaction_type": reaction_type,
+                "target_action_id": None,  # Not specific to one action
+                "target_player_id": None,
+                "conditional_rule": decision.get("conditional_rule"),
+                "claimed_role": claimed_role,
+                "priority": priority,
+                "reasoning": decision.get("reasoning"),
+            }
             new_pending_reactions.append(pending_reaction)
             priority += 1
     
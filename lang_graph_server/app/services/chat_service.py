@@ -16,15 +16,21 @@ from typing import Dict, Optional, Any
 from app.agents.base_coup_agent import BaseCoupAgent
 from app.constants import MessageTargetType, SocialMediaPlatform
 from app.extensions import lang_graph_app
+from app.graphs.workflows.run_config import thread_id_for
 from app.models.graph_state_models.chat_reasoning_state import (
     ChatReasoningState,
     ChatMessage,
     create_chat_reasoning_state,
 )
 from app.services.message_counter_service import MessageCounterService
+from app.utils.async_runner import run_sync
 
 logger = logging.getLogger(__name__)
 
+# Messages kept in an agent's chat_history, and how many go to the workflow
+CHAT_HISTORY_MAX = 50
+RECENT_HISTORY_SIZE = 10
+
 
 class ChatService:
     """
@@ -35,6 +41,19 @@ class ChatService:
     def process_chat_message(
         agent: BaseCoupAgent,
         event: dict,
+    ) -> Dict[str, Any]:
+        """
+        Synchronous shim over aprocess_chat_message() for sync callers.
+        
+        Must not be called from inside a running graph node; await
+        aprocess_chat_message() there instead.
+        """
+        return run_sync(ChatService.aprocess_chat_message(agent, event))
+    
+    @staticmethod
+    async def aprocess_chat_message(
+        agent: BaseCoupAgent,
+        event: dict,
     ) -> Dict[str, Any]:
         """
         Process an incoming chat message for an agent.
@@ -53,7 +72,7 @@ class ChatService:
         content = payload.get("content", "")
         
         logger.info(
-            f"[CHAT-FLOW] ChatService.process_chat_message: "
+            f"[CHAT-FLOW] ChatService.aprocess_chat_message: "
             f"agent={agent.agent_id} sender={sender_id} "
             f"content=\"{content[:50]}...\""
         )
@@ -94,7 +113,7 @@ class ChatService:
         )
         
         # Get recent chat history from agent state
-        recent_history = agent.state.get("chat_history", [])[-10:]  # Last 10 messages
+        recent_history = agent.state.get("chat_history", [])[-RECENT_HISTORY_SIZE:]
         
         # Create workflow state
         workflow_state = create_chat_reasoning_state(
@@ -114,11 +133,11 @@ class ChatService:
         
         # Run workflow
         workflow = lang_graph_app.chat_reasoning_wf
-        thread_id = f"{agent.game_id}_{agent.agent_id}"
+        thread_id = thread_id_for(agent.game_id, agent.agent_id, "chat")
         
         try:
             logger.info(f"[CHAT-FLOW] Running ChatReasoningWorkflow for agent={agent.agent_id}")
-            result = workflow.run(workflow_state, thread_id=thread_id)
+            result = await workflow.arun(workflow_state, thread_id=thread_id)
             logger.info(
                 f"[CHAT-FLOW] Workflow complete: agent={agent.agent_id} "
                 f"should_respond={result.get('response_decision', {}).get('should_respond')} "
@@ -160,9 +179,11 @@ class ChatService:
         )
         
         # Add incoming message to chat history
-        chat_history = agent.state.get("chat_history", [])
+        # Trimmed in place: no copy of the history on every message
+        chat_history = agent.state.setdefault("chat_history", [])
         chat_history.append(incoming_message)
-        agent.state["chat_history"] = chat_history[-50:]  # Keep last 50
+        if len(chat_history) > CHAT_HISTORY_MAX:
+            del chat_history[:-CHAT_HISTORY_MAX]
         
         # If we generated a response, increment counter and add to history
         if final_response and response_decision.get("should_respond"):
@@ -0,0 +1,88 @@
+"""
+Checkpoint Serializer.
+
+Faster serde for LangGraph checkpoint channel values.
+
+Checkpoints are written per channel (one value per state key), and most
+channels in our workflow states hold plain JSON data: ids, counters, payload
+dicts, message lists. Those values are encoded with msgspec's C msgpack
+encoder. Anything else (enums, datetimes, pydantic models, LangChain
+messages) goes to LangGraph's default JsonPlusSerializer, so round-trips
+stay lossless.
+
+Plain values are written under JsonPlus's own "msgpack" type tag (plain
+msgpack has no ext types, so the bytes are what JsonPlus would decode), and
+every "msgpack" blob is read back through JsonPlus. A process without
+msgspec, or one using the stock serde, reads these checkpoints unchanged.
+
+msgspec is optional. Without it, get_checkpoint_serde() returns None and the
+savers keep their default serde.
+"""
+
+from typing import Any, Optional, Tuple
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+# Type tag written alongside msgspec-encoded blobs (JsonPlusSerializer's tag)
+MSGPACK_TYPE = "msgpack"
+
+# Tag used by earlier releases for the same bytes; still accepted on load
+LEGACY_MSGSPEC_TYPE = "msgspec"
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_plain(obj: Any) -> bool:
+    """True if obj is built only from exact JSON builtins (no subclasses)."""
+    obj_type = type(obj)
+    if obj_type in _SCALAR_TYPES:
+        return True
+    if obj_type is list:
+        return all(_is_plain(item) for item in obj)
+    if obj_type is dict:
+        return all(type(key) is str and _is_plain(value) for key, value in obj.items())
+    return False
+
+
+class MsgspecCheckpointSerializer:
+    """
+    SerializerProtocol implementation backed by msgspec msgpack.
+
+    Plain values are encoded with msgspec and everything else uses
+    JsonPlusSerializer. Loads go through JsonPlusSerializer, which decodes
+    both (ormsgpack, also in C).
+    """
+
+    def __init__(self, fallback: Optional[JsonPlusSerializer] = None):
+        self._fallback = fallback or JsonPlusSerializer()
+        self._encoder = msgspec.msgpack.Encoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._fallback.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._fallback.loads(data)
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        if _is_plain(obj):
+            return MSGPACK_TYPE, self._encoder.encode(obj)
+        return self._fallback.dumps_typed(obj)
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_ == LEGACY_MSGSPEC_TYPE:
+            return self._fallback.loads_typed((MSGPACK_TYPE, payload))
+        return self._fallback.loads_typed(data)
+
+
+def get_checkpoint_serde() -> Optional[MsgspecCheckpointSerializer]:
+    """Return the msgspec serde, or None when msgspec is not installed."""
+    if msgspec is None:
+        return None
+    return MsgspecCheckpointSerializer()
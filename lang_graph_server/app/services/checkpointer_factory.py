@@ -18,6 +18,9 @@ from typing import Optional
 
 from langgraph.checkpoint.memory import MemorySaver
 
+from app.graphs.workflows.run_config import thread_id_for
+from app.services.checkpoint_serializer import get_checkpoint_serde
+
 
 class CheckpointerFactory:
     """
@@ -51,26 +54,33 @@ class CheckpointerFactory:
             return
         
         self._use_postgres = use_postgres
+        serde = get_checkpoint_serde()
         
         if use_postgres:
-            self._checkpointer = self._create_postgres_checkpointer(connection_string)
+            self._checkpointer = self._create_postgres_checkpointer(connection_string, serde)
         
         # Fallback to MemorySaver
         if self._checkpointer is None:
             print("Using MemorySaver (in-memory checkpointing - data lost on restart)")
-            self._checkpointer = MemorySaver()
+            self._checkpointer = MemorySaver(serde=serde)
         
         self._initialized = True
     
-    def _create_postgres_checkpointer(self, connection_string: Optional[str] = None):
+    def _create_postgres_checkpointer(self, connection_string: Optional[str] = None, serde=None):
         """
         Attempt to create a PostgresSaver checkpointer.
         
+        Args:
+            connection_string: PostgreSQL connection string (None: from env)
+            serde: Checkpoint serializer (None: the saver's default)
+        
         Returns None if PostgreSQL is not available or fails.
         """
         try:
             # Try to import PostgresSaver
             from langgraph.checkpoint.postgres import PostgresSaver
+            from psycopg import Connection
+            from psycopg.rows import dict_row
         except ImportError:
             print("langgraph-checkpoint-postgres not installed. Install with:")
             print("  pip install langgraph-checkpoint-postgres")
@@ -81,8 +91,16 @@ class CheckpointerFactory:
             connection_string = self._build_connection_string()
         
         try:
-            # Create PostgresSaver
-            checkpointer = PostgresSaver.from_conn_string(connection_string)
+            # Create PostgresSaver on a process-lifetime connection
+            # (same settings as PostgresSaver.from_conn_string, which only
+            # yields a saver inside a context manager and takes no serde)
+            conn = Connection.connect(
+                connection_string,
+                autocommit=True,
+                prepare_threshold=0,
+                row_factory=dict_row,
+            )
+            checkpointer = PostgresSaver(conn, serde=serde)
             
             # Setup tables if needed
             checkpointer.setup()
@@ -151,9 +169,7 @@ class CheckpointerFactory:
         Returns:
             Thread ID string
         """
-        if agent_id:
-            return f"{game_id}:{agent_id}"
-        return f"{game_id}:broadcast"
+        return thread_id_for(game_id, agent_id)
     
     @staticmethod
     def parse_thread_id(thread_id: str) -> tuple:
@@ -147,16 +147,16 @@ class ConditionalReactionService:
                 ]
                 
                 for action in matching_actions:
-                    specific_reaction = PendingReaction(
-                        reaction_id=f"{reaction.get('reaction_id')}_{action.get('action_id')}",
-                        reaction_type=reaction.get("reaction_type"),
-                        target_action_id=action.get("action_id"),
-                        target_player_id=action.get("actor_id"),
-                        conditional_rule=None,
-                        claimed_role=reaction.get("claimed_role"),
-                        priority=reaction.get("priority", 99),
-                        reasoning=f"Expanded from conditional rule: {conditional_rule}",
-                    )
+                    specific_reaction: PendingReaction = {
+                        "reaction_id": f"{reaction.get('reaction_id')}_{action.get('action_id')}",
+                        "reaction_type": reaction.get("reaction_type"),
+                        "target_action_id": action.get("action_id"),
+                        "target_player_id": action.get("actor_id"),
+                        "conditional_rule": None,
+                        "claimed_role": reaction.get("claimed_role"),
+                        "priority": reaction.get("priority", 99),
+                        "reasoning": f"Expanded from conditional rule: {conditional_rule}",
+                    }
                     expanded_reactions.append(specific_reaction)
             else:
                 expanded_reactions.append(reaction)
@@ -19,11 +19,41 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
-from app.constants import EventType, MessageTargetType, SocialMediaPlatform
+from app.constants import EVENT_TYPE_BY_VALUE, EventType, MessageTargetType, SocialMediaPlatform
 from app.extensions import agent_registry, lang_graph_app
+from app.utils.async_runner import run_sync
 
 logger = logging.getLogger(__name__)
 
+# Events whose handlers neither read nor write conversation history; these
+# run on the router without a checkpointer
+_STATELESS_EVENT_TYPES = frozenset({
+    EventType.GAME_STATE_UPDATE.value,
+    EventType.PROFILE_SYNC.value,
+})
+
+
+def _router_for(event_type: str):
+    """Pick the checkpointed or stateless event router for an event type."""
+    if event_type in _STATELESS_EVENT_TYPES:
+        return lang_graph_app.stateless_event_router_wf
+    return lang_graph_app.event_router_wf
+
+
+def _arun_event(initial_state: dict):
+    """
+    Return the router coroutine for an event.
+    
+    Known event types go to the router's specialized single-handler graph;
+    unknown ones take the full graph so classification reports the error.
+    """
+    event_type = initial_state["event_type"]
+    router = _router_for(event_type)
+    known_type = EVENT_TYPE_BY_VALUE.get(event_type)
+    if known_type is None:
+        return router.arun(initial_state)
+    return router.arun_known_type(known_type, initial_state)
+
 
 class CoupEventService:
     """
@@ -89,9 +119,9 @@ class CoupEventService:
         
         logger.debug(f"[CHAT-FLOW] Workflow initial_state: {initial_state}")
         
-        # Run through EventRouterWorkflow
+        # Run through EventRouterWorkflow (arun on the shared background loop)
         try:
-            result = lang_graph_app.event_router_wf.run(initial_state)
+            result = run_sync(_arun_event(initial_state))
             
             # Log workflow result
             handler_responses = result.get("handler_responses", [])
@@ -160,7 +190,7 @@ class CoupEventService:
             "broadcast_to_all_agents": event.get("broadcast_to_all_agents", False),
         }
         
-        return lang_graph_app.event_router_wf.arun(initial_state)
+        return _arun_event(initial_state)
     
     # =============================================
     # Conversation History Access
@@ -18,6 +18,16 @@ from app.constants import MESSAGE_LIMITS, MessageTargetType
 from app.models.graph_state_models.hourly_coup_state import HourlyCoupAgentState
 
 
+# State key holding the hourly counter for each target type
+_COUNTER_KEYS = {
+    MessageTargetType.LLM_ONLY: "llm_messages_sent",
+    MessageTargetType.HUMAN_ONLY: "human_messages_sent",
+    MessageTargetType.MIXED: "mixed_messages_sent",
+}
+_counter_key = _COUNTER_KEYS.get
+_limit_for = MESSAGE_LIMITS.get
+
+
 class MessageCounterService:
     """
     Service to track and enforce message limits for LLM agents.
@@ -29,25 +39,21 @@ class MessageCounterService:
     @staticmethod
     def get_limit(target_type: MessageTargetType) -> int:
         """Get the message limit for a target type."""
-        return MESSAGE_LIMITS.get(target_type, 0)
+        return _limit_for(target_type, 0)
     
     @staticmethod
     def get_current_count(state: HourlyCoupAgentState, target_type: MessageTargetType) -> int:
         """Get the current message count for a target type."""
-        if target_type == MessageTargetType.LLM_ONLY:
-            return state.get("llm_messages_sent", 0)
-        elif target_type == MessageTargetType.HUMAN_ONLY:
-            return state.get("human_messages_sent", 0)
-        elif target_type == MessageTargetType.MIXED:
-            return state.get("mixed_messages_sent", 0)
-        return 0
+        key = _counter_key(target_type)
+        return state.get(key, 0) if key is not None else 0
     
     @staticmethod
     def get_remaining(state: HourlyCoupAgentState, target_type: MessageTargetType) -> int:
         """Get remaining messages allowed for a target type."""
-        limit = MessageCounterService.get_limit(target_type)
-        current = MessageCounterService.get_current_count(state, target_type)
-        return max(0, limit - current)
+        key = _counter_key(target_type)
+        if key is None:
+            return 0
+        return max(0, _limit_for(target_type, 0) - state.get(key, 0))
     
     @staticmethod
     def can_send_message(state: HourlyCoupAgentState, target_type: MessageTargetType) -> bool:
@@ -61,7 +67,8 @@ class MessageCounterService:
         Returns:
             True if agent has remaining quota for this target type
         """
-        return MessageCounterService.get_remaining(state, target_type) > 0
+        key = _counter_key(target_type)
+        return key is not None and state.get(key, 0) < _limit_for(target_type, 0)
     
     @staticmethod
     def increment_count(
@@ -79,16 +86,15 @@ class MessageCounterService:
             Tuple of (updated_state, success)
             success is False if limit was already reached
         """
-        if not MessageCounterService.can_send_message(state, target_type):
+        key = _counter_key(target_type)
+        if key is None:
             return state, False
         
-        if target_type == MessageTargetType.LLM_ONLY:
-            state["llm_messages_sent"] = state.get("llm_messages_sent", 0) + 1
-        elif target_type == MessageTargetType.HUMAN_ONLY:
-            state["human_messages_sent"] = state.get("human_messages_sent", 0) + 1
-        elif target_type == MessageTargetType.MIXED:
-            state["mixed_messages_sent"] = state.get("mixed_messages_sent", 0) + 1
-            
+        current = state.get(key, 0)
+        if current >= _limit_for(target_type, 0):
+            return state, False
+        
+        state[key] = current + 1
         return state, True
     
     @staticmethod
@@ -20,6 +20,9 @@ Architecture:
 
 from typing import Dict, List, Optional, Tuple
 
+from sqlalchemy import func, lambda_stmt, select
+from sqlalchemy.orm import selectinload
+
 from app.extensions import db_connection
 from app.database.models import (
     UserAccount,
@@ -31,6 +34,25 @@ from app.models.graph_state_models.hourly_coup_state import VisiblePendingAction
 from app.constants import CoupAction
 
 
+# =============================================
+# Prebuilt statements
+# =============================================
+# Built once at import so every call reuses the same statement objects and
+# hits SQLAlchemy's compiled-SQL cache instead of rebuilding the query.
+_SELECT_ACTIVE_USER_STATES = select(UserAccount, PlayerGameState).join(
+    PlayerGameState, UserAccount.user_id == PlayerGameState.user_id
+).where(
+    PlayerGameState.session_id.isnot(None)
+)
+_SELECT_ALIVE_USER_STATES = _SELECT_ACTIVE_USER_STATES.where(
+    PlayerGameState.player_statuses.any('alive')
+)
+# Upgrades are read only for visible pending actions, so only this select loads them
+_SELECT_PENDING_USER_STATES = _SELECT_ACTIVE_USER_STATES.where(
+    func.cardinality(PlayerGameState.to_be_initiated) > 0
+).options(selectinload(PlayerGameState.upgrade))
+
+
 class PendingEventsDBService:
     """
     Service for querying pending game events from PostgreSQL.
@@ -56,34 +78,26 @@ class PendingEventsDBService:
     def get_all_game_states() -> List[Tuple[UserAccount, PlayerGameState]]:
         """Get all active game states with their user accounts."""
         with db_connection.get_session() as session:
-            return session.query(UserAccount, PlayerGameState).join(
-                PlayerGameState, UserAccount.user_id == PlayerGameState.user_id
-            ).filter(
-                PlayerGameState.session_id.isnot(None)
-            ).all()
+            return session.execute(_SELECT_ACTIVE_USER_STATES).all()
     
     @staticmethod
     def get_alive_players() -> List[Tuple[UserAccount, PlayerGameState]]:
         """Get all alive players with their user accounts."""
         with db_connection.get_session() as session:
-            return session.query(UserAccount, PlayerGameState).join(
-                PlayerGameState, UserAccount.user_id == PlayerGameState.user_id
-            ).filter(
-                PlayerGameState.player_statuses.any('alive'),
-                PlayerGameState.session_id.isnot(None)
-            ).all()
+            return session.execute(_SELECT_ALIVE_USER_STATES).all()
     
     @staticmethod
     def get_player(display_name: str) -> Optional[Tuple[UserAccount, PlayerGameState]]:
         """Get a specific player by display name (returns user and game state)."""
         with db_connection.get_session() as session:
-            result = session.query(UserAccount, PlayerGameState).join(
+            # lambda_stmt caches the compiled SQL; display_name becomes a bound parameter
+            stmt = lambda_stmt(lambda: select(UserAccount, PlayerGameState).join(
                 PlayerGameState, UserAccount.user_id == PlayerGameState.user_id
-            ).filter(
+            ).where(
                 UserAccount.display_name == display_name,
                 PlayerGameState.session_id.isnot(None)
-            ).first()
-            return result
+            ))
+            return session.execute(stmt).first()
     
     @staticmethod
     def get_game_state_by_display_name(display_name: str) -> Optional[PlayerGameState]:
@@ -97,12 +111,7 @@ class PendingEventsDBService:
     def get_players_with_pending_actions() -> List[Tuple[UserAccount, PlayerGameState]]:
         """Get all players who have pending actions."""
         with db_connection.get_session() as session:
-            results = session.query(UserAccount, PlayerGameState).join(
-                PlayerGameState, UserAccount.user_id == PlayerGameState.user_id
-            ).filter(
-                PlayerGameState.to_be_initiated.isnot(None),
-                PlayerGameState.session_id.isnot(None)
-            ).all()
+            results = session.execute(_SELECT_PENDING_USER_STATES).all()
             
             return [(u, gs) for u, gs in results if gs.has_pending_action]
     
@@ -110,16 +119,10 @@ class PendingEventsDBService:
     def get_upgrade_details_by_game_state_id(game_state_id) -> Optional[UpgradeDetails]:
         """Get upgrade details for a player's pending action by game state ID."""
         with db_connection.get_session() as session:
-            return session.query(UpgradeDetails).filter_by(
-                game_state_id=game_state_id
-            ).first()
-    
-    @staticmethod
-    def get_all_upgrade_details() -> Dict[str, UpgradeDetails]:
-        """Get all upgrade details, keyed by game_state_id string."""
-        with db_connection.get_session() as session:
-            upgrades = session.query(UpgradeDetails).all()
-            return {str(u.game_state_id): u for u in upgrades}
+            stmt = lambda_stmt(lambda: select(UpgradeDetails).where(
+                UpgradeDetails.game_state_id == game_state_id
+            ))
+            return session.execute(stmt).scalars().first()
     
     @staticmethod
     def get_visible_pending_actions(exclude_player: Optional[str] = None) -> List[VisiblePendingAction]:
@@ -132,8 +135,8 @@ class PendingEventsDBService:
         - Target
         - Whether it's upgraded (but NOT what the upgrade is)
         """
+        # Upgrades arrive with each game state (selectinload on the pending select)
         player_data = PendingEventsDBService.get_players_with_pending_actions()
-        upgrades = PendingEventsDBService.get_all_upgrade_details()
         
         visible_actions = []
         
@@ -149,15 +152,16 @@ class PendingEventsDBService:
             if not coup_action:
                 continue
             
-            upgrade = upgrades.get(str(game_state.id))
+            upgrade = game_state.upgrade
             is_upgraded = upgrade.has_any_upgrade if upgrade else False
             
-            visible_actions.append(VisiblePendingAction(
-                player_id=user.display_name,
-                action=coup_action,
-                target=game_state.target_display_name,
-                is_upgraded=is_upgraded,
-            ))
+            visible_action: VisiblePendingAction = {
+                "player_id": user.display_name,
+                "action": coup_action,
+                "target": game_state.target_display_name,
+                "is_upgraded": is_upgraded,
+            }
+            visible_actions.append(visible_action)
         
         return visible_actions
     
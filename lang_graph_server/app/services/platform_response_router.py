@@ -110,13 +110,20 @@ class PlatformResponseRouter:
         """Format @mentions for the target platform."""
         formatted_mentions = []
         
+        # Platforms whose mention syntax is plain "@name" need no rewrite
+        rewrite = config.mention_prefix != "@" or config.mention_suffix != ""
+        
         for mention in mentions:
             plain_mention = f"@{mention}"
-            platform_mention = f"{config.mention_prefix}{mention}{config.mention_suffix}"
+            if plain_mention not in content:
+                continue
             
-            if plain_mention in content:
-                content = content.replace(plain_mention, platform_mention)
-                formatted_mentions.append(mention)
+            if rewrite:
+                content = content.replace(
+                    plain_mention,
+                    f"{config.mention_prefix}{mention}{config.mention_suffix}",
+                )
+            formatted_mentions.append(mention)
         
         return content, formatted_mentions
     
@@ -142,7 +149,7 @@ class PlatformResponseRouter:
     
     def _truncate(self, content: str, config: PlatformConfig) -> str:
         """Truncate content to fit platform limits."""
-        max_length = config.max_chars - len(config.truncation_suffix)
+        max_length = config.effective_max_chars
         
         if len(content) <= config.max_chars:
             return content
@@ -0,0 +1,78 @@
+"""
+Background event loop for sync callers of async workflows.
+
+Flask handlers and sync graph nodes can't await. Instead of each call
+spinning up its own loop with asyncio.run (and orphaning the shared async
+HTTP pool on a closed loop), every sync call is scheduled onto one
+long-lived loop running in a daemon thread. Concurrent callers then share
+that loop and their LLM I/O overlaps.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Coroutine, Iterable, List, Optional
+
+
+# Default cap on concurrent workflow runs in one batch (bounds LLM fan-out)
+DEFAULT_MAX_CONCURRENCY = 8
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide background loop, starting it on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="async-runner",
+                daemon=True,
+            ).start()
+            _loop = loop
+    return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine on the background loop and block until it finishes.
+    
+    Raises:
+        RuntimeError: If called from the background loop itself (that would
+                      deadlock; await the coroutine instead).
+    """
+    loop = get_background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_sync() called from the background loop; await the coroutine instead")
+    
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+async def gather_bounded(
+    aws: Iterable[Awaitable[Any]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    asyncio.gather with at most max_concurrency awaitables in flight.
+    
+    Results come back in input order, as with gather.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _bounded(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+    
+    return await asyncio.gather(
+        *(_bounded(aw) for aw in aws),
+        return_exceptions=return_exceptions,
+    )
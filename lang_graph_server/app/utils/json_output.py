@@ -0,0 +1,56 @@
+"""
+JSON output for the REST API.
+
+Flask-RESTX renders every response through the stdlib json module
+(flask_restx.representations.output_json). When orjson is installed, the
+application/json representation is swapped for output_json below, which
+encodes in C.
+
+The output is not byte-identical to Flask-RESTX's. Responses are compact
+(orjson has no 4-space indent), and orjson also encodes values the stdlib
+encoder rejects: datetimes and dataclasses (e.g. FormattedResponse) are
+serialized instead of raising TypeError. Enum members and enum-keyed dicts
+(message counter stats) are written with their values, as before.
+
+Whenever Flask-RESTX's own formatting is asked for - app.debug (indented
+output) or a RESTX_JSON config (custom json.dumps settings) - the response
+goes through the stock encoder instead.
+
+orjson is optional. Without it, register_json_representation() leaves the
+Flask-RESTX default in place.
+"""
+
+from flask import current_app, make_response
+from flask_restx.representations import output_json as restx_output_json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Trailing newline as Flask-RESTX writes it; non-str (enum) keys coerced
+_ORJSON_OPTIONS = (orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+def output_json(data, code, headers=None):
+    """Make a Flask response with an orjson-encoded JSON body."""
+    # orjson only indents by 2 and takes no json.dumps settings
+    if current_app.debug or current_app.config.get("RESTX_JSON"):
+        return restx_output_json(data, code, headers)
+
+    resp = make_response(orjson.dumps(data, option=_ORJSON_OPTIONS), code)
+    resp.headers.extend(headers or {})
+    return resp
+
+
+def register_json_representation(api) -> bool:
+    """
+    Use output_json for application/json responses on a Flask-RESTX Api.
+
+    Returns False (and changes nothing) when orjson is not installed.
+    """
+    if orjson is None:
+        return False
+    api.representations["application/json"] = output_json
+    return True
@@ -0,0 +1,102 @@
+"""
+Tests for app.utils.async_runner (run_sync and gather_bounded).
+"""
+
+import asyncio
+
+import pytest
+
+from app.utils.async_runner import gather_bounded, get_background_loop, run_sync
+
+
+async def _value(value):
+    await asyncio.sleep(0)
+    return value
+
+
+async def _fail(message):
+    await asyncio.sleep(0)
+    raise ValueError(message)
+
+
+class TestRunSync:
+    """run_sync schedules a coroutine on the background loop and blocks on it."""
+
+    def test_returns_result(self):
+        assert run_sync(_value({"answer": 42})) == {"answer": 42}
+
+    def test_runs_on_background_loop(self):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        assert run_sync(current_loop()) is get_background_loop()
+
+    def test_propagates_exception(self):
+        with pytest.raises(ValueError, match="boom"):
+            run_sync(_fail("boom"))
+
+    def test_raises_when_called_from_background_loop(self):
+        async def nested():
+            inner = _value(1)
+            try:
+                run_sync(inner)
+            except RuntimeError as e:
+                return e
+            return None
+
+        error = run_sync(nested())
+        assert isinstance(error, RuntimeError)
+        assert "background loop" in str(error)
+
+
+class TestGatherBounded:
+    """gather_bounded caps in-flight awaitables and keeps input order."""
+
+    def test_results_in_input_order(self):
+        async def delayed(value, delay):
+            await asyncio.sleep(delay)
+            return value
+
+        # Later inputs finish first
+        delays = [0.05, 0.04, 0.03, 0.02, 0.01, 0.0]
+        results = asyncio.run(gather_bounded(
+            (delayed(i, d) for i, d in enumerate(delays)),
+            max_concurrency=3,
+        ))
+        assert results == list(range(len(delays)))
+
+    @pytest.mark.parametrize("max_concurrency", [1, 2, 4])
+    def test_at_most_max_concurrency_in_flight(self, max_concurrency):
+        in_flight = 0
+        peak = 0
+
+        async def tracked(value):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return value
+
+        results = asyncio.run(gather_bounded(
+            (tracked(i) for i in range(10)),
+            max_concurrency=max_concurrency,
+        ))
+        assert results == list(range(10))
+        assert peak == max_concurrency
+
+    def test_propagates_exception(self):
+        with pytest.raises(ValueError, match="bad"):
+            asyncio.run(gather_bounded([_value(1), _fail("bad")]))
+
+    def test_return_exceptions(self):
+        results = asyncio.run(gather_bounded(
+            [_value(1), _fail("bad"), _value(3)],
+            return_exceptions=True,
+        ))
+        assert results[0] == 1
+        assert isinstance(results[1], ValueError)
+        assert results[2] == 3
+
+    def test_empty(self):
+        assert asyncio.run(gather_bounded([])) == []
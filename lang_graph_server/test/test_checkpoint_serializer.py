@@ -0,0 +1,146 @@
+"""
+Tests for app.services.checkpoint_serializer.MsgspecCheckpointSerializer.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from pydantic import BaseModel
+
+msgspec = pytest.importorskip("msgspec")
+
+from app.constants import EventType, SocialMediaPlatform
+from app.services.checkpoint_serializer import (
+    LEGACY_MSGSPEC_TYPE,
+    MSGPACK_TYPE,
+    MsgspecCheckpointSerializer,
+    get_checkpoint_serde,
+)
+
+
+class _Profile(BaseModel):
+    name: str
+    coins: int
+
+
+@pytest.fixture
+def serde():
+    return MsgspecCheckpointSerializer()
+
+
+@pytest.fixture
+def stock_serde():
+    """LangGraph's default serde, as used by a process without msgspec."""
+    return JsonPlusSerializer()
+
+
+_PLAIN_VALUES = [
+    None,
+    True,
+    7,
+    2.5,
+    "game-1:agent-1",
+    [],
+    {},
+    [1, "two", None, [3.0]],
+    {"game_id": "game-1", "coins": 2, "hand": ["duke", "captain"], "meta": {"alive": True}},
+    [{"role": "user", "content": "hi", "timestamp": None}],
+]
+
+
+class TestPlainValues:
+    """Exact JSON builtins are encoded with msgspec under the msgpack tag."""
+
+    @pytest.mark.parametrize("value", _PLAIN_VALUES)
+    def test_msgspec_round_trip(self, serde, value):
+        type_, payload = serde.dumps_typed(value)
+        assert type_ == MSGPACK_TYPE
+        assert payload == msgspec.msgpack.encode(value)
+
+        loaded = serde.loads_typed((type_, payload))
+        assert loaded == value
+        assert type(loaded) is type(value)
+
+    @pytest.mark.parametrize("value", _PLAIN_VALUES)
+    def test_readable_by_stock_serde(self, serde, stock_serde, value):
+        loaded = stock_serde.loads_typed(serde.dumps_typed(value))
+        assert loaded == value
+        assert type(loaded) is type(value)
+
+    def test_loads_legacy_msgspec_tag(self, serde):
+        value = {"game_id": "game-1", "messages": [{"role": "user"}]}
+        loaded = serde.loads_typed((LEGACY_MSGSPEC_TYPE, msgspec.msgpack.encode(value)))
+        assert loaded == value
+
+
+class TestFallbackValues:
+    """Anything that is not a plain builtin goes through JsonPlus and keeps its type."""
+
+    @pytest.mark.parametrize("value", [
+        EventType.CHAT_MESSAGE,
+        SocialMediaPlatform.DISCORD,
+        datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc),
+        _Profile(name="agent-1", coins=3),
+    ], ids=["event_type", "platform", "datetime", "pydantic"])
+    def test_fallback_round_trip(self, serde, stock_serde, value):
+        dumped = serde.dumps_typed(value)
+        assert dumped == stock_serde.dumps_typed(value)
+
+        for reader in (serde, stock_serde):
+            loaded = reader.loads_typed(dumped)
+            assert loaded == value
+            assert type(loaded) is type(value)
+
+    def test_nested_enum_falls_back(self, serde):
+        value = {"event_type": EventType.BROADCAST_RESULTS, "count": 1}
+        dumped = serde.dumps_typed(value)
+        assert dumped == JsonPlusSerializer().dumps_typed(value)
+        loaded = serde.loads_typed(dumped)
+        assert loaded == value
+        assert type(loaded["event_type"]) is EventType
+
+    def test_str_key_subclass_falls_back(self, serde):
+        value = {SocialMediaPlatform.SLACK: 3}
+        dumped = serde.dumps_typed(value)
+        assert dumped == JsonPlusSerializer().dumps_typed(value)
+        assert serde.loads_typed(dumped) == value
+
+
+def test_get_checkpoint_serde():
+    assert isinstance(get_checkpoint_serde(), MsgspecCheckpointSerializer)
+
+
+def test_checkpoint_readable_without_msgspec():
+    """A checkpoint saved with the msgspec serde loads through a stock saver."""
+    from langgraph.checkpoint.memory import MemorySaver
+    from langgraph.graph import END, StateGraph
+    from typing_extensions import TypedDict
+
+    class _State(TypedDict, total=False):
+        game_id: str
+        conversation_messages: list
+        event_type: EventType
+
+    def node(state):
+        return {
+            "conversation_messages": [{"role": "assistant", "content": "hi"}],
+            "event_type": EventType.CHAT_MESSAGE,
+        }
+
+    builder = StateGraph(_State)
+    builder.add_node("node", node)
+    builder.set_entry_point("node")
+    builder.add_edge("node", END)
+
+    writer = MemorySaver(serde=MsgspecCheckpointSerializer())
+    config = {"configurable": {"thread_id": "game-1:agent-1"}}
+    builder.compile(checkpointer=writer).invoke({"game_id": "game-1"}, config)
+
+    reader = MemorySaver()
+    reader.storage, reader.blobs, reader.writes = writer.storage, writer.blobs, writer.writes
+    values = reader.get_tuple(config).checkpoint["channel_values"]
+
+    assert values["game_id"] == "game-1"
+    assert values["conversation_messages"] == [{"role": "assistant", "content": "hi"}]
+    assert values["event_type"] is EventType.CHAT_MESSAGE
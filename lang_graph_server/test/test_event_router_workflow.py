@@ -0,0 +1,202 @@
+"""
+Tests for EventRouterWorkflow routing.
+
+Handlers are stubbed; classify, resolve agents and finalize are the real
+nodes, with the agent registry replaced by a fixed one-game registry.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.constants import EventType
+from app.graphs.workflows import event_router_workflow
+from app.graphs.workflows.event_router_workflow import (
+    EventRouterNode,
+    EventRouterWorkflow,
+)
+from app.nodes.coup_agent import event_classifier_nodes
+
+
+GAME_ID = "game-1"
+AGENT_IDS = ["agent-1", "agent-2"]
+
+# Handlers the router awaits (the rest are plain sync nodes)
+_ASYNC_HANDLERS = {
+    "handle_chat_message_node",
+    "handle_broadcast_results_node",
+    "handle_reaction_required_node",
+}
+
+
+class _FakeRegistry:
+    """Agent registry holding AGENT_IDS in GAME_ID."""
+
+    def get_agent(self, game_id, agent_id):
+        if game_id == GAME_ID and agent_id in AGENT_IDS:
+            return SimpleNamespace(agent_id=agent_id)
+        return None
+
+    def get_agent_ids_in_game(self, game_id):
+        return list(AGENT_IDS) if game_id == GAME_ID else []
+
+    def get_stats(self):
+        return {}
+
+
+def _stub_handler(name, calls):
+    """Handler stub that records its call and answers once per agent."""
+    def update(state):
+        calls.append(name)
+        return {
+            "handler_responses": [
+                {"agent_id": agent_id, "success": True, "action": name}
+                for agent_id in state["agent_ids_to_process"]
+            ],
+            "events_processed_this_hour": state.get("events_processed_this_hour", 0) + 1,
+        }
+
+    if name in _ASYNC_HANDLERS:
+        async def handler(state):
+            await asyncio.sleep(0)
+            return update(state)
+    else:
+        def handler(state):
+            return update(state)
+    return handler
+
+
+@pytest.fixture
+def handler_calls(monkeypatch):
+    """Stub every handler node and the agent registry; yields the handler call log."""
+    calls = []
+    real = event_router_workflow._event_impls()
+    impls = SimpleNamespace(**{
+        name: (_stub_handler(name, calls) if name.startswith("handle_") else impl)
+        for name, impl in vars(real).items()
+    })
+    monkeypatch.setattr(event_router_workflow, "_event_impls", lambda: impls)
+    monkeypatch.setattr(event_classifier_nodes, "agent_registry", _FakeRegistry())
+    return calls
+
+
+@pytest.fixture
+def workflow():
+    return EventRouterWorkflow(checkpointer=False)
+
+
+def _event(event_type, **overrides):
+    """Fresh initial state (runs fill defaults in place)."""
+    state = {
+        "event_type": event_type.value if isinstance(event_type, EventType) else event_type,
+        "game_id": GAME_ID,
+        "source_platform": "defualt",
+        "sender_id": "player-1",
+        "timestamp": "2026-01-01T00:00:00",
+        "payload": {},
+    }
+    state.update(overrides)
+    return state
+
+
+def _nodes_run(workflow, state):
+    """Names of the nodes a full-graph run executes, in order."""
+    async def collect():
+        return [
+            node
+            async for chunk in workflow.app.astream(state, stream_mode="updates")
+            for node in chunk
+        ]
+    return asyncio.run(collect())
+
+
+class TestKnownTypeParity:
+    """arun_known_type() ends in the same state as arun() for every event type."""
+
+    @pytest.mark.parametrize("event_type", list(EventType), ids=lambda t: t.value)
+    def test_same_final_state(self, workflow, handler_calls, event_type):
+        full = asyncio.run(workflow.arun(_event(event_type)))
+        full_calls = list(handler_calls)
+        handler_calls.clear()
+
+        known = asyncio.run(workflow.arun_known_type(event_type, _event(event_type)))
+
+        assert known == full
+        assert handler_calls == full_calls
+        assert len(full_calls) == 1
+        assert full["processing_complete"] is True
+        assert full["final_response"]["success"] is True
+        assert full["final_response"]["event_type"] == event_type.value
+
+    @pytest.mark.parametrize("event_type", list(EventType), ids=lambda t: t.value)
+    def test_same_final_state_single_agent(self, workflow, handler_calls, event_type):
+        overrides = {"target_agent_id": AGENT_IDS[1]}
+        full = asyncio.run(workflow.arun(_event(event_type, **overrides)))
+        known = asyncio.run(workflow.arun_known_type(event_type, _event(event_type, **overrides)))
+
+        assert known == full
+        assert full["final_response"]["agent_id"] == AGENT_IDS[1]
+
+    def test_same_final_state_on_resolve_error(self, workflow, handler_calls):
+        event_type = EventType.CHAT_MESSAGE
+        overrides = {"game_id": "no-such-game"}
+        full = asyncio.run(workflow.arun(_event(event_type, **overrides)))
+        known = asyncio.run(workflow.arun_known_type(event_type, _event(event_type, **overrides)))
+
+        assert known == full
+        assert full["error"]
+        assert handler_calls == []
+
+
+class TestClassifyErrorShortCircuit:
+    """Classify/resolve errors are finalized inside CLASSIFY and route straight to END."""
+
+    def test_unknown_event_type(self, workflow, handler_calls):
+        state = _event("not_an_event")
+        assert _nodes_run(workflow, state) == [EventRouterNode.CLASSIFY]
+
+        final = asyncio.run(workflow.arun(_event("not_an_event")))
+        assert final["error"] == "Unknown event type: not_an_event"
+        assert final["processing_complete"] is True
+        assert final["final_response"]["success"] is True
+        assert final["final_response"]["event_type"] is None
+        assert handler_calls == []
+
+    def test_no_agents_in_game(self, workflow, handler_calls):
+        state = _event(EventType.CHAT_MESSAGE, game_id="no-such-game")
+        assert _nodes_run(workflow, state) == [EventRouterNode.CLASSIFY]
+
+        final = asyncio.run(workflow.arun(_event(EventType.CHAT_MESSAGE, game_id="no-such-game")))
+        assert final["error"] == "No agents found for game no-such-game"
+        assert final["agent_ids_to_process"] == []
+        assert final["final_response"]["event_type"] == EventType.CHAT_MESSAGE.value
+        assert handler_calls == []
+
+    def test_unknown_target_agent(self, workflow, handler_calls):
+        overrides = {"target_agent_id": "agent-404"}
+        state = _event(EventType.PROFILE_SYNC, **overrides)
+        assert _nodes_run(workflow, state) == [EventRouterNode.CLASSIFY]
+
+        final = asyncio.run(workflow.arun(_event(EventType.PROFILE_SYNC, **overrides)))
+        assert final["error"] == f"Agent agent-404 not found in game {GAME_ID}"
+        assert final["processing_complete"] is True
+        assert handler_calls == []
+
+    def test_success_runs_handler_then_finalize(self, workflow, handler_calls):
+        state = _event(EventType.PROFILE_SYNC)
+        assert _nodes_run(workflow, state) == [
+            EventRouterNode.CLASSIFY,
+            EventRouterNode.HANDLE_PROFILE_SYNC,
+            EventRouterNode.FINALIZE,
+        ]
+
+
+def test_classification_is_a_fresh_copy():
+    """Editing one run's classification leaves the next run's untouched."""
+    first = event_classifier_nodes.classify_event_node(_event(EventType.CHAT_MESSAGE))
+    first["classification"]["handler_name"] = "mutated"
+
+    second = event_classifier_nodes.classify_event_node(_event(EventType.CHAT_MESSAGE))
+    assert second["classification"]["handler_name"] == "handle_chat_message"
+    assert second["classification"] is not first["classification"]
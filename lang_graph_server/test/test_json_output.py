@@ -0,0 +1,54 @@
+"""
+Tests for app.utils.json_output (orjson REST representation).
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask
+
+orjson = pytest.importorskip("orjson")
+
+from app.constants import MessageTargetType
+from app.utils.json_output import output_json
+
+
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+
+def _body(app, data, **config):
+    app.config.update(config)
+    with app.app_context():
+        resp = output_json(data, 200, {"X-Test": "1"})
+    assert resp.status_code == 200
+    assert resp.headers["X-Test"] == "1"
+    return resp.get_data(as_text=True)
+
+
+def test_enum_keyed_counts_use_values(app):
+    counts = {MessageTargetType.LLM_ONLY: 3, MessageTargetType.HUMAN_ONLY: 0}
+    body = _body(app, {"message_counts": counts})
+
+    assert body.endswith("\n")
+    assert json.loads(body) == {"message_counts": {"llm_only": 3, "human_only": 0}}
+
+
+def test_datetime_encodes(app):
+    body = _body(app, {"at": datetime(2026, 1, 1, tzinfo=timezone.utc)})
+    assert json.loads(body) == {"at": "2026-01-01T00:00:00+00:00"}
+
+
+def test_debug_uses_restx_indent(app):
+    app.debug = True
+    data = {"target": MessageTargetType.MIXED, "count": 1}
+    body = _body(app, data)
+    assert body == json.dumps(data, indent=4) + "\n"
+
+
+def test_restx_json_config_uses_stock_encoder(app):
+    data = {"b": 1, "a": 2}
+    body = _body(app, data, RESTX_JSON={"sort_keys": True})
+    assert body == json.dumps(data, sort_keys=True) + "\n"
@@ -0,0 +1,40 @@
+"""
+Tests for app.graphs.workflows.node_cache.
+"""
+
+import logging
+
+from langgraph.graph import END, StateGraph
+from typing_extensions import TypedDict
+
+from app.constants import CoupAction
+from app.graphs.workflows.node_cache import create_node_cache, state_slice_cache_policy
+
+
+class _State(TypedDict, total=False):
+    content: str
+    message_analysis: dict
+
+
+def test_cached_enum_replays_without_warning(caplog):
+    """A cached write holding a CoupAction comes back as the member, unlogged."""
+    calls = []
+
+    def analyze(state):
+        calls.append(state["content"])
+        return {"message_analysis": {"mentions_action": CoupAction.TAX}}
+
+    builder = StateGraph(_State)
+    builder.add_node("analyze", analyze, cache_policy=state_slice_cache_policy(["content"]))
+    builder.set_entry_point("analyze")
+    builder.add_edge("analyze", END)
+    app = builder.compile(cache=create_node_cache())
+
+    with caplog.at_level(logging.WARNING):
+        first = app.invoke({"content": "I'll take tax"})
+        second = app.invoke({"content": "I'll take tax"})
+
+    assert calls == ["I'll take tax"]
+    assert second == first
+    assert second["message_analysis"]["mentions_action"] is CoupAction.TAX
+    assert not [r for r in caplog.records if "unregistered" in r.getMessage()]
@@ -0,0 +1,26 @@
+"""
+Tests for app.graphs.workflows.run_config.
+"""
+
+import pytest
+
+from app.graphs.workflows.run_config import thread_config, thread_id_for
+
+
+@pytest.mark.parametrize("args, expected", [
+    (("game-1", "agent-1"), "game-1:agent-1"),
+    (("game-1",), "game-1:broadcast"),
+    (("game-1", None), "game-1:broadcast"),
+    (("game-1", ""), "game-1:broadcast"),
+    (("game-1", "agent-1", "broadcast"), "game-1:agent-1:broadcast"),
+    (("game-1", "agent-1", "chat"), "game-1:agent-1:chat"),
+    (("game-1", None, "broadcast"), "game-1:broadcast"),
+])
+def test_thread_id_formats(args, expected):
+    assert thread_id_for(*args) == expected
+
+
+def test_thread_config_shared_per_thread():
+    config = thread_config("game-1:agent-1")
+    assert config == {"configurable": {"thread_id": "game-1:agent-1"}}
+    assert thread_config("game-1:agent-1") is config